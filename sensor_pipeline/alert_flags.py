@@ -0,0 +1,183 @@
+"""Alert columns bit-packed into a single integer column."""
+
+import numpy as np
+import pandas as pd
+
+
+# Column holding the packed alerts
+FLAGS_COLUMN = "alert_flags"
+
+# DataFrame.attrs key holding the alert column stored in each bit
+FLAGS_ATTR = "alert_flag_bits"
+
+# Alerts whose absence makes a reading healthy (see DetectAnomalies)
+HEALTH_ALERTS = ("temperature_alert", "humidity_alert", "status_alert")
+
+# Narrowest unsigned dtypes, by the number of alerts they hold
+_FLAG_DTYPES = (np.uint8, np.uint16, np.uint32, np.uint64)
+
+
+def flag_dtype(n_alerts: int) -> type[np.unsignedinteger]:
+    """Narrowest unsigned integer dtype with a bit per alert.
+
+    Args:
+        n_alerts: Number of alert columns
+
+    Returns:
+        uint8, uint16, uint32 or uint64
+
+    Raises:
+        ValueError: If there are more than 64 alerts
+    """
+    for dtype in _FLAG_DTYPES:
+        if n_alerts <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError(f"Cannot pack {n_alerts} alerts into 64 bits")
+
+
+def pack_alerts(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Replace boolean alert columns and is_healthy with one bitmask column.
+
+    The health alerts take the lowest bits, then the other columns in
+    order; the layout is kept in df.attrs, which follows the rows through
+    copies and filters. is_healthy is dropped as well, since it is implied
+    by the health alerts (see is_healthy()).
+
+    Args:
+        df: DataFrame with the boolean alert columns
+        columns: Alert columns to pack, at most 64
+
+    Returns:
+        DataFrame with 'alert_flags' instead of the packed columns
+
+    Raises:
+        ValueError: If there are more than 64 columns
+    """
+    columns = [c for c in HEALTH_ALERTS if c in columns] + [
+        c for c in columns if c not in HEALTH_ALERTS
+    ]
+    dtype = flag_dtype(len(columns))
+    flags = np.zeros(len(df), dtype=dtype)
+    for bit, column in enumerate(columns):
+        values = df[column].to_numpy(dtype=bool).astype(dtype)
+        np.left_shift(values, dtype(bit), out=values)
+        np.bitwise_or(flags, values, out=flags)
+
+    packed = df.drop(columns=[*columns, "is_healthy"], errors="ignore")
+    packed[FLAGS_COLUMN] = flags
+    packed.attrs[FLAGS_ATTR] = list(columns)
+    return packed
+
+
+def flag_bits(df: pd.DataFrame) -> list[str]:
+    """Alert column stored in each bit of 'alert_flags' (empty if unpacked)."""
+    if FLAGS_COLUMN not in df.columns:
+        return []
+    return list(df.attrs.get(FLAGS_ATTR, []))
+
+
+def alert(df: pd.DataFrame, column: str) -> pd.Series:
+    """Read an alert column, packed or not.
+
+    Args:
+        df: DataFrame with the alert as a column or a bit of 'alert_flags'
+        column: Alert column name, e.g. 'temperature_alert'
+
+    Returns:
+        Boolean Series with the frame's index
+
+    Raises:
+        KeyError: If the alert is neither a column nor a packed bit
+    """
+    if column in df.columns:
+        return df[column]
+    bits = flag_bits(df)
+    if column not in bits:
+        raise KeyError(column)
+    flags = df[FLAGS_COLUMN].to_numpy()
+    mask = (flags >> flags.dtype.type(bits.index(column))) & 1
+    return pd.Series(mask.astype(bool), index=df.index, name=column)
+
+
+def is_healthy(df: pd.DataFrame) -> pd.Series:
+    """Read is_healthy, packed or not: True when no health alert is set.
+
+    Args:
+        df: DataFrame with 'is_healthy' or packed 'alert_flags'
+
+    Returns:
+        Boolean Series with the frame's index
+    """
+    if "is_healthy" in df.columns:
+        return df["is_healthy"]
+    flags = df[FLAGS_COLUMN].to_numpy()
+    healthy = (flags & flags.dtype.type(_health_mask(flag_bits(df)))) == 0
+    return pd.Series(healthy, index=df.index, name="is_healthy")
+
+
+def unpack_alerts(df: pd.DataFrame) -> pd.DataFrame:
+    """Restore the boolean alert columns and is_healthy from 'alert_flags'.
+
+    Args:
+        df: DataFrame with packed alerts
+
+    Returns:
+        DataFrame with one boolean column per bit and is_healthy
+    """
+    bits = flag_bits(df)
+    if not bits:
+        return df
+    unpacked = df.drop(columns=[FLAGS_COLUMN])
+    for column in bits:
+        unpacked[column] = alert(df, column).to_numpy()
+    unpacked["is_healthy"] = is_healthy(df).to_numpy()
+    unpacked.attrs.pop(FLAGS_ATTR, None)
+    return unpacked
+
+
+def count_flags(
+    flags: np.ndarray, bits: list[str], groups: np.ndarray, n_groups: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Count set bits and healthy readings per group.
+
+    Each byte of the flags is histogrammed per group with one bincount
+    (256 bins per group); per-bit counts then follow from a small matrix
+    product with the bits of each byte value, so the readings are read
+    once per byte whatever the number of alerts.
+
+    Args:
+        flags: Packed alert flags
+        bits: Alert column of each bit
+        groups: Group code per reading, in [0, n_groups)
+        n_groups: Number of groups
+
+    Returns:
+        Tuple of (counts of shape (n_groups, len(bits)), healthy readings
+        per group)
+    """
+    # bit_table[v, b]: whether byte value v has bit b set
+    bit_table = (np.arange(256)[:, None] >> np.arange(8)) & 1
+    base = groups.astype(np.int64) * 256
+    counts = np.zeros((n_groups, len(bits)), dtype=np.int64)
+    histograms = []
+    for first in range(0, len(bits), 8):
+        values = (flags >> flags.dtype.type(first)).astype(np.uint8)
+        histogram = np.bincount(base + values, minlength=n_groups * 256)
+        histograms.append(histogram.reshape(n_groups, 256))
+        width = min(8, len(bits) - first)
+        counts[:, first : first + width] = histograms[-1] @ bit_table[:, :width]
+
+    health_mask = _health_mask(bits)
+    if histograms and health_mask <= 0xFF:
+        # Healthy readings are those whose first byte has no health bit set
+        clear = (np.arange(256) & health_mask) == 0
+        healthy = histograms[0][:, clear].sum(axis=1)
+    else:
+        clear_rows = (flags & flags.dtype.type(health_mask)) == 0
+        healthy = np.bincount(groups[clear_rows], minlength=n_groups)
+    return counts, healthy
+
+
+def _health_mask(bits: list[str]) -> int:
+    """Bitmask of the health alerts among the packed bits."""
+    return sum(1 << bits.index(column) for column in HEALTH_ALERTS if column in bits)
@@ -1,19 +1,172 @@
 """Command-line interface for sensor pipeline."""
 
 import argparse
+import glob
 import json
 from pathlib import Path
 import sys
+from typing import Any
+import pandas as pd
 
 from .models import PipelineConfig
-from .pipeline import create_sensor_pipeline
-from .sources import FileSource
+from .pipeline import Pipeline, create_sensor_pipeline
+from .quarantine import Quarantine
+from .rules import load_rules
+from .thresholds import load_threshold_table
+from .sources import (
+    FileSource,
+    MultiFileSource,
+    SensorSource,
+    SocketSource,
+    TailFileSource,
+)
+from .transforms import AggregateMesh, ConvertTimestamp
+
+
+# Inputs naming a socket to listen on rather than a file
+SOCKET_SCHEMES = ("udp://", "tcp://")
+
+
+def build_source(
+    inputs: list[str],
+    workers: int = 1,
+    cache_dir: str | None = None,
+    categorical: bool = False,
+) -> SensorSource:
+    """Create the source for the given CLI inputs.
+
+    Args:
+        inputs: Input file paths, directories or glob patterns
+        workers: Number of parallel worker processes
+        cache_dir: Directory for a columnar cache of parsed input files
+        categorical: Load identifier columns as categoricals
+
+    Returns:
+        FileSource for a single plain file, MultiFileSource otherwise
+    """
+    if len(inputs) == 1 and not glob.has_magic(inputs[0]):
+        if not Path(inputs[0]).is_dir():
+            return FileSource(
+                inputs[0],
+                workers=workers,
+                cache_dir=cache_dir,
+                categorical=categorical,
+            )
+    return MultiFileSource(
+        inputs, workers=workers, cache_dir=cache_dir, categorical=categorical
+    )
+
+
+def save_results(result: pd.DataFrame, output_file: str) -> None:
+    """Write mesh summaries to a JSON file.
+
+    Args:
+        result: Mesh summary DataFrame
+        output_file: Output JSON file path
+    """
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_path, "w") as f:
+        json.dump(result.to_dict("records"), f, indent=2, default=str)
+
+    print(f"Results saved to {output_path}")
+
+
+def timestamp_report(pipeline: Pipeline) -> str | None:
+    """Describe how many timestamps each parsing path handled.
+
+    Args:
+        pipeline: Pipeline after one or more runs
+
+    Returns:
+        One-line summary, or None if the pipeline parses no timestamps
+    """
+    for step in pipeline.steps:
+        if isinstance(step, ConvertTimestamp):
+            return (
+                f"Parsed {step.fast_rows} timestamps on the vectorized fast path, "
+                f"{step.fallback_rows} with the fallback parser"
+            )
+    return None
+
+
+def follow(
+    source: TailFileSource | SocketSource,
+    pipeline: Pipeline,
+    output_file: str,
+    filters: dict[str, Any] | None = None,
+    quarantine: Quarantine | None = None,
+) -> None:
+    """Summarize each micro-batch of a live source until interrupted.
+
+    The pipeline should be created with cumulative=True, so that each
+    rewrite of the output covers every reading received so far. For a
+    tail source with a state file, the per-mesh totals are saved with the
+    read offset and restored on start, so a restarted run continues the
+    summaries instead of starting from zero.
+
+    Args:
+        source: Tail source for a growing file, or socket source
+        pipeline: Pipeline run on every micro-batch
+        output_file: Output JSON file, rewritten after each batch
+        filters: Projection and predicates passed to the source
+        quarantine: Dead-letter sink used by the pipeline, reported on exit
+    """
+    if isinstance(source, SocketSource):
+        print(f"Listening on {source.url} (Ctrl+C to stop)")
+    else:
+        print(f"Following {source.file_path} (Ctrl+C to stop)")
+    # Cumulative totals are saved with the read offset of a tail source
+    tail = source if isinstance(source, TailFileSource) and source.state_path else None
+    aggregate = next(
+        (
+            step
+            for step in pipeline.steps
+            if isinstance(step, AggregateMesh) and step.cumulative
+        ),
+        None,
+    )
+    if tail is not None and aggregate is not None:
+        aggregate.load_totals(tail.extra_state.get("mesh_totals", []))
+    malformed = 0
+    try:
+        for batch in source.iter_batches(**(filters or {})):
+            result = pipeline.run(batch)
+            if tail is not None and aggregate is not None:
+                # Saved with the offset past this batch
+                tail.extra_state["mesh_totals"] = aggregate.dump_totals()
+            counts = (
+                f"Processed {len(batch)} new readings; {len(result)} mesh summaries"
+            )
+            if isinstance(source, SocketSource):
+                # Lines dropped since the previous batch
+                counts += f"; {source.malformed - malformed} malformed lines skipped"
+                malformed = source.malformed
+            print(counts)
+            save_results(result, output_file)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        source.close()
+        if (report := timestamp_report(pipeline)) is not None:
+            print(report)
+        if quarantine is not None:
+            print(quarantine.report())
 
 
 def main() -> None:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(description="Run sensor data pipeline")
-    parser.add_argument("input_file", help="Input JSON/JSONL file path")
+    parser.add_argument(
+        "input_files",
+        nargs="+",
+        help=(
+            "Input JSON/JSONL file paths (optionally .gz/.bz2/.xz), "
+            "directories or glob patterns, or a udp://host:port or "
+            "tcp://host:port address to receive NDJSON readings on"
+        ),
+    )
     parser.add_argument("output_file", help="Output JSON file path")
     parser.add_argument(
         "--temp-low", type=float, default=-10.0, help="Low temperature threshold (C)"
@@ -27,8 +180,169 @@ def main() -> None:
     parser.add_argument(
         "--hum-high", type=float, default=90.0, help="High humidity threshold (%%)"
     )
+    parser.add_argument(
+        "--threshold-table",
+        default=None,
+        help="JSON or CSV file of per-mesh/per-device threshold overrides",
+    )
+    parser.add_argument(
+        "--rules",
+        default=None,
+        help="JSON or YAML file of anomaly rules (name: expression), each "
+        "adding <name>_alert and <name>_anomaly_count",
+    )
+    parser.add_argument(
+        "--pack-alerts",
+        action="store_true",
+        help="Keep alerts as bits of one alert_flags column after validation",
+    )
+    parser.add_argument(
+        "--max-temp-rate",
+        type=float,
+        default=None,
+        help="Flag temperature changes faster than this (C per minute) "
+        "between consecutive readings of a device (rate_alert)",
+    )
+    parser.add_argument(
+        "--stuck-minutes",
+        type=float,
+        default=None,
+        help="Flag devices whose temperature stays identical this long (stuck_alert)",
+    )
+    parser.add_argument(
+        "--drift-sigma",
+        type=float,
+        default=None,
+        help="Flag readings this many standard deviations from their device's "
+        "running mean (drift_alert)",
+    )
+    parser.add_argument(
+        "--drift-min-readings",
+        type=int,
+        default=30,
+        help="Readings a device needs before its readings can drift",
+    )
+    parser.add_argument(
+        "--drift-state",
+        default=None,
+        help=".npz file keeping per-device drift statistics between runs",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to parse JSONL input or load input files in parallel",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for a columnar cache of parsed input files",
+    )
+    parser.add_argument(
+        "--categorical",
+        action="store_true",
+        help="Load mesh_id, device_id and status as categorical columns",
+    )
+    parser.add_argument(
+        "--mesh-id",
+        dest="mesh_ids",
+        action="append",
+        default=None,
+        help="Only process readings from this mesh (repeatable)",
+    )
+    parser.add_argument(
+        "--start",
+        default=None,
+        help="Only process readings at or after this ISO-8601 timestamp",
+    )
+    parser.add_argument(
+        "--end",
+        default=None,
+        help="Only process readings before this ISO-8601 timestamp",
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Tail a growing JSONL file and summarize each new micro-batch",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between polls when following a file",
+    )
+    parser.add_argument(
+        "--state-file",
+        default=None,
+        help="File that persists the read offset, and the summaries so far, "
+        "when following a file",
+    )
+    parser.add_argument(
+        "--dedup-window",
+        type=float,
+        default=1440.0,
+        help="Minutes of reading time over which --follow/socket runs remember "
+        "earlier readings to drop repeats",
+    )
+    parser.add_argument(
+        "--quarantine",
+        default=None,
+        help=(
+            "Write invalid readings to this dead-letter file (.jsonl, or "
+            ".parquet with pyarrow) and continue with the valid ones"
+        ),
+    )
+    parser.add_argument(
+        "--max-failure-cases",
+        type=int,
+        default=None,
+        help="Limit validation errors to this many example rows per failing check",
+    )
+    parser.add_argument(
+        "--failure-sampling",
+        choices=["head", "random"],
+        default="head",
+        help="Choose example failure rows from the start or at random",
+    )
+    parser.add_argument(
+        "--lazy-derived-columns",
+        action="store_true",
+        help="Compute timestamp_est only when written (e.g. to a dead-letter file)",
+    )
+    parser.add_argument(
+        "--timezone",
+        default=None,
+        help="Add timestamp_local in this IANA time zone (e.g. America/New_York)",
+    )
+    parser.add_argument(
+        "--mesh-timezone",
+        dest="mesh_timezones",
+        action="append",
+        default=[],
+        metavar="MESH=ZONE",
+        help="Time zone for one mesh's timestamp_local (repeatable)",
+    )
+    parser.add_argument(
+        "--batch-rows",
+        type=int,
+        default=10_000,
+        help="Maximum readings per micro-batch when listening on a socket",
+    )
+    parser.add_argument(
+        "--max-latency",
+        type=float,
+        default=0.5,
+        help="Seconds a socket micro-batch may wait for more readings",
+    )
 
     args = parser.parse_args()
+    listen = args.input_files[0].startswith(SOCKET_SCHEMES)
+    if (args.follow or listen) and len(args.input_files) != 1:
+        parser.error("--follow and socket inputs require exactly one input")
+
+    mesh_timezones = dict(item.partition("=")[::2] for item in args.mesh_timezones)
+    if not all(mesh_timezones.values()):
+        parser.error("--mesh-timezone expects MESH=ZONE")
 
     try:
         # Create configuration
@@ -37,29 +351,85 @@ def main() -> None:
             temp_high=args.temp_high,
             hum_low=args.hum_low,
             hum_high=args.hum_high,
+            thresholds=(
+                load_threshold_table(args.threshold_table)
+                if args.threshold_table
+                else []
+            ),
+            rules=load_rules(args.rules) if args.rules else {},
+            pack_alerts=args.pack_alerts,
+            max_temp_rate=args.max_temp_rate,
+            stuck_minutes=args.stuck_minutes,
+            drift_sigma=args.drift_sigma,
+            drift_min_readings=args.drift_min_readings,
+            drift_state=args.drift_state,
+            dedup_window_minutes=args.dedup_window,
+            max_failure_cases=args.max_failure_cases,
+            failure_sampling=args.failure_sampling,
+            lazy_derived_columns=args.lazy_derived_columns,
+            timezone=args.timezone,
+            mesh_timezones=mesh_timezones,
+        )
+
+        quarantine = Quarantine(args.quarantine) if args.quarantine else None
+        # Live sources summarize everything received so far after each batch
+        pipeline = create_sensor_pipeline(
+            config, quarantine, cumulative=args.follow or listen
         )
+        filters: dict[str, Any] = {"mesh_ids": args.mesh_ids}
+        if args.start is not None or args.end is not None:
+            filters["time_range"] = (args.start, args.end)
+
+        if listen:
+            follow(
+                SocketSource.from_url(
+                    args.input_files[0],
+                    max_batch_rows=args.batch_rows,
+                    max_latency=args.max_latency,
+                    categorical=args.categorical,
+                ),
+                pipeline,
+                args.output_file,
+                filters,
+                quarantine,
+            )
+            return
+
+        if args.follow:
+            follow(
+                TailFileSource(
+                    args.input_files[0],
+                    poll_interval=args.poll_interval,
+                    state_path=args.state_file,
+                ),
+                pipeline,
+                args.output_file,
+                filters,
+                quarantine,
+            )
+            return
 
         # Load data
-        source = FileSource(args.input_file)
-        df = source.load()
+        source = build_source(
+            args.input_files, args.workers, args.cache_dir, args.categorical
+        )
+        df = source.load(**filters)
         print(f"Loaded {len(df)} sensor readings")
 
         # Run pipeline
-        pipeline = create_sensor_pipeline(config)
         result = pipeline.run(df)
         print(f"Processed into {len(result)} mesh summaries")
+        if (report := timestamp_report(pipeline)) is not None:
+            print(report)
+        if quarantine is not None:
+            print(quarantine.report())
 
-        # Save results
-        output_path = Path(args.output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, "w") as f:
-            json.dump(result.to_dict("records"), f, indent=2, default=str)
-
-        print(f"Results saved to {output_path}")
+        save_results(result, args.output_file)
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
+        for note in getattr(e, "__notes__", []):
+            print(note, file=sys.stderr)
         sys.exit(1)
 
 
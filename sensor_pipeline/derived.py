@@ -0,0 +1,86 @@
+"""Lazily materialized columns derived from other columns."""
+
+from typing import Any
+import pandas as pd
+
+
+# DataFrame.attrs key holding the declared derived columns
+DERIVED_ATTR = "derived_columns"
+
+
+def add_timezone_view(df: pd.DataFrame, name: str, source: str, tz: str) -> None:
+    """Declare a column as another datetime column shown in a time zone.
+
+    Nothing is computed until the column is materialized. The declaration
+    is kept in df.attrs, which pandas carries through copies, filters and
+    index resets, so it follows the rows through the pipeline.
+
+    Args:
+        df: DataFrame to declare the column on (modified in place)
+        name: Derived column name
+        source: Datetime column it is computed from
+        tz: Time zone name for the view
+    """
+    declared = dict(df.attrs.get(DERIVED_ATTR, {}))
+    declared[name] = {"source": source, "tz": tz}
+    df.attrs[DERIVED_ATTR] = declared
+
+
+def derived_columns(df: pd.DataFrame) -> dict[str, dict[str, Any]]:
+    """Return the derived columns declared on a DataFrame and not yet present.
+
+    Args:
+        df: DataFrame to inspect
+
+    Returns:
+        Mapping of derived column name to its definition, for columns whose
+        source is present
+    """
+    return {
+        name: spec
+        for name, spec in df.attrs.get(DERIVED_ATTR, {}).items()
+        if name not in df and spec["source"] in df
+    }
+
+
+def timezone_view(series: pd.Series, tz: str) -> pd.Series:
+    """Show a datetime column in another time zone.
+
+    For a timezone-aware column the result shares its int64 buffer; only
+    the dtype differs. Naive columns are taken as UTC, which needs a copy.
+
+    Args:
+        series: Datetime column
+        tz: Time zone name
+
+    Returns:
+        Column with the same instants in the given time zone
+    """
+    values = series.array
+    if values.tz is None:
+        values = values.tz_localize("UTC")
+    return pd.Series(values.tz_convert(tz), index=series.index, name=series.name)
+
+
+def materialize(df: pd.DataFrame, columns: list[str] | None = None) -> pd.DataFrame:
+    """Compute declared derived columns into a DataFrame.
+
+    Args:
+        df: DataFrame with declared derived columns
+        columns: Derived columns to compute; all declared ones if None
+
+    Returns:
+        Shallow copy of the DataFrame with the columns added, or the
+        DataFrame itself if there was nothing to compute
+    """
+    declared = derived_columns(df)
+    names = [name for name in (columns or declared) if name in declared]
+    if not names:
+        return df
+
+    # Assigning a column copies it unless copy-on-write is enabled
+    result = df.copy(deep=False)
+    for name in names:
+        spec = declared[name]
+        result[name] = timezone_view(df[spec["source"]], spec["tz"])
+    return result
@@ -1,8 +1,12 @@
 """Data models for sensor pipeline."""
 
-from pydantic import BaseModel, Field
+from typing import Literal
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from pydantic import BaseModel, Field, field_validator, model_validator
 import pandera.pandas as pa
 
+from .rules import RuleSet, alert_counts
+
 
 # Pandera schema for sensor input validation
 sensor_input_schema = pa.DataFrameSchema(
@@ -30,6 +34,7 @@ processed_reading_schema = pa.DataFrameSchema(
         "device_id": pa.Column(pa.String, nullable=False),
         "timestamp": pa.Column(pa.DateTime, nullable=False, coerce=True),
         "timestamp_est": pa.Column(pa.DateTime, nullable=False, coerce=True),
+        "timestamp_local": pa.Column(pa.DateTime, nullable=False, required=False),
         "temperature_c": pa.Column(pa.Float, nullable=False),
         "temperature_f": pa.Column(pa.Float, nullable=False),
         "humidity": pa.Column(pa.Float, nullable=False),
@@ -57,6 +62,9 @@ mesh_summary_schema = pa.DataFrameSchema(
         "temperature_anomaly_count": pa.Column(pa.Int, nullable=False),
         "humidity_anomaly_count": pa.Column(pa.Int, nullable=False),
         "status_anomaly_count": pa.Column(pa.Int, nullable=False),
+        "drift_anomaly_count": pa.Column(pa.Int, nullable=False, required=False),
+        "rate_anomaly_count": pa.Column(pa.Int, nullable=False, required=False),
+        "stuck_anomaly_count": pa.Column(pa.Int, nullable=False, required=False),
         "healthy_reading_percentage": pa.Column(pa.Float, nullable=False),
     },
     strict=True,  # no extra cols
@@ -64,6 +72,52 @@ mesh_summary_schema = pa.DataFrameSchema(
 )
 
 
+def rule_summary_schema(rules: dict[str, str]) -> pa.DataFrameSchema:
+    """Add the counts of anomaly rules to the mesh summary schema.
+
+    Rule alert columns are added after processed validation, along with
+    the fault and drift alerts they may combine, so only their per-mesh
+    counts are validated.
+
+    Args:
+        rules: Rule name to expression
+
+    Returns:
+        Mesh summary schema with a '<name>_anomaly_count' column per rule
+    """
+    if not rules:
+        return mesh_summary_schema
+    return mesh_summary_schema.add_columns(
+        {
+            count: pa.Column(pa.Int, nullable=False)
+            for count in alert_counts(rules).values()
+        }
+    )
+
+
+class ThresholdOverride(BaseModel):
+    """Anomaly thresholds for one mesh, one device, or a device in a mesh.
+
+    Limits left unset fall back to the next less specific match: a device
+    within a mesh, then a device in any mesh, then the mesh, then the
+    global thresholds in PipelineConfig.
+    """
+
+    mesh_id: str | None = Field(default=None, description="Mesh to apply to")
+    device_id: str | None = Field(default=None, description="Device to apply to")
+    temp_low: float | None = Field(default=None, description="Low temperature (C)")
+    temp_high: float | None = Field(default=None, description="High temperature (C)")
+    hum_low: float | None = Field(default=None, description="Low humidity (%)")
+    hum_high: float | None = Field(default=None, description="High humidity (%)")
+
+    @model_validator(mode="after")
+    def _check_key(self) -> "ThresholdOverride":
+        """Require a mesh_id or device_id to match readings by."""
+        if self.mesh_id is None and self.device_id is None:
+            raise ValueError("Threshold override needs a mesh_id or device_id")
+        return self
+
+
 class PipelineConfig(BaseModel):
     """Configuration for pipeline execution."""
 
@@ -71,3 +125,112 @@ class PipelineConfig(BaseModel):
     temp_high: float = Field(default=60.0, description="High temperature threshold (C)")
     hum_low: float = Field(default=10.0, description="Low humidity threshold (%)")
     hum_high: float = Field(default=90.0, description="High humidity threshold (%)")
+    max_failure_cases: int | None = Field(
+        default=None,
+        ge=1,
+        description="Example rows per failing check in validation errors (all if None)",
+    )
+    failure_sampling: Literal["head", "random"] = Field(
+        default="head", description="How example failure rows are chosen"
+    )
+    lazy_derived_columns: bool = Field(
+        default=False,
+        description="Declare timestamp_est as a view computed only when read",
+    )
+    thresholds: list[ThresholdOverride] = Field(
+        default_factory=list,
+        description="Per-mesh and per-device threshold overrides",
+    )
+    max_temp_rate: float | None = Field(
+        default=None,
+        gt=0,
+        description="Temperature change (C per minute) between consecutive "
+        "readings of a device that raises rate_alert (off if None)",
+    )
+    stuck_minutes: float | None = Field(
+        default=None,
+        gt=0,
+        description="Minutes of identical temperatures that raise stuck_alert "
+        "(off if None)",
+    )
+    drift_sigma: float | None = Field(
+        default=None,
+        gt=0,
+        description="Standard deviations from a device's running mean that "
+        "raise drift_alert (drift detection off if None)",
+    )
+    drift_min_readings: int = Field(
+        default=30, ge=2, description="Readings a device needs before drift alerts"
+    )
+    drift_state: str | None = Field(
+        default=None,
+        description=".npz file keeping per-device drift statistics between runs",
+    )
+    dedup_window_minutes: float | None = Field(
+        default=1440.0,
+        gt=0,
+        description="Minutes of reading time over which readings of earlier "
+        "micro-batches are remembered for deduplication (for ever if None)",
+    )
+    rules: dict[str, str] = Field(
+        default_factory=dict,
+        description="Anomaly rules: name to boolean expression over reading "
+        "columns, each adding <name>_alert and <name>_anomaly_count",
+    )
+    pack_alerts: bool = Field(
+        default=False,
+        description="Store alerts and is_healthy as bits of one integer "
+        "alert_flags column after validation",
+    )
+    timezone: str | None = Field(
+        default=None,
+        description="IANA time zone for timestamp_local (not added if unset)",
+    )
+    mesh_timezones: dict[str, str] = Field(
+        default_factory=dict,
+        description="IANA time zone per mesh_id for timestamp_local",
+    )
+
+    @field_validator("rules")
+    @classmethod
+    def _check_rules(cls, value: dict[str, str]) -> dict[str, str]:
+        """Reject rules that do not compile."""
+        RuleSet(value)
+        return value
+
+    @model_validator(mode="after")
+    def _check_rule_alerts(self) -> "PipelineConfig":
+        """Reject rules using fault or drift alerts that are switched off."""
+        options = {
+            "rate_alert": ("max_temp_rate", self.max_temp_rate),
+            "stuck_alert": ("stuck_minutes", self.stuck_minutes),
+            "drift_alert": ("drift_sigma", self.drift_sigma),
+        }
+        for column in RuleSet(self.rules).columns:
+            if column in options and options[column][1] is None:
+                raise ValueError(f"Rules using {column} need {options[column][0]} set")
+        return self
+
+    @field_validator("timezone")
+    @classmethod
+    def _check_timezone(cls, value: str | None) -> str | None:
+        """Reject unknown time zone names."""
+        if value is not None:
+            _check_zone(value)
+        return value
+
+    @field_validator("mesh_timezones")
+    @classmethod
+    def _check_mesh_timezones(cls, value: dict[str, str]) -> dict[str, str]:
+        """Reject unknown time zone names."""
+        for zone in value.values():
+            _check_zone(zone)
+        return value
+
+
+def _check_zone(name: str) -> None:
+    """Raise ValueError unless name is a known IANA time zone."""
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"Unknown time zone: {name}") from None
@@ -4,6 +4,7 @@ from typing import Any
 import pandas as pd
 
 from .models import PipelineConfig
+from .quarantine import Quarantine
 
 
 class Pipeline:
@@ -33,11 +34,20 @@ class Pipeline:
         return df
 
 
-def create_sensor_pipeline(config: PipelineConfig) -> Pipeline:
+def create_sensor_pipeline(
+    config: PipelineConfig,
+    quarantine: Quarantine | None = None,
+    cumulative: bool = False,
+) -> Pipeline:
     """Create a sensor data processing pipeline.
 
     Args:
         config: Pipeline configuration
+        quarantine: Dead-letter sink for readings that fail input or
+            processed validation; without it invalid readings fail the run
+        cumulative: Run on successive micro-batches of one stream: drop
+            readings already seen in earlier batches and summarize all
+            readings so far, not just the current batch
 
     Returns:
         Configured Pipeline instance
@@ -45,26 +55,85 @@ def create_sensor_pipeline(config: PipelineConfig) -> Pipeline:
     from .transforms import (
         ValidateSchema,
         ConvertTimestamp,
-        ConvertTemperature,
-        DetectAnomalies,
+        DeriveReadings,
+        DetectSensorFaults,
+        DetectDrift,
+        ApplyRules,
+        PackAlerts,
         DeduplicateReadings,
         AggregateMesh,
     )
     from .models import (
         sensor_input_schema,
         processed_reading_schema,
-        mesh_summary_schema,
+        rule_summary_schema,
     )
+    from .rules import alert_counts
+    from .validation import ValidationLedger
+
+    # Lets later schema checks skip columns validated by earlier ones
+    ledger = ValidationLedger()
+
+    # Anomaly rules add a per-mesh count each
+    mesh_summary_schema = rule_summary_schema(config.rules)
+
+    def validate(schema: Any, quarantine: Quarantine | None = None) -> ValidateSchema:
+        return ValidateSchema(
+            schema,
+            ledger=ledger,
+            quarantine=quarantine,
+            max_failure_cases=config.max_failure_cases,
+            failure_sampling=config.failure_sampling,
+        )
 
     steps = [
-        ValidateSchema(sensor_input_schema),
-        ConvertTimestamp(),
-        ConvertTemperature(),
-        DetectAnomalies(config),
-        ValidateSchema(processed_reading_schema),
-        DeduplicateReadings(),
-        AggregateMesh(),
-        ValidateSchema(mesh_summary_schema),
+        validate(sensor_input_schema, quarantine),
+        ConvertTimestamp(
+            lazy=config.lazy_derived_columns,
+            timezone=config.timezone,
+            mesh_timezones=config.mesh_timezones,
+            quarantine=quarantine,
+        ),
+        # Fused ConvertTemperature + DetectAnomalies
+        DeriveReadings(config),
+    ]
+    steps += [
+        validate(processed_reading_schema, quarantine),
+        DeduplicateReadings(
+            remember=cumulative,
+            window=(
+                pd.Timedelta(minutes=config.dedup_window_minutes)
+                if config.dedup_window_minutes is not None
+                else None
+            ),
+        ),
+    ]
+    if config.max_temp_rate is not None or config.stuck_minutes is not None:
+        # After quarantine and deduplication, so neither invalid nor
+        # repeated readings break or extend a device's series
+        steps.append(
+            DetectSensorFaults(
+                max_rate=config.max_temp_rate, stuck_minutes=config.stuck_minutes
+            )
+        )
+    if config.drift_sigma is not None:
+        # After deduplication, so repeated readings are not counted twice
+        steps.append(
+            DetectDrift(
+                sigma=config.drift_sigma,
+                min_readings=config.drift_min_readings,
+                state_path=config.drift_state,
+            )
+        )
+    if config.rules:
+        # After every built-in alert, so rules can combine them
+        steps.append(ApplyRules(config.rules))
+    if config.pack_alerts:
+        # Once every alert column exists
+        steps.append(PackAlerts())
+    steps += [
+        AggregateMesh(alert_counts(config.rules), cumulative=cumulative),
+        validate(mesh_summary_schema),
     ]
 
     return Pipeline(steps)
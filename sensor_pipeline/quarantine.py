@@ -0,0 +1,90 @@
+"""Dead-letter storage for rows that fail validation."""
+
+from collections import Counter
+from pathlib import Path
+import importlib.util
+import pandas as pd
+
+from .derived import materialize
+
+
+class Quarantine:
+    """Collect rows rejected by validation instead of failing the run.
+
+    Rejected rows are appended to a dead-letter file with an `_errors`
+    field listing the rules each row broke ("column: check"). The file is
+    JSON Lines unless its name ends in .parquet (requires pyarrow).
+    Counts of rows and of failures per rule are kept for reporting.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize with dead-letter file path.
+
+        Args:
+            path: Dead-letter file; .parquet for Parquet, JSONL otherwise
+
+        Raises:
+            ImportError: If a Parquet file is requested without pyarrow
+        """
+        self.path = Path(path)
+        self.parquet = self.path.suffix == ".parquet"
+        if self.parquet and importlib.util.find_spec("pyarrow") is None:
+            raise ImportError("Writing a Parquet dead-letter file requires pyarrow")
+        self.rows = 0
+        self.counts: Counter[str] = Counter()
+
+    def add(self, rows: pd.DataFrame, errors: list[list[str]]) -> None:
+        """Append rejected rows to the dead-letter file.
+
+        Args:
+            rows: Rejected rows as they reached validation
+            errors: Rules broken by each row, in row order
+        """
+        if len(rows) == 0:
+            return
+        self.rows += len(rows)
+        self.counts.update(rule for row_errors in errors for rule in row_errors)
+
+        rows = materialize(rows).reset_index(drop=True)
+        rows = rows.assign(_errors=pd.Series(errors))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.parquet:
+            self._append_parquet(rows)
+        else:
+            with open(self.path, "a") as f:
+                rows.to_json(
+                    f,
+                    orient="records",
+                    lines=True,
+                    date_format="iso",
+                    default_handler=str,
+                )
+
+    def report(self) -> str:
+        """Summarize quarantined rows for display.
+
+        Returns:
+            Multi-line summary with the total and per-rule failure counts
+        """
+        lines = [f"Quarantined {self.rows} invalid rows to {self.path}"]
+        lines.extend(
+            f"  {rule}: {count}" for rule, count in sorted(self.counts.items())
+        )
+        return "\n".join(lines)
+
+    def _append_parquet(self, rows: pd.DataFrame) -> None:
+        """Rewrite the Parquet file with the new rows appended."""
+        # Rejected object columns may mix types, which Parquet cannot store
+        for name in rows.columns.drop("_errors"):
+            if rows[name].dtype == object:
+                rows[name] = rows[name].map(_to_text)
+        if self.path.exists():
+            rows = pd.concat([pd.read_parquet(self.path), rows], ignore_index=True)
+        rows.to_parquet(self.path, index=False)
+
+
+def _to_text(value: object) -> str | None:
+    """Render a rejected value as text, keeping missing values null."""
+    if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+        return None
+    return str(value)
@@ -0,0 +1,357 @@
+"""Declarative anomaly rules compiled to vectorized masks."""
+
+import ast
+import json
+import operator
+import re
+from pathlib import Path
+from typing import Any, Callable
+import numpy as np
+import pandas as pd
+
+
+# Rule names taken by the built-in alert columns
+RESERVED_RULE_NAMES = frozenset(
+    {"temperature", "humidity", "status", "rate", "stuck", "drift"}
+)
+
+_RULE_NAME = re.compile(r"[a-z][a-z0-9_]*")
+
+_COMPARISONS: dict[type[ast.cmpop], tuple[str, Callable[[Any, Any], Any]]] = {
+    ast.Eq: ("eq", operator.eq),
+    ast.NotEq: ("ne", operator.ne),
+    ast.Lt: ("lt", operator.lt),
+    ast.LtE: ("le", operator.le),
+    ast.Gt: ("gt", operator.gt),
+    ast.GtE: ("ge", operator.ge),
+}
+
+_ARITHMETIC: dict[type[ast.operator], tuple[str, Callable[[Any, Any], Any]]] = {
+    ast.Add: ("add", np.add),
+    ast.Sub: ("sub", np.subtract),
+    ast.Mult: ("mul", np.multiply),
+    ast.Div: ("div", np.true_divide),
+}
+
+# Instruction kinds of a compiled program
+_COLUMN, _CONSTANT, _APPLY = range(3)
+
+
+def alert_counts(rules: dict[str, str]) -> dict[str, str]:
+    """Map the alert column of each rule to its per-mesh count column.
+
+    Args:
+        rules: Rule name to expression
+
+    Returns:
+        '<name>_alert' to '<name>_anomaly_count', in rule order
+    """
+    return {f"{name}_alert": f"{name}_anomaly_count" for name in rules}
+
+
+def load_rules(path: str | Path) -> dict[str, str]:
+    """Read anomaly rules from a JSON or YAML file.
+
+    The file holds one mapping of rule name to expression, e.g.
+    {"hot_error": "temperature_c > 60 and status != 'ok'"}.
+
+    Args:
+        path: JSON file, or .yaml/.yml file (requires PyYAML)
+
+    Returns:
+        Rule name to expression, in file order
+
+    Raises:
+        ImportError: If a YAML file is given without PyYAML installed
+        ValueError: If the file does not hold a mapping of strings
+    """
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("Reading YAML rules requires PyYAML") from None
+        rules = yaml.safe_load(path.read_text())
+    else:
+        rules = json.loads(path.read_text())
+    if not isinstance(rules, dict) or not all(
+        isinstance(key, str) and isinstance(value, str) for key, value in rules.items()
+    ):
+        raise ValueError(f"{path} must map rule names to expressions")
+    return rules
+
+
+class RuleSet:
+    """Anomaly rules compiled once into a shared program of array operations.
+
+    Expressions use a small Python subset: column names, numbers, strings,
+    True/False, comparisons (chained ones too, and `in`/`not in` with a
+    list of constants), `and`/`or`/`not`, + - * / and abs(). Each
+    subexpression is compiled to one instruction, keyed by its canonical
+    form, so a subexpression shared by several rules (or repeated within
+    one) is evaluated once per DataFrame.
+
+    Missing values follow NumPy's NaN semantics: a comparison with a
+    missing value is False, except `!=` and `not in`, which are True.
+    """
+
+    def __init__(self, rules: dict[str, str]):
+        """Compile rules.
+
+        Args:
+            rules: Rule name to boolean expression over reading columns
+
+        Raises:
+            ValueError: If a rule name is not a lowercase identifier, is
+                reserved, or its expression is not supported
+        """
+        self.rules = dict(rules)
+        self.columns: list[str] = []
+        self.outputs: dict[str, int] = {}
+        self._program: list[tuple[int, Any, tuple[int, ...]]] = []
+        self._slots: dict[str, int] = {}
+        # First rule using each instruction, for error messages
+        self._owners: list[str] = []
+
+        for name, expression in self.rules.items():
+            if not _RULE_NAME.fullmatch(name):
+                raise ValueError(
+                    f"Invalid rule name {name!r}: use lowercase letters, digits "
+                    "and underscores"
+                )
+            if name in RESERVED_RULE_NAMES:
+                raise ValueError(f"Rule name {name!r} is used by a built-in alert")
+            try:
+                tree = ast.parse(expression, mode="eval")
+                self.outputs[name] = self._compile(tree.body)[0]
+            except (SyntaxError, ValueError) as e:
+                raise ValueError(f"Invalid rule {name!r}: {e}") from None
+            self._owners += [name] * (len(self._program) - len(self._owners))
+
+    @property
+    def instructions(self) -> int:
+        """Number of distinct subexpressions evaluated per DataFrame."""
+        return len(self._program)
+
+    def evaluate(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Evaluate every rule on a DataFrame.
+
+        Args:
+            df: Readings with the columns the rules reference
+
+        Returns:
+            Rule name to boolean mask, one value per row
+
+        Raises:
+            ValueError: If a referenced column is missing, a rule compares
+                or combines values of incompatible types, or a rule does not
+                evaluate to a boolean mask
+        """
+        missing = [column for column in self.columns if column not in df.columns]
+        if missing:
+            raise ValueError(f"Rules reference missing columns: {missing}")
+
+        values: list[Any] = []
+        for kind, payload, args in self._program:
+            if kind == _COLUMN:
+                values.append(_column(df[payload]))
+            elif kind == _CONSTANT:
+                values.append(payload)
+            else:
+                try:
+                    values.append(payload(*(values[i] for i in args)))
+                except TypeError as e:
+                    name = self._owners[len(values)]
+                    raise ValueError(
+                        f"Rule {name!r} cannot be evaluated: {e}"
+                    ) from None
+
+        masks = {}
+        for name, slot in self.outputs.items():
+            mask = values[slot]
+            if np.ndim(mask) == 0 and isinstance(mask, (bool, np.bool_)):
+                mask = np.full(len(df), mask)
+            if not isinstance(mask, np.ndarray) or mask.dtype != bool:
+                raise ValueError(f"Rule {name!r} does not evaluate to a boolean mask")
+            masks[name] = mask
+        return masks
+
+    def _emit(
+        self, key: str, kind: int, payload: Any, args: tuple[int, ...] = ()
+    ) -> tuple[int, str]:
+        """Slot of an instruction, adding it unless one with this key exists."""
+        if key not in self._slots:
+            self._slots[key] = len(self._program)
+            self._program.append((kind, payload, args))
+        return self._slots[key], key
+
+    def _apply(
+        self, name: str, func: Callable[..., Any], operands: list[tuple[int, str]]
+    ) -> tuple[int, str]:
+        """Emit an operation on already compiled operands."""
+        key = f"{name}({','.join(key for _, key in operands)})"
+        return self._emit(key, _APPLY, func, tuple(slot for slot, _ in operands))
+
+    def _compile(self, node: ast.expr) -> tuple[int, str]:
+        """Compile an expression node, returning its slot and canonical key."""
+        if isinstance(node, ast.Name):
+            if node.id in ("True", "False"):
+                return self._constant(node.id == "True")
+            if node.id not in self.columns:
+                self.columns.append(node.id)
+            return self._emit(f"${node.id}", _COLUMN, node.id)
+
+        if isinstance(node, ast.Constant):
+            if not isinstance(node.value, (bool, int, float, str)):
+                raise ValueError(f"unsupported constant {node.value!r}")
+            return self._constant(node.value)
+
+        if isinstance(node, ast.BoolOp):
+            # and/or are commutative on masks: sort operands for more sharing
+            operands = sorted(
+                (self._compile(value) for value in node.values), key=lambda o: o[1]
+            )
+            logical = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            result = operands[0]
+            for operand in operands[1:]:
+                result = self._apply(
+                    logical.__name__, _masks(logical), [result, operand]
+                )
+            return result
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._compile(node.operand)
+            if isinstance(node.op, ast.Not):
+                return self._apply("not", _masks(np.logical_not), [operand])
+            if isinstance(node.op, ast.USub):
+                return self._apply("neg", np.negative, [operand])
+            raise ValueError(f"unsupported operator {type(node.op).__name__}")
+
+        if isinstance(node, ast.BinOp):
+            if type(node.op) not in _ARITHMETIC:
+                raise ValueError(f"unsupported operator {type(node.op).__name__}")
+            arithmetic = _ARITHMETIC[type(node.op)]
+            return self._apply(
+                *arithmetic, [self._compile(node.left), self._compile(node.right)]
+            )
+
+        if isinstance(node, ast.Call):
+            if not (
+                isinstance(node.func, ast.Name)
+                and node.func.id == "abs"
+                and len(node.args) == 1
+                and not node.keywords
+            ):
+                raise ValueError("only abs(x) calls are supported")
+            return self._apply("abs", np.abs, [self._compile(node.args[0])])
+
+        if isinstance(node, ast.Compare):
+            # a < b < c is (a < b) and (b < c)
+            terms = [node.left, *node.comparators]
+            parts = [
+                self._comparison(op, left, right)
+                for op, left, right in zip(node.ops, terms, terms[1:])
+            ]
+            result = parts[0]
+            for part in parts[1:]:
+                result = self._apply(
+                    np.logical_and.__name__, _masks(np.logical_and), [result, part]
+                )
+            return result
+
+        raise ValueError(f"unsupported expression {ast.unparse(node)!r}")
+
+    def _comparison(
+        self, op: ast.cmpop, left: ast.expr, right: ast.expr
+    ) -> tuple[int, str]:
+        """Compile one binary comparison."""
+        if isinstance(op, (ast.In, ast.NotIn)):
+            elements = right.elts if isinstance(right, (ast.List, ast.Tuple)) else []
+            constants = [e.value for e in elements if isinstance(e, ast.Constant)]
+            if not constants or len(constants) != len(elements):
+                raise ValueError("`in` needs a list of constants")
+            items = tuple(sorted(set(constants), key=repr))
+            negate = isinstance(op, ast.NotIn)
+            return self._apply(
+                "notin" if negate else "in",
+                lambda values, items: _isin(values, items, negate),
+                [self._compile(left), self._constant(items)],
+            )
+        if type(op) not in _COMPARISONS:
+            raise ValueError(f"unsupported comparison {type(op).__name__}")
+        name, func = _COMPARISONS[type(op)]
+        return self._apply(
+            name,
+            lambda a, b: _compare(func, a, b),
+            [self._compile(left), self._compile(right)],
+        )
+
+    def _constant(self, value: Any) -> tuple[int, str]:
+        """Emit a constant."""
+        return self._emit(f"#{value!r}", _CONSTANT, value)
+
+
+def _column(series: pd.Series) -> Any:
+    """Column values in the form the operations expect."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Compared per category, then gathered by code
+        return series.array
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return series.to_numpy(dtype=bool, na_value=False)
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return series.to_numpy()
+
+
+def _masks(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a logical ufunc so it rejects operands that are not masks."""
+
+    def apply(*operands: Any) -> Any:
+        for operand in operands:
+            if np.asarray(operand).dtype != bool:
+                raise ValueError("and/or/not need boolean operands")
+        return func(*operands)
+
+    return apply
+
+
+def _compare(func: Callable[[Any, Any], Any], left: Any, right: Any) -> Any:
+    """Elementwise comparison; missing values only satisfy !=."""
+    missing = func is operator.ne
+    if isinstance(left, pd.Categorical) and np.ndim(right) == 0:
+        return _by_category(left, lambda v: _compare(func, v, right), missing)
+    if isinstance(right, pd.Categorical) and np.ndim(left) == 0:
+        return _by_category(right, lambda v: _compare(func, left, v), missing)
+    left = np.asarray(left) if isinstance(left, pd.Categorical) else left
+    right = np.asarray(right) if isinstance(right, pd.Categorical) else right
+    try:
+        result = func(left, right)
+    except TypeError:
+        # Object columns holding pd.NA, or mixed types: let pandas decide
+        series = pd.Series(left) if np.ndim(left) else pd.Series(right)
+        other = right if np.ndim(left) else left
+        result = func(series, other) if np.ndim(left) else func(other, series)
+        return result.to_numpy(dtype=bool, na_value=missing)
+    return np.asarray(result, dtype=bool) if np.ndim(result) else result
+
+
+def _isin(values: Any, items: tuple[Any, ...], negate: bool) -> Any:
+    """Elementwise membership in a tuple of constants."""
+    if isinstance(values, pd.Categorical):
+        return _by_category(values, lambda v: _isin(v, items, negate), negate)
+    if np.ndim(values) == 0:
+        return (values in items) != negate
+    mask = pd.Series(values, copy=False).isin(items).to_numpy()
+    return ~mask if negate else mask
+
+
+def _by_category(
+    values: pd.Categorical, compare: Callable[[Any], Any], missing: bool
+) -> np.ndarray:
+    """Compare each category once and gather the result by code.
+
+    Missing values (code -1) get `missing`, picked up by the last entry.
+    """
+    table = np.asarray(compare(np.asarray(values.categories, dtype=object)), dtype=bool)
+    by_code: np.ndarray = np.append(table, missing)[values.codes]
+    return by_code
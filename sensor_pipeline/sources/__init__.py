@@ -2,8 +2,18 @@
 
 from .source_base import SensorSource
 from .file_source import FileSource
+from .multi_file_source import MultiFileSource
+from .tail_file_source import TailFileSource
+from .sqlite_source import SqliteSource
+from .api_source import ApiSource
+from .socket_source import SocketSource
 
 __all__ = [
     "SensorSource",
     "FileSource",
+    "MultiFileSource",
+    "TailFileSource",
+    "SqliteSource",
+    "ApiSource",
+    "SocketSource",
 ]
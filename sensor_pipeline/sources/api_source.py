@@ -0,0 +1,240 @@
+"""HTTP API sensor data source."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from typing import Any
+from urllib.parse import urlsplit
+import httpx
+import pandas as pd
+
+from .columns import records_to_frame
+from .filters import ReadFilter, TimeRange
+from .source_base import (
+    DEFAULT_ROWS_PER_CHUNK,
+    SensorSource,
+    check_rows_per_chunk,
+    concat_chunks,
+)
+
+
+class ApiSource(SensorSource):
+    """Load sensor data from a paginated HTTP API.
+
+    Pages are requested as GET {url}?page=N&page_size=M (plus mesh_id,
+    start and end parameters when filtering). A page body is either a JSON
+    array of readings or an object {"readings": [...], "total_pages": N}.
+    The first page reveals the page count; the rest are fetched
+    concurrently by an httpx client over a small pool of keep-alive
+    connections and streamed into DataFrames in page order. Redirects are
+    followed, and proxy and TLS settings come from the environment.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        page_size: int = 10_000,
+        max_connections: int = 4,
+        timeout: float = 30.0,
+        categorical: bool = False,
+    ):
+        """Initialize with API endpoint.
+
+        Args:
+            url: http:// or https:// endpoint returning reading pages
+            page_size: Readings requested per page
+            max_connections: Maximum concurrent requests (and pooled
+                connections)
+            timeout: Seconds allowed for each request
+            categorical: Dictionary-encode identifier columns as categoricals
+
+        Raises:
+            ValueError: If the URL scheme is not http or https
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported API URL scheme: {parts.scheme}")
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be positive, got {max_connections}")
+        self.url = url
+        self.page_size = page_size
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.categorical = categorical
+
+    def load(
+        self,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> pd.DataFrame:
+        """Fetch every page and return one DataFrame.
+
+        Args:
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            DataFrame with sensor readings
+        """
+        return concat_chunks(
+            list(
+                self.iter_chunks(DEFAULT_ROWS_PER_CHUNK, columns, mesh_ids, time_range)
+            )
+        )
+
+    def iter_chunks(
+        self,
+        rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream pages as bounded-size DataFrames from synchronous code.
+
+        Args:
+            rows_per_chunk: Maximum number of readings per chunk
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            Iterator of DataFrames with at most rows_per_chunk readings
+
+        Raises:
+            ValueError: If rows_per_chunk is not positive
+            RuntimeError: If called while an event loop is running (use
+                aiter_chunks() there)
+        """
+        check_rows_per_chunk(rows_per_chunk)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "ApiSource.load() and iter_chunks() cannot run inside an event "
+                "loop; use aiter_chunks() instead"
+            )
+        chunks = self.aiter_chunks(rows_per_chunk, columns, mesh_ids, time_range)
+        return _drive(chunks)
+
+    async def aiter_chunks(
+        self,
+        rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Stream pages as bounded-size DataFrames inside an event loop.
+
+        Filters are sent to the API as query parameters and re-checked
+        locally, so servers that ignore them still give exact results.
+
+        Args:
+            rows_per_chunk: Maximum number of readings per chunk
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            Async iterator of DataFrames in page order
+
+        Raises:
+            ConnectionError: If a request fails or returns a non-200 status
+        """
+        read_filter = ReadFilter(columns, mesh_ids, time_range)
+        client = httpx.AsyncClient(
+            headers={"Accept": "application/json"},
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            follow_redirects=True,
+        )
+        pages: dict[int, asyncio.Task[list[dict[str, Any]]]] = {}
+        batch: list[dict[str, Any]] = []
+        try:
+            first, total_pages = await self._fetch_page(client, 1, read_filter)
+            next_page = 2
+
+            for page in range(1, total_pages + 1):
+                # Keep a bounded window of requests in flight ahead of the reader
+                while (
+                    next_page <= total_pages and len(pages) < 2 * self.max_connections
+                ):
+                    pages[next_page] = asyncio.create_task(
+                        self._fetch_records(client, next_page, read_filter)
+                    )
+                    next_page += 1
+
+                records = first if page == 1 else await pages.pop(page)
+                for record in read_filter.filter_records(records):
+                    batch.append(record)
+                    if len(batch) >= rows_per_chunk:
+                        yield records_to_frame(batch, self.categorical)
+                        batch = []
+            if batch:
+                yield records_to_frame(batch, self.categorical)
+        finally:
+            for task in pages.values():
+                task.cancel()
+            await asyncio.gather(*pages.values(), return_exceptions=True)
+            await client.aclose()
+
+    async def _fetch_records(
+        self, client: httpx.AsyncClient, page: int, read_filter: ReadFilter
+    ) -> list[dict[str, Any]]:
+        """Fetch one page and return its readings."""
+        records, _ = await self._fetch_page(client, page, read_filter)
+        return records
+
+    async def _fetch_page(
+        self, client: httpx.AsyncClient, page: int, read_filter: ReadFilter
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Fetch one page and return (readings, total page count)."""
+        params: list[tuple[str, Any]] = [("page", page), ("page_size", self.page_size)]
+        if read_filter.mesh_ids is not None:
+            params.extend(
+                ("mesh_id", mesh_id) for mesh_id in sorted(read_filter.mesh_ids)
+            )
+        if read_filter.start is not None:
+            params.append(("start", read_filter.start.isoformat()))
+        if read_filter.end is not None:
+            params.append(("end", read_filter.end.isoformat()))
+
+        # Keep any query parameters already in the URL
+        url = httpx.URL(self.url).copy_merge_params(params)
+        try:
+            response = await client.get(url)
+        except httpx.TransportError as e:
+            raise ConnectionError(f"GET {self.url} failed: {e}") from e
+        if response.status_code != 200:
+            raise ConnectionError(
+                f"GET {response.url} returned HTTP {response.status_code}"
+            )
+
+        body = response.json()
+        if isinstance(body, list):
+            return body, 1
+        return body["readings"], int(body.get("total_pages", 1))
+
+
+def _drive(chunks: AsyncIterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """Iterate an async iterator from synchronous code on a private loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(chunks.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            loop.run_until_complete(aclose())
+        loop.close()
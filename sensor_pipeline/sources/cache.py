@@ -0,0 +1,165 @@
+"""Columnar cache of parsed input files."""
+
+from collections.abc import Mapping
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+import numpy as np
+import pandas as pd
+
+
+# Bytes hashed per read when fingerprinting file contents
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+class ParsedInputCache:
+    """Store parsed DataFrames as NumPy .npz files keyed by input file.
+
+    Entries are keyed by the resolved path and parse options of the input,
+    plus its size and modification time, so a lookup only stats the file
+    and any rewrite misses the cache. With verify_content, a hash of the
+    contents is added to the key as well, catching edits that keep both
+    size and modification time at the cost of reading the whole file on
+    every lookup. Writing an entry removes those for older versions of the
+    same file and options.
+    Columns are saved as plain NumPy arrays (strings as fixed-width
+    unicode, categoricals as codes plus categories), which avoids pickling
+    and any extra dependency.
+    """
+
+    def __init__(self, cache_dir: str | Path, verify_content: bool = False):
+        """Initialize with cache directory.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on write)
+            verify_content: Also key entries on a hash of the file contents
+        """
+        self.cache_dir = Path(cache_dir)
+        self.verify_content = verify_content
+
+    def key(
+        self, file_path: str | Path, options: Mapping[str, Any] | None = None
+    ) -> str:
+        """Compute the cache key for an input file.
+
+        Args:
+            file_path: Path to input file
+            options: Parse options the cached frame depends on, e.g.
+                {"categorical": True}
+
+        Returns:
+            '<source>-<version>' hex digests, identifying the file and
+            options, then this exact version of the file
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+
+        source: list[object] = [str(path), *sorted((options or {}).items())]
+        version: list[object] = [stat.st_size, stat.st_mtime_ns]
+        if self.verify_content:
+            content = hashlib.blake2b(digest_size=16)
+            with open(path, "rb") as f:
+                while block := f.read(_HASH_BLOCK_SIZE):
+                    content.update(block)
+            version.append(content.hexdigest())
+        return f"{_digest(source)}-{_digest(version)}"
+
+    def entry_path(self, key: str) -> Path:
+        """Return the cache file path for a key."""
+        return self.cache_dir / f"{key}.npz"
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Load a cached DataFrame.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            Cached DataFrame, or None on a cache miss
+        """
+        path = self.entry_path(key)
+        if not path.exists():
+            return None
+
+        with np.load(path, allow_pickle=False) as npz:
+            names = npz["__columns__"].tolist()
+            data = {}
+            for i, name in enumerate(names):
+                values = npz[f"col_{i}"]
+                if f"cat_{i}" in npz.files:
+                    categories = npz[f"cat_{i}"].astype(object)
+                    values = pd.Categorical.from_codes(values, categories)
+                elif values.dtype.kind == "U":
+                    values = values.astype(object)
+                data[name] = values
+        return pd.DataFrame(data, columns=names)
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """Write a DataFrame to the cache.
+
+        Frames with columns that cannot be stored without pickling (for
+        example object columns mixing strings and nulls) are skipped.
+
+        Args:
+            key: Cache key from key()
+            df: Parsed DataFrame to store
+
+        Returns:
+            True if the entry was written
+        """
+        arrays: dict[str, Any] = {
+            "__columns__": np.array([str(name) for name in df.columns], dtype=str)
+        }
+        for i, name in enumerate(df.columns):
+            column = df[name]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # Store the dictionary encoding rather than the expanded values
+                categories = _to_plain_array(column.cat.categories.to_series())
+                if categories is None:
+                    return False
+                arrays[f"cat_{i}"] = categories
+                arrays[f"col_{i}"] = column.cat.codes.to_numpy()
+                continue
+            array = _to_plain_array(column)
+            if array is None:
+                return False
+            arrays[f"col_{i}"] = array
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, allow_pickle=False, **arrays)
+        # Atomic rename so concurrent readers never see a partial entry
+        os.replace(tmp_path, path)
+        self._evict_versions(key)
+        return True
+
+    def _evict_versions(self, key: str) -> None:
+        """Remove entries for other versions of the same file and options."""
+        source, sep, _ = key.partition("-")
+        if not sep:
+            return
+        for stale in self.cache_dir.glob(f"{source}-*.npz"):
+            if stale.stem != key:
+                stale.unlink(missing_ok=True)
+
+
+def _digest(parts: list[object]) -> str:
+    """Hash key parts into a short hex digest."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(f"{part}\0".encode())
+    return digest.hexdigest()
+
+
+def _to_plain_array(series: pd.Series) -> np.ndarray | None:
+    """Convert a column to a NumPy array that loads without pickle."""
+    if series.dtype != object:
+        array = series.to_numpy()
+        return None if array.dtype == object else array
+    values = series.to_numpy()
+    if not all(isinstance(value, str) for value in values):
+        return None
+    return values.astype(str)
@@ -0,0 +1,81 @@
+"""Column-wise DataFrame construction for parsed sensor records."""
+
+from collections.abc import Sequence
+import sys
+from typing import Any
+import numpy as np
+import pandas as pd
+
+
+# Low-cardinality identifier columns repeated across millions of readings
+STRING_COLUMNS = ("mesh_id", "device_id", "status")
+
+# Numeric measurement columns expected as float64 by the input schema
+FLOAT_COLUMNS = ("temperature_c", "humidity")
+
+
+def records_to_frame(
+    records: Sequence[dict[str, Any]], categorical: bool = False
+) -> pd.DataFrame:
+    """Build a DataFrame from parsed records one column at a time.
+
+    Identifier columns are interned, so repeated values share one Python
+    string, or with categorical=True dictionary-encoded as categoricals
+    (opt-in, since callers may rely on plain string columns). Measurement
+    columns are converted straight to float64 arrays, whole numbers
+    included, as sensor_input_schema expects. Values that cannot be
+    converted are left as parsed so schema validation can report them.
+
+    Args:
+        records: Parsed JSON records
+        categorical: Store identifier columns as pandas categoricals
+
+    Returns:
+        DataFrame with one row per record, columns in first-seen order
+    """
+    names = dict.fromkeys(name for record in records for name in record)
+    data = {name: [record.get(name) for record in records] for name in names}
+    return columns_to_frame(data, len(records), categorical)
+
+
+def columns_to_frame(
+    data: dict[str, list[Any]], n_rows: int, categorical: bool = False
+) -> pd.DataFrame:
+    """Build a typed DataFrame from per-column value lists.
+
+    Args:
+        data: Column name to list of values, all of length n_rows
+        n_rows: Number of rows
+        categorical: Store identifier columns as pandas categoricals
+
+    Returns:
+        DataFrame with typed identifier and measurement columns
+    """
+    typed: dict[str, Any] = {}
+    for name, values in data.items():
+        if name in STRING_COLUMNS:
+            typed[name] = _encode_strings(values, categorical)
+        elif name in FLOAT_COLUMNS:
+            typed[name] = _to_numeric(values)
+        else:
+            typed[name] = values
+    return pd.DataFrame(typed, index=pd.RangeIndex(n_rows))
+
+
+def _encode_strings(values: list[Any], categorical: bool) -> Any:
+    """Intern or dictionary-encode an identifier column."""
+    if not all(isinstance(value, str) for value in values):
+        return values
+    if categorical:
+        return pd.Categorical(values)
+    return [sys.intern(value) for value in values]
+
+
+def _to_numeric(values: list[Any]) -> Any:
+    """Convert a measurement column to float64, leaving bad values as-is."""
+    if any(isinstance(value, (str, bool)) for value in values):
+        return values
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        return values
@@ -0,0 +1,118 @@
+"""Streaming decompression for compressed input files."""
+
+import bz2
+from collections.abc import Callable
+import gzip
+import io
+import lzma
+from pathlib import Path
+import queue
+import threading
+from typing import IO, Any, TextIO
+
+
+# Stdlib codecs keyed by file suffix; open(path, mode) like gzip.open, whose
+# overloads (binary or text file by mode) fit no single Callable type
+COMPRESSION_OPENERS: dict[str, Callable[..., Any]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+# Decompressed bytes per read-ahead block and number of blocks buffered
+READ_AHEAD_BLOCK_SIZE = 1 << 20
+READ_AHEAD_BLOCKS = 4
+
+
+def split_suffixes(file_path: Path) -> tuple[str, str | None]:
+    """Split a path into its data format and compression suffixes.
+
+    Args:
+        file_path: Input file path, e.g. readings.jsonl.gz
+
+    Returns:
+        Tuple of (format suffix, compression suffix or None), lowercased
+    """
+    suffixes = [suffix.lower() for suffix in file_path.suffixes]
+    if suffixes and suffixes[-1] in COMPRESSION_OPENERS:
+        data_suffix = suffixes[-2] if len(suffixes) > 1 else ""
+        return data_suffix, suffixes[-1]
+    return (suffixes[-1] if suffixes else ""), None
+
+
+def open_text(file_path: Path, compression: str | None) -> TextIO:
+    """Open a possibly compressed file for streaming text reads.
+
+    Compressed files are decompressed on a background thread (the stdlib
+    codecs release the GIL) so decompression overlaps with JSON parsing.
+
+    Args:
+        file_path: Path to input file
+        compression: Compression suffix from split_suffixes(), or None
+
+    Returns:
+        Text stream over the decompressed contents
+    """
+    if compression is None:
+        return open(file_path, "r")
+    raw: IO[bytes] = COMPRESSION_OPENERS[compression](file_path, "rb")
+    return io.TextIOWrapper(io.BufferedReader(_ReadAheadStream(raw)))
+
+
+class _ReadAheadStream(io.RawIOBase):
+    """Raw stream that decompresses ahead of the reader on a thread."""
+
+    def __init__(self, source: IO[bytes]):
+        self._source = source
+        self._blocks: queue.Queue[bytes | BaseException] = queue.Queue(
+            maxsize=READ_AHEAD_BLOCKS
+        )
+        self._pending = memoryview(b"")
+        self._done = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._fill, daemon=True)
+        self._thread.start()
+
+    def _fill(self) -> None:
+        """Read decompressed blocks into the queue until EOF or close."""
+        try:
+            while not self._stop.is_set():
+                block = self._source.read(READ_AHEAD_BLOCK_SIZE)
+                self._put(block)
+                if not block:
+                    return
+        except BaseException as exc:  # surfaced to the reading thread
+            self._put(exc)
+
+    def _put(self, item: bytes | BaseException) -> None:
+        while not self._stop.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: "memoryview | bytearray") -> int:  # type: ignore[override]
+        while not self._pending and not self._done:
+            item = self._blocks.get()
+            if isinstance(item, BaseException):
+                self._done = True
+                raise item
+            if not item:
+                self._done = True
+            self._pending = memoryview(item)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        # memoryview slices avoid copying the rest of the block
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._source.close()
+        super().close()
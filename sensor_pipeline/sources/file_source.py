@@ -1,26 +1,81 @@
 """File-based sensor data source."""
 
+from collections.abc import Iterable, Iterator, Sequence
 import json
 from pathlib import Path
+from typing import Any
 import pandas as pd
 
-from .source_base import SensorSource
+from .cache import ParsedInputCache
+from .columns import records_to_frame
+from .compression import open_text, split_suffixes
+from .filters import ReadFilter, TimeRange
+from .json_stream import iter_json_array
+from .parallel_jsonl import load_jsonl_parallel
+from .source_base import (
+    DEFAULT_ROWS_PER_CHUNK,
+    SensorSource,
+    check_rows_per_chunk,
+    concat_chunks,
+)
 
 
 class FileSource(SensorSource):
-    """Load sensor data from JSON/JSONL files."""
+    """Load sensor data from JSON/JSONL files.
 
-    def __init__(self, file_path: str | Path):
+    Files may be compressed with gzip (.gz), bzip2 (.bz2) or xz (.xz), e.g.
+    readings.jsonl.gz; they are decompressed while streaming.
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        workers: int = 1,
+        cache_dir: str | Path | None = None,
+        categorical: bool = False,
+        verify_cache: bool = False,
+    ):
         """Initialize with file path.
 
         Args:
-            file_path: Path to JSON or JSONL file
+            file_path: Path to JSON or JSONL file, optionally compressed
+            workers: Number of processes used by load() to parse JSONL
+                files in parallel (1 parses in the calling process)
+            cache_dir: Directory for a columnar cache of parsed files;
+                load() reuses an entry while the file is unchanged
+            categorical: Dictionary-encode mesh_id, device_id and status
+                as categoricals instead of interned strings
+            verify_cache: Also hash the file contents when looking up the
+                cache, instead of trusting its size and modification time
+
+        Raises:
+            ValueError: If workers is not positive
         """
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
         self.file_path = Path(file_path)
+        self.workers = workers
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.categorical = categorical
+        self.verify_cache = verify_cache
 
-    def load(self) -> pd.DataFrame:
+    def load(
+        self,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> pd.DataFrame:
         """Load data from file.
 
+        Filters are evaluated on each parsed record before it is added to
+        a DataFrame; cached frames are filtered after loading.
+
+        Args:
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
         Returns:
             DataFrame with sensor readings
 
@@ -28,25 +83,113 @@ class FileSource(SensorSource):
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is unsupported
         """
+        read_filter = ReadFilter(columns, mesh_ids, time_range)
+        if self.cache_dir is None:
+            return self._parse(read_filter)
+
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
-        suffix = self.file_path.suffix.lower()
+        # The cache holds the whole file so any filter can be served from it
+        cache = ParsedInputCache(self.cache_dir, verify_content=self.verify_cache)
+        key = cache.key(self.file_path, {"categorical": self.categorical})
+        df = cache.get(key)
+        if df is None:
+            df = self._parse(ReadFilter())
+            cache.put(key, df)
+        return read_filter.filter_frame(df)
 
-        if suffix == ".json":
-            # Standard JSON file
-            with open(self.file_path, "r") as f:
-                data = json.load(f)
-            return pd.DataFrame(data)
+    def _parse(self, read_filter: ReadFilter) -> pd.DataFrame:
+        """Parse the whole file into one DataFrame."""
+        # Compressed files cannot be split into byte ranges; stream them
+        if self.workers > 1 and split_suffixes(self.file_path) == (".jsonl", None):
+            if not self.file_path.exists():
+                raise FileNotFoundError(f"File not found: {self.file_path}")
+            return load_jsonl_parallel(
+                self.file_path,
+                self.workers,
+                categorical=self.categorical,
+                read_filter=read_filter,
+            )
 
-        elif suffix == ".jsonl":
-            # JSON Lines format
-            records = []
-            with open(self.file_path, "r") as f:
-                for line in f:
-                    if line.strip():
-                        records.append(json.loads(line))
-            return pd.DataFrame(records)
+        records = read_filter.filter_records(self._iter_records())
+        return concat_chunks(
+            list(_batch_records(records, DEFAULT_ROWS_PER_CHUNK, self.categorical))
+        )
+
+    def iter_chunks(
+        self,
+        rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream the file as bounded-size DataFrames.
+
+        Only one chunk of parsed records is held in memory at a time, and
+        each chunk is built column by column with typed columns.
+
+        Args:
+            rows_per_chunk: Maximum number of readings per chunk
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            Iterator of DataFrames with at most rows_per_chunk readings
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is unsupported or rows_per_chunk
+                is not positive
+        """
+        check_rows_per_chunk(rows_per_chunk)
+        read_filter = ReadFilter(columns, mesh_ids, time_range)
+        records = read_filter.filter_records(self._iter_records())
+        return _batch_records(records, rows_per_chunk, self.categorical)
+
+    def _iter_records(self) -> Iterator[dict[str, Any]]:
+        """Open the file and return an iterator over its records.
 
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is unsupported
+        """
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+
+        suffix, compression = split_suffixes(self.file_path)
+
+        if suffix == ".json":
+            return self._iter_json_records(compression)
+        elif suffix == ".jsonl":
+            return self._iter_jsonl_records(compression)
         else:
-            raise ValueError(f"Unsupported file format: {suffix}")
+            raise ValueError(f"Unsupported file format: {suffix}{compression or ''}")
+
+    def _iter_json_records(self, compression: str | None) -> Iterator[dict[str, Any]]:
+        """Yield records from a standard JSON array file as they are parsed."""
+        with open_text(self.file_path, compression) as f:
+            yield from iter_json_array(f)
+
+    def _iter_jsonl_records(self, compression: str | None) -> Iterator[dict[str, Any]]:
+        """Yield records from a JSON Lines file."""
+        with open_text(self.file_path, compression) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _batch_records(
+    records: Iterator[dict[str, Any]], rows_per_chunk: int, categorical: bool
+) -> Iterator[pd.DataFrame]:
+    """Group records into DataFrames of at most rows_per_chunk rows."""
+    batch: list[dict[str, Any]] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= rows_per_chunk:
+            yield records_to_frame(batch, categorical)
+            batch = []
+    if batch:
+        yield records_to_frame(batch, categorical)
@@ -0,0 +1,147 @@
+"""Projection and predicate pushdown for sensor sources."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timezone
+from typing import Any
+import pandas as pd
+
+
+# Inclusive start and exclusive end; None leaves that side open
+TimeBound = datetime | str | None
+TimeRange = tuple[TimeBound, TimeBound]
+
+
+def parse_timestamp(value: datetime | str) -> datetime | None:
+    """Parse a reading timestamp into an aware UTC datetime.
+
+    Handles the malformed "+00:00Z" suffix some devices send and treats
+    naive timestamps as UTC, matching ConvertTimestamp.
+
+    Args:
+        value: ISO-8601 string or datetime
+
+    Returns:
+        Aware UTC datetime, or None if the value cannot be parsed
+    """
+    if isinstance(value, str):
+        if value.endswith("Z") and len(value) > 6 and value[-7] in "+-":
+            value = value[:-1]
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class ReadFilter:
+    """Column projection and mesh/time predicates applied while reading.
+
+    Sources evaluate the filter on each parsed record, before any DataFrame
+    is built, so non-matching readings are never materialized. Records
+    whose timestamp cannot be parsed are kept for validation to report.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ):
+        """Initialize with optional projection and predicates.
+
+        Args:
+            columns: Columns to keep (all when None)
+            mesh_ids: Mesh IDs to keep (all when None)
+            time_range: (start, end) bounds on the reading timestamp, with
+                start inclusive and end exclusive; either may be None
+
+        Raises:
+            ValueError: If a time bound cannot be parsed
+        """
+        self.columns = list(columns) if columns is not None else None
+        self.mesh_ids = frozenset(mesh_ids) if mesh_ids is not None else None
+        self.start: datetime | None = None
+        self.end: datetime | None = None
+        if time_range is not None:
+            self.start, self.end = (_parse_bound(bound) for bound in time_range)
+
+    @property
+    def is_noop(self) -> bool:
+        """Whether the filter keeps every record unchanged."""
+        return (
+            self.columns is None
+            and self.mesh_ids is None
+            and self.start is None
+            and self.end is None
+        )
+
+    def matches(self, record: dict[str, Any]) -> bool:
+        """Check whether a parsed record satisfies the predicates."""
+        if self.mesh_ids is not None and record.get("mesh_id") not in self.mesh_ids:
+            return False
+        if self.start is None and self.end is None:
+            return True
+        raw = record.get("timestamp")
+        timestamp = parse_timestamp(raw) if isinstance(raw, str) else None
+        if timestamp is None:
+            return True
+        if self.start is not None and timestamp < self.start:
+            return False
+        return self.end is None or timestamp < self.end
+
+    def filter_records(
+        self, records: Iterable[dict[str, Any]]
+    ) -> Iterator[dict[str, Any]]:
+        """Yield matching records, projected onto the selected columns."""
+        if self.is_noop:
+            yield from records
+            return
+        for record in records:
+            if not self.matches(record):
+                continue
+            if self.columns is not None:
+                record = {name: record[name] for name in self.columns if name in record}
+            yield record
+
+    def filter_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply the filter to an already materialized DataFrame.
+
+        Used by sources that cannot filter while reading (e.g. cache hits).
+        """
+        if self.is_noop:
+            return df
+        mask = pd.Series(True, index=df.index)
+        if self.mesh_ids is not None and "mesh_id" in df:
+            mask &= df["mesh_id"].isin(self.mesh_ids)
+        if (self.start is not None or self.end is not None) and "timestamp" in df:
+            timestamps = df["timestamp"]
+            if not pd.api.types.is_datetime64_any_dtype(timestamps):
+                cleaned = timestamps.astype(str).str.replace(
+                    r"([+-]\d\d:\d\d)Z$", r"\1", regex=True
+                )
+                timestamps = pd.to_datetime(
+                    cleaned, utc=True, format="mixed", errors="coerce"
+                )
+            elif timestamps.dt.tz is None:
+                timestamps = timestamps.dt.tz_localize("UTC")
+            # Unparseable timestamps (NaT) are kept, as in matches()
+            if self.start is not None:
+                mask &= timestamps.isna() | (timestamps >= self.start)
+            if self.end is not None:
+                mask &= timestamps.isna() | (timestamps < self.end)
+        df = df[mask].reset_index(drop=True)
+        if self.columns is not None:
+            df = df[[name for name in self.columns if name in df]]
+        return df
+
+
+def _parse_bound(bound: TimeBound) -> datetime | None:
+    """Parse one time_range bound."""
+    if bound is None:
+        return None
+    parsed = parse_timestamp(bound)
+    if parsed is None:
+        raise ValueError(f"Invalid time_range bound: {bound!r}")
+    return parsed
@@ -0,0 +1,105 @@
+"""Incremental parser for top-level JSON arrays."""
+
+from collections.abc import Iterator
+import json
+from typing import Any, TextIO
+
+
+# Characters read from the file per refill
+DEFAULT_READ_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+
+
+class _ArrayReader:
+    """Buffered cursor over a text stream holding a JSON array."""
+
+    def __init__(self, f: TextIO, read_size: int):
+        self.f = f
+        self.read_size = read_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def refill(self, min_size: int = 0) -> bool:
+        """Append more text to the buffer, returning False at end of file."""
+        if self.eof:
+            return False
+        # Drop consumed text so the buffer stays bounded by the element size
+        if self.pos:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+        chunk = self.f.read(max(self.read_size, min_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.refill():
+                return ""
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """Decode one complete JSON value at the cursor."""
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Value may be split across reads; grow geometrically
+                if self.refill(min_size=len(self.buf) - self.pos):
+                    continue
+                raise
+            # A scalar ending exactly at the buffer edge may be truncated
+            if end == len(self.buf) and self.refill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(f: TextIO, read_size: int = DEFAULT_READ_SIZE) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only the text of the element being decoded is buffered, so memory
+    use is bounded by the largest element rather than the file size.
+
+    Args:
+        f: Text stream positioned at the start of a JSON document
+        read_size: Number of characters to read per refill
+
+    Returns:
+        Iterator over the decoded array elements
+
+    Raises:
+        ValueError: If the document is not a well-formed JSON array
+    """
+    reader = _ArrayReader(f, read_size)
+    decoder = json.JSONDecoder()
+
+    if reader.peek() != "[":
+        raise ValueError("Expected a top-level JSON array")
+    reader.pos += 1
+
+    if reader.peek() == "]":
+        reader.pos += 1
+    else:
+        while True:
+            yield reader.decode(decoder)
+            char = reader.peek()
+            reader.pos += 1
+            if char == "]":
+                break
+            if char != ",":
+                raise ValueError(
+                    f"Expected ',' or ']' in JSON array, got {char or 'end of file'!r}"
+                )
+            reader.peek()
+
+    if reader.peek():
+        raise ValueError("Unexpected data after top-level JSON array")
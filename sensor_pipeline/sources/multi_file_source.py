@@ -0,0 +1,173 @@
+"""Multi-file sensor data source."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+import glob
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+import pandas as pd
+
+from .compression import split_suffixes
+from .file_source import FileSource
+from .filters import TimeRange
+from .source_base import (
+    DEFAULT_ROWS_PER_CHUNK,
+    SensorSource,
+    check_rows_per_chunk,
+    concat_chunks,
+)
+
+
+# Data formats picked up when expanding a directory
+SUPPORTED_FORMATS = (".json", ".jsonl")
+
+
+class MultiFileSource(SensorSource):
+    """Load sensor data from many JSON/JSONL files at once.
+
+    Inputs may be file paths, directories (every supported file directly
+    inside) or glob patterns such as data/2026-10-*/*.jsonl.
+    """
+
+    def __init__(
+        self,
+        inputs: str | Path | Sequence[str | Path],
+        workers: int = 1,
+        cache_dir: str | Path | None = None,
+        categorical: bool = False,
+    ):
+        """Initialize with input paths, directories or glob patterns.
+
+        Args:
+            inputs: One or more paths, directories or glob patterns
+            workers: Number of processes loading files concurrently
+                (1 loads them one after another in the calling process)
+            cache_dir: Directory for a columnar cache of parsed files
+            categorical: Dictionary-encode identifier columns as categoricals
+
+        Raises:
+            ValueError: If workers is not positive
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if isinstance(inputs, (str, Path)):
+            inputs = [inputs]
+        self.inputs = [str(entry) for entry in inputs]
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self.categorical = categorical
+
+    def files(self) -> list[Path]:
+        """Expand inputs into the list of files to load.
+
+        Returns:
+            Files in input order, each directory or glob sorted by name
+
+        Raises:
+            FileNotFoundError: If an input matches no files
+        """
+        files: list[Path] = []
+        for entry in self.inputs:
+            path = Path(entry)
+            if path.is_dir():
+                matches = sorted(
+                    child
+                    for child in path.iterdir()
+                    if child.is_file() and split_suffixes(child)[0] in SUPPORTED_FORMATS
+                )
+            elif glob.has_magic(entry):
+                matches = [
+                    Path(match) for match in sorted(glob.glob(entry, recursive=True))
+                ]
+            else:
+                matches = [path]
+            if not matches:
+                raise FileNotFoundError(f"No input files match: {entry}")
+            files.extend(matches)
+        return files
+
+    def load(
+        self,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> pd.DataFrame:
+        """Load all files and concatenate them once.
+
+        Args:
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            DataFrame with sensor readings from every file, in file order
+
+        Raises:
+            FileNotFoundError: If an input matches no files
+            ValueError: If a file format is unsupported
+        """
+        files = self.files()
+        filters = {"columns": columns, "mesh_ids": mesh_ids, "time_range": time_range}
+        if self.workers == 1 or len(files) == 1:
+            frames = [
+                _load_file(path, self.cache_dir, self.categorical, filters)
+                for path in files
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                frames = list(
+                    pool.map(
+                        _load_file,
+                        files,
+                        repeat(self.cache_dir),
+                        repeat(self.categorical),
+                        repeat(filters),
+                    )
+                )
+        return concat_chunks([frame for frame in frames if len(frame)])
+
+    def iter_chunks(
+        self,
+        rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream every file in turn as bounded-size DataFrames.
+
+        Args:
+            rows_per_chunk: Maximum number of readings per chunk
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            Iterator of DataFrames; chunks never span two files
+
+        Raises:
+            FileNotFoundError: If an input matches no files
+            ValueError: If rows_per_chunk is not positive
+        """
+        check_rows_per_chunk(rows_per_chunk)
+        files = self.files()
+        return (
+            chunk
+            for path in files
+            for chunk in FileSource(path, categorical=self.categorical).iter_chunks(
+                rows_per_chunk, columns, mesh_ids, time_range
+            )
+        )
+
+
+def _load_file(
+    path: Path,
+    cache_dir: str | Path | None,
+    categorical: bool,
+    filters: dict[str, Any],
+) -> pd.DataFrame:
+    """Load one file; module-level so worker processes can run it."""
+    source = FileSource(path, cache_dir=cache_dir, categorical=categorical)
+    return source.load(**filters)
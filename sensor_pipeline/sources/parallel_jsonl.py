@@ -0,0 +1,101 @@
+"""Parallel memory-mapped JSON Lines ingest."""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import json
+import mmap
+from pathlib import Path
+import pandas as pd
+
+from .columns import records_to_frame
+from .filters import ReadFilter
+from .source_base import concat_chunks
+
+
+# Byte ranges per worker; more ranges than workers evens out skewed lines
+RANGES_PER_WORKER = 4
+
+
+def split_ranges(mm: mmap.mmap | bytes, n_ranges: int) -> list[tuple[int, int]]:
+    """Split a buffer into byte ranges that start and end on line breaks.
+
+    Args:
+        mm: Memory-mapped file (or bytes) to split
+        n_ranges: Desired number of ranges
+
+    Returns:
+        Contiguous (start, end) offsets covering the whole buffer
+    """
+    size = len(mm)
+    step = max(1, -(-size // n_ranges))
+    boundaries = [0]
+    for target in range(step, size, step):
+        if target <= boundaries[-1]:
+            continue
+        newline = mm.find(b"\n", target - 1)
+        if newline == -1:
+            break
+        if newline + 1 < size:
+            boundaries.append(newline + 1)
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _parse_range(
+    file_path: Path, start: int, end: int, categorical: bool, read_filter: ReadFilter
+) -> pd.DataFrame:
+    """Parse the JSON lines in one byte range into a DataFrame."""
+    with (
+        open(file_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        lines = mm[start:end].splitlines()
+    records = (json.loads(line) for line in lines if line.strip())
+    return records_to_frame(list(read_filter.filter_records(records)), categorical)
+
+
+def load_jsonl_parallel(
+    file_path: str | Path,
+    workers: int,
+    categorical: bool = False,
+    read_filter: ReadFilter | None = None,
+) -> pd.DataFrame:
+    """Load a JSON Lines file by parsing newline-aligned ranges in parallel.
+
+    The file is memory-mapped to find range boundaries without reading
+    it into the parent process; each worker maps and parses its own range.
+
+    Args:
+        file_path: Path to JSONL file
+        workers: Number of worker processes
+        categorical: Dictionary-encode identifier columns as categoricals
+        read_filter: Projection and predicates applied in the workers
+
+    Returns:
+        DataFrame with records in file order
+    """
+    file_path = Path(file_path)
+    if file_path.stat().st_size == 0:
+        return pd.DataFrame()
+
+    with (
+        open(file_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        ranges = split_ranges(mm, workers * RANGES_PER_WORKER)
+
+    read_filter = read_filter or ReadFilter()
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        frames = list(
+            pool.map(
+                _parse_range,
+                repeat(file_path),
+                starts,
+                ends,
+                repeat(categorical),
+                repeat(read_filter),
+            )
+        )
+
+    return concat_chunks([frame for frame in frames if len(frame)])
@@ -0,0 +1,256 @@
+"""Receive newline-delimited JSON readings over UDP or TCP."""
+
+from collections.abc import Iterable, Iterator, Sequence
+import json
+import selectors
+import socket
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+import pandas as pd
+
+from .columns import records_to_frame
+from .filters import ReadFilter, TimeRange
+from .source_base import SensorSource
+
+
+# Largest UDP payload; also the TCP receive size
+_RECV_SIZE = 65535
+
+# Default cap on the length of one reading line
+DEFAULT_MAX_LINE_BYTES = 1 << 20
+
+
+class SocketSource(SensorSource):
+    """Micro-batch NDJSON readings pushed by gateways over a socket.
+
+    UDP datagrams may carry one or more newline-separated readings; TCP
+    clients stream readings over long-lived connections and may split a
+    line across packets. Readings are buffered in memory and released as a
+    batch once max_batch_rows have arrived or max_latency seconds have
+    passed since the first reading of the batch. Lines that are not valid
+    JSON objects, or longer than max_line_bytes, are counted in `malformed`
+    and dropped, so one bad sender cannot stop the stream. The cap also
+    bounds the memory buffered for a TCP client that never sends a newline:
+    the rest of an overlong line is discarded as it arrives.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        protocol: str = "udp",
+        max_batch_rows: int = 10_000,
+        max_latency: float = 0.5,
+        categorical: bool = False,
+        max_line_bytes: int = DEFAULT_MAX_LINE_BYTES,
+    ):
+        """Bind the listening socket.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port, see `address`)
+            protocol: "udp" or "tcp"
+            max_batch_rows: Release a batch once it holds this many readings
+            max_latency: Release a batch this many seconds after its first
+                reading arrived
+            categorical: Dictionary-encode identifier columns as categoricals
+            max_line_bytes: Longest reading line accepted, in bytes
+
+        Raises:
+            ValueError: If the protocol is not "udp" or "tcp"
+        """
+        if protocol not in ("udp", "tcp"):
+            raise ValueError(f"Unsupported socket protocol: {protocol}")
+        self.protocol = protocol
+        self.max_batch_rows = max_batch_rows
+        self.max_latency = max_latency
+        self.categorical = categorical
+        self.max_line_bytes = max_line_bytes
+        self.malformed = 0
+        self._pending: list[dict[str, Any]] = []
+        self._buffers: dict[socket.socket, bytes] = {}
+        # TCP clients in the middle of an overlong line, skipped to its end
+        self._discarding: set[socket.socket] = set()
+        self._selector = selectors.DefaultSelector()
+
+        kind = socket.SOCK_DGRAM if protocol == "udp" else socket.SOCK_STREAM
+        self._socket = socket.socket(socket.AF_INET, kind)
+        if protocol == "tcp":
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, port))
+        if protocol == "tcp":
+            self._socket.listen()
+        self._socket.setblocking(False)
+        self._selector.register(self._socket, selectors.EVENT_READ)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "SocketSource":
+        """Create a source from a udp://host:port or tcp://host:port URL.
+
+        Args:
+            url: Listening address as a URL
+            **kwargs: Further SocketSource arguments
+
+        Returns:
+            Bound SocketSource
+        """
+        parts = urlsplit(url)
+        return cls(
+            parts.hostname or "0.0.0.0",
+            parts.port or 0,
+            protocol=parts.scheme,
+            **kwargs,
+        )
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Bound (host, port) of the listening socket."""
+        host, port = self._socket.getsockname()[:2]
+        return host, port
+
+    @property
+    def url(self) -> str:
+        """Listening address as a URL."""
+        host, port = self.address
+        return f"{self.protocol}://{host}:{port}"
+
+    def load(
+        self,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> pd.DataFrame:
+        """Receive one micro-batch.
+
+        Waits at most max_latency for a first reading, then at most
+        max_latency more for the batch to fill.
+
+        Args:
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            DataFrame with received sensor readings (empty if none arrived)
+        """
+        read_filter = ReadFilter(columns, mesh_ids, time_range)
+        records, self._pending = self._pending, []
+        deadline = time.monotonic() + self.max_latency
+        started = bool(records)
+
+        while len(records) < self.max_batch_rows:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            for key, _ in self._selector.select(timeout):
+                self._receive(key.fileobj, records)  # type: ignore[arg-type]
+            if records and not started:
+                # The latency bound runs from the first reading of the batch
+                started = True
+                deadline = time.monotonic() + self.max_latency
+
+        records, self._pending = (
+            records[: self.max_batch_rows],
+            records[self.max_batch_rows :],
+        )
+        return records_to_frame(
+            list(read_filter.filter_records(records)), self.categorical
+        )
+
+    def iter_batches(
+        self,
+        stop: threading.Event | None = None,
+        max_batches: int | None = None,
+        **filters: Any,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield micro-batches as readings arrive.
+
+        Args:
+            stop: Event that ends iteration when set
+            max_batches: Stop after this many non-empty batches
+            **filters: Projection and predicates passed to load()
+
+        Returns:
+            Iterator of non-empty DataFrames
+        """
+        stop = stop or threading.Event()
+        batches = 0
+        while not stop.is_set() and (max_batches is None or batches < max_batches):
+            df = self.load(**filters)
+            if len(df) == 0:
+                continue
+            yield df
+            batches += 1
+
+    def close(self) -> None:
+        """Close the listening socket and any client connections."""
+        for sock in list(self._buffers):
+            self._disconnect(sock)
+        self._selector.close()
+        self._socket.close()
+
+    def _receive(self, sock: socket.socket, records: list[dict[str, Any]]) -> None:
+        """Handle one readable socket, appending parsed readings."""
+        if self.protocol == "udp":
+            data = sock.recv(_RECV_SIZE)
+            # A datagram is complete, so a trailing unterminated line counts
+            self._parse_lines(data.splitlines(), records)
+        elif sock is self._socket:
+            client, _ = sock.accept()
+            client.setblocking(False)
+            self._buffers[client] = b""
+            self._selector.register(client, selectors.EVENT_READ)
+        else:
+            try:
+                data = sock.recv(_RECV_SIZE)
+            except ConnectionError:
+                data = b""
+            buffer = self._buffers[sock] + data
+            if not data:
+                # Client closed; its unterminated last line is complete
+                self._parse_lines(buffer.splitlines(), records)
+                self._disconnect(sock)
+                return
+            end = buffer.rfind(b"\n") + 1
+            lines, rest = buffer[:end].splitlines(), buffer[end:]
+            if sock in self._discarding:
+                if not end:
+                    # Still inside the overlong line, already counted
+                    return
+                # Drop the tail of the overlong line
+                self._discarding.discard(sock)
+                lines = lines[1:]
+            if len(rest) > self.max_line_bytes:
+                self.malformed += 1
+                self._discarding.add(sock)
+                rest = b""
+            self._buffers[sock] = rest
+            self._parse_lines(lines, records)
+
+    def _parse_lines(self, lines: list[bytes], records: list[dict[str, Any]]) -> None:
+        """Parse NDJSON lines, counting and skipping malformed ones."""
+        for line in lines:
+            if not line.strip():
+                continue
+            if len(line) > self.max_line_bytes:
+                self.malformed += 1
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                self.malformed += 1
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+            else:
+                self.malformed += 1
+
+    def _disconnect(self, sock: socket.socket) -> None:
+        """Forget and close a TCP client connection."""
+        self._selector.unregister(sock)
+        del self._buffers[sock]
+        self._discarding.discard(sock)
+        sock.close()
@@ -1,17 +1,117 @@
 """Abstract base class for sensor data sources."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
 import pandas as pd
 
+from .filters import TimeRange
+
+
+# Default number of readings per chunk for streaming reads
+DEFAULT_ROWS_PER_CHUNK = 100_000
+
 
 class SensorSource(ABC):
     """Abstract base class for sensor data sources."""
 
     @abstractmethod
-    def load(self) -> pd.DataFrame:
+    def load(
+        self,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> pd.DataFrame:
         """Load sensor data and return as DataFrame.
 
+        Sources apply the projection and predicates while reading where
+        they can, so filtered-out readings are never materialized.
+
+        Args:
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
         Returns:
             DataFrame with sensor readings
         """
         pass
+
+    def iter_chunks(
+        self,
+        rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield sensor data as bounded-size DataFrames.
+
+        The default implementation slices the result of load(). Sources
+        that can read incrementally override this to keep memory flat.
+
+        Args:
+            rows_per_chunk: Maximum number of readings per chunk
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            Iterator of DataFrames with at most rows_per_chunk readings
+
+        Raises:
+            ValueError: If rows_per_chunk is not positive
+        """
+        check_rows_per_chunk(rows_per_chunk)
+        df = self.load(columns=columns, mesh_ids=mesh_ids, time_range=time_range)
+        return (
+            df.iloc[start : start + rows_per_chunk]
+            for start in range(0, len(df), rows_per_chunk)
+        )
+
+
+def check_rows_per_chunk(rows_per_chunk: int) -> None:
+    """Validate a chunk size argument.
+
+    Args:
+        rows_per_chunk: Requested number of readings per chunk
+
+    Raises:
+        ValueError: If rows_per_chunk is not positive
+    """
+    if rows_per_chunk < 1:
+        raise ValueError(f"rows_per_chunk must be positive, got {rows_per_chunk}")
+
+
+def concat_chunks(chunks: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate chunks produced by iter_chunks() into one DataFrame.
+
+    Categorical columns are recoded onto the union of their categories
+    first, so they stay categorical instead of decaying to object dtype.
+
+    Args:
+        chunks: DataFrames in read order
+
+    Returns:
+        Single DataFrame with a fresh RangeIndex
+    """
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+
+    for name in chunks[0].columns:
+        columns = [chunk[name] for chunk in chunks if name in chunk]
+        if len(columns) < len(chunks) or not all(
+            isinstance(column.dtype, pd.CategoricalDtype) for column in columns
+        ):
+            continue
+        categories = pd.Index(
+            sorted(set().union(*(column.cat.categories for column in columns)))
+        )
+        chunks = [
+            chunk.assign(**{name: chunk[name].cat.set_categories(categories)})
+            for chunk in chunks
+        ]
+
+    return pd.concat(chunks, ignore_index=True)
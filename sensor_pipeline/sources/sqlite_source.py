@@ -0,0 +1,193 @@
+"""SQLite-backed sensor data source."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from pathlib import Path
+import sqlite3
+import pandas as pd
+
+from .columns import columns_to_frame
+from .filters import ReadFilter, TimeRange
+from .source_base import (
+    DEFAULT_ROWS_PER_CHUNK,
+    SensorSource,
+    check_rows_per_chunk,
+    concat_chunks,
+)
+
+
+# Widest UTC offset in use; text bounds are widened by this much so that
+# readings stored with a non-UTC offset are not excluded by the SQL range
+_MAX_UTC_OFFSET = timedelta(hours=14)
+
+
+class SqliteSource(SensorSource):
+    """Load sensor data from a table in a local SQLite database.
+
+    Mesh and time filters are pushed into the SQL WHERE clause so an index
+    on (mesh_id, timestamp) or (timestamp) can serve them; rows are fetched
+    in batches with fetchmany() and turned into DataFrames column-wise.
+    Timestamps are expected as ISO-8601 text ("YYYY-MM-DDTHH:MM:SS...").
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        table: str = "readings",
+        categorical: bool = False,
+    ):
+        """Initialize with database path and table name.
+
+        Args:
+            db_path: Path to SQLite database file
+            table: Table holding one row per sensor reading
+            categorical: Dictionary-encode identifier columns as categoricals
+        """
+        self.db_path = Path(db_path)
+        self.table = table
+        self.categorical = categorical
+
+    def load(
+        self,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> pd.DataFrame:
+        """Load matching readings from the table.
+
+        Args:
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            DataFrame with sensor readings
+
+        Raises:
+            FileNotFoundError: If the database file doesn't exist
+        """
+        return concat_chunks(
+            list(
+                self.iter_chunks(DEFAULT_ROWS_PER_CHUNK, columns, mesh_ids, time_range)
+            )
+        )
+
+    def iter_chunks(
+        self,
+        rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream matching readings in fetchmany() batches.
+
+        Args:
+            rows_per_chunk: Maximum number of rows fetched per chunk
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            Iterator of DataFrames with at most rows_per_chunk readings
+
+        Raises:
+            FileNotFoundError: If the database file doesn't exist
+            ValueError: If rows_per_chunk is not positive
+        """
+        check_rows_per_chunk(rows_per_chunk)
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"File not found: {self.db_path}")
+
+        read_filter = ReadFilter(columns, mesh_ids, time_range)
+        query, params = self.build_query(read_filter)
+        return self._fetch(query, params, rows_per_chunk, read_filter)
+
+    def build_query(self, read_filter: ReadFilter) -> tuple[str, list[str]]:
+        """Translate a filter into a parameterized SELECT statement.
+
+        Args:
+            read_filter: Projection and predicates to push down
+
+        Returns:
+            Tuple of (SQL text, parameters)
+        """
+        select = "*"
+        if read_filter.columns is not None:
+            names = list(read_filter.columns)
+            # Needed for the exact time check after the widened SQL range
+            if read_filter.start is not None or read_filter.end is not None:
+                names.append("timestamp")
+            select = ", ".join(_quote(name) for name in dict.fromkeys(names))
+
+        clauses: list[str] = []
+        params: list[str] = []
+        if read_filter.mesh_ids is not None:
+            mesh_ids = sorted(read_filter.mesh_ids)
+            clauses.append(f"mesh_id IN ({', '.join('?' * len(mesh_ids))})")
+            params.extend(mesh_ids)
+        if read_filter.start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(_text_bound(read_filter.start - _MAX_UTC_OFFSET))
+        if read_filter.end is not None:
+            clauses.append("timestamp < ?")
+            params.append(_text_bound(read_filter.end + _MAX_UTC_OFFSET))
+
+        query = f"SELECT {select} FROM {_quote(self.table)}"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        return query, params
+
+    def create_indexes(self) -> None:
+        """Create the indexes used by mesh and time-range queries."""
+        table = _quote(self.table)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {_quote(self.table + '_mesh_time')} "
+                f"ON {table} (mesh_id, timestamp)"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {_quote(self.table + '_time')} "
+                f"ON {table} (timestamp)"
+            )
+
+    def _fetch(
+        self,
+        query: str,
+        params: list[str],
+        rows_per_chunk: int,
+        read_filter: ReadFilter,
+    ) -> Iterator[pd.DataFrame]:
+        """Run the query and yield one DataFrame per fetchmany() batch."""
+        # Mesh filtering is done by SQL; only the exact time check remains
+        exact_filter = ReadFilter(
+            columns=read_filter.columns,
+            time_range=(read_filter.start, read_filter.end),
+        )
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        try:
+            cursor = conn.execute(query, params)
+            names = [description[0] for description in cursor.description]
+            while rows := cursor.fetchmany(rows_per_chunk):
+                data = {
+                    name: list(values)
+                    for name, values in zip(names, zip(*rows), strict=True)
+                }
+                chunk = columns_to_frame(data, len(rows), self.categorical)
+                chunk = exact_filter.filter_frame(chunk)
+                if len(chunk):
+                    yield chunk
+        finally:
+            conn.close()
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _text_bound(value: datetime) -> str:
+    """Format a UTC bound for lexicographic comparison with ISO text."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S")
@@ -0,0 +1,181 @@
+"""Follow a continuously growing JSON Lines file."""
+
+from collections.abc import Iterable, Iterator, Sequence
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any, BinaryIO
+import pandas as pd
+
+from .columns import records_to_frame
+from .filters import ReadFilter, TimeRange
+from .source_base import SensorSource
+
+
+# Upper bound on bytes consumed per poll, so a backlog arrives in pieces
+DEFAULT_MAX_BATCH_BYTES = 64 << 20
+
+
+class TailFileSource(SensorSource):
+    """Yield records appended to a JSONL file since the last read.
+
+    The source remembers the byte offset of the last complete line it
+    returned. A file that shrinks below that offset is treated as
+    truncated and re-read from the start; a file replaced at the same path
+    (log rotation) is drained to its end before switching to the new file.
+    Offsets can be persisted so a restarted process resumes where it
+    stopped, together with `extra_state`, any JSON-serializable state of
+    the consumer that must match the offset (e.g. running totals).
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        poll_interval: float = 1.0,
+        state_path: str | Path | None = None,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    ):
+        """Initialize with file path.
+
+        Args:
+            file_path: Path to JSONL file being appended to
+            poll_interval: Seconds to wait between polls when idle
+            state_path: JSON file used to persist the read offset
+            max_batch_bytes: Approximate maximum bytes read per poll
+        """
+        self.file_path = Path(file_path)
+        self.poll_interval = poll_interval
+        self.state_path = Path(state_path) if state_path is not None else None
+        self.max_batch_bytes = max_batch_bytes
+        self.offset = 0
+        self.inode: int | None = None
+        self.extra_state: dict[str, Any] = {}
+        self._handle: BinaryIO | None = None
+
+        if self.state_path is not None and self.state_path.exists():
+            state = json.loads(self.state_path.read_text())
+            self.offset = state["offset"]
+            self.inode = state["inode"]
+            self.extra_state = state.get("extra", {})
+
+    def load(
+        self,
+        columns: Sequence[str] | None = None,
+        mesh_ids: Iterable[str] | None = None,
+        time_range: TimeRange | None = None,
+    ) -> pd.DataFrame:
+        """Read the records appended since the previous call.
+
+        Args:
+            columns: Only return these columns
+            mesh_ids: Only return readings from these meshes
+            time_range: Only return readings with start <= timestamp < end;
+                either bound may be None
+
+        Returns:
+            DataFrame with new sensor readings (empty if nothing new)
+        """
+        read_filter = ReadFilter(columns, mesh_ids, time_range)
+        lines = self._poll_lines()
+        records = (json.loads(line) for line in lines if line.strip())
+        return records_to_frame(list(read_filter.filter_records(records)))
+
+    def iter_batches(
+        self,
+        stop: threading.Event | None = None,
+        max_batches: int | None = None,
+        **filters: Any,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield micro-batches of new records as the file grows.
+
+        The offset and extra_state are saved to state_path when the next
+        batch is requested, so a batch whose processing crashes is re-read
+        after a restart. Update extra_state while processing a batch to
+        save it with the offset past that batch.
+
+        Args:
+            stop: Event that ends iteration when set
+            max_batches: Stop after this many non-empty batches
+            **filters: Projection and predicates passed to load()
+
+        Returns:
+            Iterator of non-empty DataFrames
+        """
+        stop = stop or threading.Event()
+        batches = 0
+        while not stop.is_set() and (max_batches is None or batches < max_batches):
+            df = self.load(**filters)
+            if len(df) == 0:
+                stop.wait(self.poll_interval)
+                continue
+            yield df
+            batches += 1
+            self.save_state()
+
+    def save_state(self) -> None:
+        """Persist the offset, file identity and extra_state to state_path."""
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        state = {"offset": self.offset, "inode": self.inode, "extra": self.extra_state}
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, self.state_path)
+
+    def close(self) -> None:
+        """Close the underlying file handle."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _poll_lines(self) -> list[bytes]:
+        """Return complete lines appended since the last poll."""
+        if self._handle is None and not self._open():
+            return []
+        lines = self._read_complete_lines()
+
+        try:
+            current_inode = os.stat(self.file_path).st_ino
+        except FileNotFoundError:
+            # Rotated away and not yet recreated; keep the old handle
+            return lines
+
+        if current_inode != self.inode:
+            # Rotation: old file is drained, continue with the new one
+            self.close()
+            if self._open():
+                lines.extend(self._read_complete_lines())
+        return lines
+
+    def _open(self) -> bool:
+        """Open the file at file_path, resetting the offset for a new file."""
+        try:
+            self._handle = open(self.file_path, "rb")
+        except FileNotFoundError:
+            return False
+        inode = os.fstat(self._handle.fileno()).st_ino
+        if inode != self.inode:
+            self.offset = 0
+            self.inode = inode
+        return True
+
+    def _read_complete_lines(self) -> list[bytes]:
+        """Read whole lines after the offset and advance past them."""
+        assert self._handle is not None
+        if os.fstat(self._handle.fileno()).st_size < self.offset:
+            # Truncated in place
+            self.offset = 0
+
+        self._handle.seek(self.offset)
+        data = self._handle.read(self.max_batch_bytes)
+        # Keep reading while a single line is longer than one batch
+        while data and b"\n" not in data:
+            more = self._handle.read(self.max_batch_bytes)
+            if not more:
+                break
+            data += more
+
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+        return data[:end].splitlines()
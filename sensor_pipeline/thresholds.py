@@ -0,0 +1,184 @@
+"""Per-mesh and per-device anomaly thresholds."""
+
+from pathlib import Path
+import json
+import numpy as np
+import pandas as pd
+
+from .models import PipelineConfig, ThresholdOverride
+
+
+# Threshold fields shared by PipelineConfig and ThresholdOverride
+LIMITS = ("temp_low", "temp_high", "hum_low", "hum_high")
+
+
+def load_threshold_table(path: str | Path) -> list[ThresholdOverride]:
+    """Read threshold overrides from a JSON or CSV file.
+
+    JSON files hold a list of objects; CSV files one override per row.
+    Both use the ThresholdOverride field names, and empty or missing
+    limits inherit the less specific thresholds.
+
+    Args:
+        path: JSON or .csv file
+
+    Returns:
+        Threshold overrides in file order
+
+    Raises:
+        pydantic.ValidationError: If an entry is not a valid override
+    """
+    path = Path(path)
+    if path.suffix == ".csv":
+        table = pd.read_csv(path, dtype={"mesh_id": str, "device_id": str})
+        records = [
+            {key: value for key, value in row.items() if pd.notna(value)}
+            for row in table.to_dict("records")
+        ]
+    else:
+        records = json.loads(path.read_text())
+    return [ThresholdOverride.model_validate(record) for record in records]
+
+
+def resolve_thresholds(
+    df: pd.DataFrame, config: PipelineConfig
+) -> dict[str, float | np.ndarray]:
+    """Work out the anomaly thresholds that apply to each reading.
+
+    Overrides are matched through the codes of the mesh_id and device_id
+    columns (categorical codes, or factorized values otherwise): each
+    limit is looked up in a small per-mesh or per-device table and
+    gathered to the rows in one vectorized step.
+
+    Args:
+        df: Readings with 'mesh_id' and 'device_id' columns (only needed
+            for the keys the overrides use)
+        config: Pipeline configuration with global thresholds and overrides
+
+    Returns:
+        Mapping of limit name to the global value, if there are no
+        overrides, or else to an array with one value per row
+    """
+    limits: dict[str, float | np.ndarray] = {
+        name: getattr(config, name) for name in LIMITS
+    }
+    if not config.thresholds:
+        return limits
+
+    rows = {
+        name: np.full(len(df), value, dtype=np.float64)
+        for name, value in limits.items()
+    }
+    by_mesh = [t for t in config.thresholds if t.device_id is None]
+    by_device = [t for t in config.thresholds if t.mesh_id is None]
+    by_pair = [
+        t
+        for t in config.thresholds
+        if t.mesh_id is not None and t.device_id is not None
+    ]
+
+    # Key codes, each column factorized at most once
+    column_codes: dict[str, tuple[np.ndarray, pd.Index]] = {}
+
+    def codes_of(column: str) -> tuple[np.ndarray, pd.Index]:
+        if column not in column_codes:
+            column_codes[column] = _codes(df[column])
+        return column_codes[column]
+
+    # Least specific first, so more specific overrides win
+    if by_mesh:
+        codes, keys = codes_of("mesh_id")
+        targets = keys.get_indexer(pd.Index([t.mesh_id for t in by_mesh]))
+        _apply(rows, codes, targets, by_mesh)
+    if by_device:
+        codes, keys = codes_of("device_id")
+        targets = keys.get_indexer(pd.Index([t.device_id for t in by_device]))
+        _apply(rows, codes, targets, by_device)
+    if by_pair:
+        mesh_codes, mesh_keys = codes_of("mesh_id")
+        device_codes, device_keys = codes_of("device_id")
+        # One code per (mesh, device) combination; -1 where either is unknown.
+        # Categorical codes may be int8/int16, so widen before combining
+        width = len(device_keys)
+        pair_codes = np.where(
+            (mesh_codes < 0) | (device_codes < 0),
+            -1,
+            mesh_codes.astype(np.int64) * width + device_codes,
+        )
+        mesh_targets = mesh_keys.get_indexer(pd.Index([t.mesh_id for t in by_pair]))
+        device_targets = device_keys.get_indexer(
+            pd.Index([t.device_id for t in by_pair])
+        )
+        targets = np.where(
+            (mesh_targets < 0) | (device_targets < 0),
+            -1,
+            mesh_targets * width + device_targets,
+        )
+        _apply_sparse(rows, pair_codes, targets, by_pair)
+    return dict(rows)
+
+
+def _codes(keys: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """Integer code per row (-1 for missing) and the distinct keys."""
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        return keys.cat.codes.to_numpy(), keys.cat.categories
+    codes, uniques = pd.factorize(keys)
+    return codes, pd.Index(uniques)
+
+
+def _apply(
+    rows: dict[str, np.ndarray],
+    codes: np.ndarray,
+    targets: np.ndarray,
+    overrides: list[ThresholdOverride],
+) -> None:
+    """Overwrite row limits from overrides keyed by a dense code.
+
+    targets holds each override's code (-1 if no row has its key). For
+    every limit some override sets, a per-code table with NaN for "no
+    override" is gathered by row code.
+    """
+    size = int(max(codes.max(initial=-1), targets.max(initial=-1))) + 2
+    for name in LIMITS:
+        entries = [
+            (target, value)
+            for target, override in zip(targets, overrides)
+            if target >= 0 and (value := getattr(override, name)) is not None
+        ]
+        if not entries:
+            continue
+        # The last slot, reached by code -1, stays NaN
+        table = np.full(size, np.nan)
+        for target, value in entries:
+            table[target] = value
+        gathered = table[codes]
+        np.copyto(rows[name], gathered, where=~np.isnan(gathered))
+
+
+def _apply_sparse(
+    rows: dict[str, np.ndarray],
+    codes: np.ndarray,
+    targets: np.ndarray,
+    overrides: list[ThresholdOverride],
+) -> None:
+    """Overwrite row limits from overrides keyed by a sparse code.
+
+    Pair codes can be too large for a dense table, so for every limit
+    some override sets, rows are matched to the sorted codes of those
+    overrides with a binary search instead.
+    """
+    present = targets >= 0
+    for name in LIMITS:
+        values = np.array(
+            [np.nan if (v := getattr(o, name)) is None else v for o in overrides]
+        )
+        setting = np.flatnonzero(present & ~np.isnan(values))
+        if len(setting) == 0:
+            continue
+        order = setting[np.argsort(targets[setting], kind="stable")]
+        keys = targets[order]
+
+        # Last match, so later entries for the same pair win as in _apply
+        position = np.maximum(np.searchsorted(keys, codes, side="right") - 1, 0)
+        hit = keys[position] == codes
+        rows[name][hit] = values[order][position[hit]]
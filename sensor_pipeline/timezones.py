@@ -0,0 +1,111 @@
+"""Vectorized UTC to local time conversion using offset transition tables."""
+
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+
+# Offset changes are located on this grid first, then refined to the minute;
+# no zone keeps an offset for less than a quarter hour
+_SCAN_STEP = "15min"
+
+_NAT = np.iinfo(np.int64).min
+
+
+@lru_cache(maxsize=256)
+def transition_table(
+    tz: str, first_year: int, last_year: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build the UTC offset transitions of a time zone over some years.
+
+    Tables are cached, so each zone and year span is computed once per
+    process.
+
+    Args:
+        tz: IANA time zone name (e.g. "America/New_York")
+        first_year: First calendar year (UTC) to cover
+        last_year: Last calendar year (UTC) to cover
+
+    Returns:
+        Tuple of (sorted UTC instants in ns since the epoch at which an
+        offset starts, the first being the minimum int64; offset in ns in
+        effect from each instant)
+    """
+    start = pd.Timestamp(year=first_year, month=1, day=1, tz="UTC")
+    end = pd.Timestamp(year=last_year + 1, month=1, day=1, tz="UTC")
+    grid = pd.date_range(start - pd.Timedelta(days=1), end, freq=_SCAN_STEP)
+    offsets = _offsets(grid, tz)
+
+    instants = [_NAT]
+    values = [offsets[0]]
+    for i in (np.flatnonzero(np.diff(offsets)) + 1).tolist():
+        minutes = pd.date_range(grid[i - 1], grid[i], freq="min")
+        minute_offsets = _offsets(minutes, tz)
+        first = np.flatnonzero(minute_offsets != offsets[i - 1])[0]
+        instants.append(minutes[int(first)].value)
+        values.append(minute_offsets[first])
+    return np.array(instants, dtype=np.int64), np.array(values, dtype=np.int64)
+
+
+def _offsets(instants: pd.DatetimeIndex, tz: str) -> np.ndarray:
+    """UTC offsets in ns of a zone at UTC instants."""
+    local = instants.tz_convert(tz).tz_localize(None).to_numpy()
+    return (local - instants.tz_localize(None).to_numpy()).view(np.int64)
+
+
+def utc_offsets(utc: np.ndarray, tz: str) -> np.ndarray:
+    """Look up the UTC offset in effect at each instant.
+
+    Args:
+        utc: UTC instants as int64 ns since the epoch (NaT allowed)
+        tz: IANA time zone name
+
+    Returns:
+        Offsets in ns, zero for NaT
+    """
+    valid = utc != _NAT
+    if not valid.any():
+        return np.zeros(len(utc), dtype=np.int64)
+    bounds = utc[valid]
+    span = np.array([bounds.min(), bounds.max()]).astype("datetime64[ns]")
+    first_year, last_year = (
+        span.astype("datetime64[Y]").astype(np.int64) + 1970
+    ).tolist()
+    instants, offsets = transition_table(tz, first_year, last_year)
+    result = offsets[np.searchsorted(instants, utc, side="right") - 1]
+    result[~valid] = 0
+    return result
+
+
+def local_time(timestamps: pd.Series, zones: str | pd.Series) -> pd.Series:
+    """Convert UTC timestamps to local wall-clock time.
+
+    Unlike tz_convert, each row may use a different zone, so the result is
+    naive (local time without a zone attached).
+
+    Args:
+        timestamps: UTC-aware (or naive UTC) timestamps
+        zones: One IANA zone name for every row, or a per-row Series of
+            zone names (categorical for speed)
+
+    Returns:
+        Naive local times with the same index
+    """
+    # UTC instants, without copying ns-resolution columns
+    values = timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+    if isinstance(zones, str):
+        offsets = utc_offsets(values, zones)
+    else:
+        zones = zones.astype("category")
+        zone_codes = zones.cat.codes.to_numpy()
+        offsets = np.zeros(len(values), dtype=np.int64)
+        for code, tz in enumerate(zones.cat.categories):
+            rows = zone_codes == code
+            if rows.any():
+                offsets[rows] = utc_offsets(values[rows], tz)
+
+    local = np.where(values == _NAT, _NAT, values + offsets)
+    return pd.Series(
+        local.view("datetime64[ns]"), index=timestamps.index, name=timestamps.name
+    )
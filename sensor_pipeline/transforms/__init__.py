@@ -1,17 +1,28 @@
 """Transform classes for sensor pipeline."""
 
-from .validate_schema import ValidateSchema
+from .validate_schema import BoundedSchemaErrors, ValidateSchema
 from .convert_timestamp import ConvertTimestamp
 from .convert_temperature import ConvertTemperature
 from .detect_anomalies import DetectAnomalies
+from .derive_readings import DeriveReadings
+from .detect_sensor_faults import DetectSensorFaults
+from .detect_drift import DetectDrift
+from .apply_rules import ApplyRules
+from .pack_alerts import PackAlerts
 from .deduplicate_readings import DeduplicateReadings
 from .aggregate_mesh import AggregateMesh
 
 __all__ = [
     "ValidateSchema",
+    "BoundedSchemaErrors",
     "ConvertTimestamp",
     "ConvertTemperature",
     "DetectAnomalies",
+    "DeriveReadings",
+    "DetectSensorFaults",
+    "DetectDrift",
+    "ApplyRules",
+    "PackAlerts",
     "DeduplicateReadings",
     "AggregateMesh",
 ]
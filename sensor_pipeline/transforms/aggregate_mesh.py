@@ -1,22 +1,73 @@
 """Aggregate sensor readings by mesh network."""
 
+from typing import Any
+import numpy as np
 import pandas as pd
 
+from ..alert_flags import FLAGS_COLUMN, count_flags, flag_bits
+
+
+# Alert columns added by DetectAnomalies, always counted
+ALERT_COUNTS = {
+    "temperature_alert": "temperature_anomaly_count",
+    "humidity_alert": "humidity_anomaly_count",
+    "status_alert": "status_anomaly_count",
+}
+
+# Averaged reading columns, by summary column
+AVERAGES = {
+    "avg_temperature_c": "temperature_c",
+    "avg_temperature_f": "temperature_f",
+    "avg_humidity": "humidity",
+}
+
+# Alert columns added by optional steps, counted only when present
+OPTIONAL_ALERT_COUNTS = {
+    "rate_alert": "rate_anomaly_count",
+    "stuck_alert": "stuck_anomaly_count",
+    "drift_alert": "drift_anomaly_count",
+}
+
 
 class AggregateMesh:
-    """Aggregate readings by mesh network."""
+    """Aggregate readings by mesh network.
+
+    With cumulative=True the transform keeps per-mesh sums and counts
+    between calls, and each call returns summaries over every reading seen
+    so far, for micro-batches of a live source. dump_totals() and
+    load_totals() carry them over to a restarted process.
+    """
+
+    def __init__(
+        self, alert_counts: dict[str, str] | None = None, cumulative: bool = False
+    ):
+        """Initialize with extra alert columns to count.
+
+        Args:
+            alert_counts: Alert column to per-mesh count column, e.g. for
+                anomaly rules; counted like OPTIONAL_ALERT_COUNTS
+            cumulative: Summarize all readings passed so far instead of
+                only those of the current call
+        """
+        self.alert_counts = {**OPTIONAL_ALERT_COUNTS, **(alert_counts or {})}
+        self.cumulative = cumulative
+        # Per-mesh sums and counts of earlier calls (cumulative only)
+        self.totals: pd.DataFrame | None = None
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Aggregate sensor readings by mesh_id.
 
         Args:
             df: DataFrame with processed sensor readings including is_healthy
+                (and optional alert columns, counted if present)
 
         Returns:
             DataFrame with mesh-level aggregations
         """
         # Handle empty dataframe case
         if len(df) == 0:
+            if self.totals is not None:
+                return _summarize(self.totals)
             return pd.DataFrame(
                 columns=[
                     "mesh_id",
@@ -31,28 +82,125 @@ class AggregateMesh:
                 ]
             )
 
-        # Group by mesh_id and aggregate
-        grouped = (
-            df.groupby("mesh_id")
-            .agg(
-                avg_temperature_c=("temperature_c", "mean"),
-                avg_temperature_f=("temperature_f", "mean"),
-                avg_humidity=("humidity", "mean"),
-                total_readings=("mesh_id", "count"),
-                temperature_anomaly_count=("temperature_alert", "sum"),
-                humidity_anomaly_count=("humidity_alert", "sum"),
-                status_anomaly_count=("status_alert", "sum"),
-                healthy_reading_count=("is_healthy", "sum"),
+        alert_counts = {**ALERT_COUNTS, **self.alert_counts}
+        # Packed alerts (see PackAlerts) are counted from the bits below
+        bits = flag_bits(df)
+
+        aggregations: dict[str, tuple[str, str]] = {}
+        for average, column in AVERAGES.items():
+            if self.cumulative:
+                # Sums and counts add up across calls, unlike means
+                aggregations[f"{column}_sum"] = (column, "sum")
+                aggregations[f"{column}_count"] = (column, "count")
+            else:
+                aggregations[average] = (column, "mean")
+        aggregations["total_readings"] = ("mesh_id", "count")
+        leading = list(aggregations)
+        if not bits:
+            aggregations["healthy_reading_count"] = ("is_healthy", "sum")
+        for alert, count in alert_counts.items():
+            if alert in df.columns:
+                aggregations[count] = (alert, "sum")
+
+        # Group by mesh_id and aggregate; observed=True skips categories
+        # of a categorical mesh_id that have no readings
+        by_mesh = df.groupby("mesh_id", observed=True)
+        grouped = by_mesh.agg(**aggregations).reset_index()
+
+        if bits:
+            # Number each reading's mesh in the order of the aggregated rows
+            mesh = df["mesh_id"]
+            if isinstance(mesh.dtype, pd.CategoricalDtype):
+                groups = _used_codes(mesh)
+            else:
+                groups = by_mesh.ngroup().to_numpy()
+            counts, healthy = count_flags(
+                df[FLAGS_COLUMN].to_numpy(), bits, groups, len(grouped)
             )
-            .reset_index()
+            for bit, alert in enumerate(bits):
+                if alert in alert_counts:
+                    grouped[alert_counts[alert]] = counts[:, bit]
+            grouped["healthy_reading_count"] = healthy
+            # Same column order as unpacked alerts
+            order = [count for count in alert_counts.values() if count in grouped]
+            grouped = grouped[["mesh_id", *leading, *order, "healthy_reading_count"]]
+
+        if self.cumulative:
+            grouped = grouped.set_index("mesh_id")
+            # Plain labels, so meshes align whatever categories each batch has
+            grouped.index = grouped.index.astype(object)
+            if self.totals is not None:
+                grouped = self.totals.add(grouped, fill_value=0).sort_index()
+                grouped = grouped.astype(self.totals.dtypes.to_dict())
+            self.totals = grouped
+            return _summarize(grouped)
+
+        return _finish(grouped)
+
+    def dump_totals(self) -> list[dict[str, Any]]:
+        """Return the per-mesh sums and counts as JSON-serializable records.
+
+        Returns:
+            One record per mesh (empty before the first cumulative call)
+        """
+        if self.totals is None:
+            return []
+        records = self.totals.reset_index().to_dict("records")
+        return [{str(key): value for key, value in r.items()} for r in records]
+
+    def load_totals(self, records: list[dict[str, Any]]) -> None:
+        """Restore per-mesh sums and counts saved with dump_totals().
+
+        Args:
+            records: Records from dump_totals(); empty leaves no totals
+        """
+        if not records:
+            self.totals = None
+            return
+        totals = pd.DataFrame.from_records(records).set_index("mesh_id")
+        totals.index = totals.index.astype(object)
+        self.totals = totals.astype(
+            {
+                column: np.float64 if column.endswith("_sum") else np.int64
+                for column in totals.columns
+            }
         )
 
-        # Calculate healthy reading percentage
-        grouped["healthy_reading_percentage"] = (
-            grouped["healthy_reading_count"] / grouped["total_readings"] * 100
-        ).round(1)
 
-        # Drop the intermediate count column
-        grouped = grouped.drop(columns=["healthy_reading_count"])
+def _summarize(totals: pd.DataFrame) -> pd.DataFrame:
+    """Turn per-mesh sums and counts (indexed by mesh_id) into summaries."""
+    grouped = totals.reset_index()
+    position = 1
+    for average, column in AVERAGES.items():
+        mean = grouped.pop(f"{column}_sum") / grouped.pop(f"{column}_count")
+        grouped.insert(position, average, mean)
+        position += 1
+    return _finish(grouped)
+
+
+def _finish(grouped: pd.DataFrame) -> pd.DataFrame:
+    """Replace healthy_reading_count by healthy_reading_percentage."""
+    # Calculate healthy reading percentage
+    grouped["healthy_reading_percentage"] = (
+        grouped["healthy_reading_count"] / grouped["total_readings"] * 100
+    ).round(1)
+
+    # Drop the intermediate count column
+    return grouped.drop(columns=["healthy_reading_count"])
+
+
+def _used_codes(mesh: pd.Series) -> np.ndarray:
+    """Number categorical meshes among the categories in use.
+
+    Matches the group order of groupby(observed=True), which ngroup() is
+    slow to compute for categorical keys.
+
+    Args:
+        mesh: Categorical mesh_id column without missing values
 
-        return grouped
+    Returns:
+        Group number per reading
+    """
+    codes = mesh.cat.codes.to_numpy()
+    used = np.bincount(codes, minlength=len(mesh.cat.categories)) > 0
+    return np.asarray((np.cumsum(used) - 1)[codes])
@@ -0,0 +1,47 @@
+"""Add alert columns from declarative anomaly rules."""
+
+import pandas as pd
+
+from ..derived import derived_columns, materialize
+from ..rules import RuleSet
+
+
+class ApplyRules:
+    """Evaluate configured anomaly rules into '<name>_alert' columns.
+
+    Rules are compiled once, when the transform is created (see
+    sensor_pipeline.rules.RuleSet).
+    """
+
+    def __init__(self, rules: dict[str, str]):
+        """Initialize with rules.
+
+        Args:
+            rules: Rule name to boolean expression over reading columns
+
+        Raises:
+            ValueError: If a rule is invalid
+        """
+        self.rule_set = RuleSet(rules)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Add one alert column per rule.
+
+        Args:
+            df: DataFrame with the columns the rules reference
+
+        Returns:
+            DataFrame with a boolean '<name>_alert' column per rule, and
+            the lazily derived columns the rules reference materialized
+
+        Raises:
+            ValueError: If a referenced column is missing
+        """
+        declared = derived_columns(df)
+        lazy = [column for column in self.rule_set.columns if column in declared]
+        if lazy:
+            df = materialize(df, lazy)
+
+        for name, mask in self.rule_set.evaluate(df).items():
+            df[f"{name}_alert"] = mask
+        return df
@@ -1,11 +1,65 @@
 """Convert timestamps from UTC to EST."""
 
+import numpy as np
 import pandas as pd
 from zoneinfo import ZoneInfo
 
+from ..derived import add_timezone_view
+from ..quarantine import Quarantine
+from ..timezones import local_time
+
+
+# Fixed five-hour west offset used for timestamp_est
+EST_TZ = "Etc/GMT+5"
+
+# UTC designators seen on incoming timestamps, longest first; "+00:00Z"
+# is a malformed mix of both forms produced by some devices
+UTC_SUFFIXES = ("+00:00Z", "+00:00", "Z")
+
 
 class ConvertTimestamp:
-    """Convert UTC timestamps to Eastern Standard Time."""
+    """Convert UTC timestamps to Eastern Standard Time.
+
+    String timestamps in the ISO layouts devices send (date, "T", time,
+    optional fraction, then a UTC suffix) are parsed by NumPy's vectorized
+    ISO-8601 parser. Anything else falls back to pandas' per-element mixed
+    format parsing. The number of rows that took each path is counted
+    across calls in `fast_rows` and `fallback_rows`.
+
+    When a local time zone is configured, a 'timestamp_local' column with
+    each reading's local wall-clock time (DST-aware, optionally per mesh)
+    is added as well.
+
+    With a quarantine, rows whose timestamp cannot be parsed are moved to
+    it as received, with a "timestamp: unparseable" error, instead of
+    failing the run.
+    """
+
+    def __init__(
+        self,
+        lazy: bool = False,
+        timezone: str | None = None,
+        mesh_timezones: dict[str, str] | None = None,
+        quarantine: Quarantine | None = None,
+    ) -> None:
+        """Initialize conversion options.
+
+        Args:
+            lazy: Declare 'timestamp_est' as a derived view of 'timestamp'
+                (see sensor_pipeline.derived) instead of adding the column;
+                it is only computed when a step or writer materializes it
+            timezone: IANA zone for 'timestamp_local' (UTC for meshes not
+                in mesh_timezones if None)
+            mesh_timezones: IANA zone per mesh_id for 'timestamp_local'
+            quarantine: Dead-letter sink for rows with unparseable
+                timestamps; without it they fail the run
+        """
+        self.lazy = lazy
+        self.timezone = timezone
+        self.mesh_timezones = mesh_timezones or {}
+        self.quarantine = quarantine
+        self.fast_rows = 0
+        self.fallback_rows = 0
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Convert timestamp column from UTC to EST.
@@ -14,20 +68,130 @@ class ConvertTimestamp:
             df: DataFrame with 'timestamp' column in UTC
 
         Returns:
-            DataFrame with additional 'timestamp_est' column
+            DataFrame with additional 'timestamp_est' column (declared
+            rather than added in lazy mode) and, if a local zone is
+            configured, 'timestamp_local'; without quarantined rows
+
+        Raises:
+            ValueError: If a timestamp cannot be parsed (without quarantine)
         """
         # Ensure timestamp is datetime and UTC-aware
         if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
-            # Clean up malformed timestamps that have both +00:00 and Z
-            df["timestamp"] = df["timestamp"].str.replace(r"\+00:00Z$", "Z", regex=True)
-            df["timestamp"] = pd.to_datetime(df["timestamp"], format="mixed")
+            parsed = self.parse(df["timestamp"])
+            unparseable = parsed.isna().to_numpy() & df["timestamp"].notna().to_numpy()
+            if self.quarantine is not None and unparseable.any():
+                self.quarantine.add(
+                    df[unparseable],
+                    [["timestamp: unparseable"]] * int(unparseable.sum()),
+                )
+                df = df[~unparseable].copy()
+                parsed = parsed[~unparseable]
+            df["timestamp"] = parsed
 
         # Make UTC-aware if not already
         if df["timestamp"].dt.tz is None:
             df["timestamp"] = df["timestamp"].dt.tz_localize("UTC")
 
+        if self.timezone is not None or self.mesh_timezones:
+            df["timestamp_local"] = local_time(df["timestamp"], self._zones(df))
+
+        if self.lazy:
+            add_timezone_view(df, "timestamp_est", "timestamp", EST_TZ)
+            return df
+
         # Convert to EST
-        est_tz = ZoneInfo("Etc/GMT+5")  # constant five-hour west offset
+        est_tz = ZoneInfo(EST_TZ)  # constant five-hour west offset
         df["timestamp_est"] = df["timestamp"].dt.tz_convert(est_tz)
 
         return df
+
+    def _zones(self, df: pd.DataFrame) -> str | pd.Series:
+        """Local zone of every row: one name, or a categorical per mesh."""
+        default = self.timezone or "UTC"
+        if not self.mesh_timezones:
+            return default
+
+        # Resolve zones per distinct mesh, then spread them over the rows
+        codes, meshes = pd.factorize(df["mesh_id"])
+        mesh_zones = [self.mesh_timezones.get(mesh, default) for mesh in meshes]
+        # A trailing default entry serves missing mesh_ids (code -1)
+        mesh_zones.append(default)
+        names = sorted(set(mesh_zones))
+        zone_codes = np.array([names.index(zone) for zone in mesh_zones], dtype=np.intp)
+        zones = pd.Categorical.from_codes(zone_codes[codes], categories=pd.Index(names))
+        return pd.Series(zones, index=df.index)
+
+    def parse(self, timestamps: pd.Series) -> pd.Series:
+        """Parse timestamp strings to UTC datetimes.
+
+        Args:
+            timestamps: Timestamp strings
+
+        Returns:
+            UTC-aware datetimes with the same index (NaT for unparseable
+            timestamps with a quarantine)
+
+        Raises:
+            ValueError: If a timestamp cannot be parsed (without quarantine)
+        """
+        coerce = self.quarantine is not None
+        if pd.api.types.infer_dtype(timestamps, skipna=False) != "string":
+            self.fallback_rows += len(timestamps)
+            return _parse_mixed(timestamps, coerce)
+
+        text = timestamps.to_numpy().astype(str)
+        body, fast = _strip_utc_suffix(text)
+        parsed = np.empty(len(text), dtype="datetime64[ns]")
+        try:
+            parsed[fast] = body[fast].astype("datetime64[ns]")
+        except ValueError:
+            # Let pandas parse what NumPy rejects, or report it
+            fast[:] = False
+
+        slow = ~fast
+        if slow.any():
+            fallback = _parse_mixed(timestamps[slow], coerce)
+            parsed[slow] = fallback.dt.tz_localize(None).to_numpy()
+        self.fast_rows += int(fast.sum())
+        self.fallback_rows += int(slow.sum())
+
+        return pd.Series(
+            pd.DatetimeIndex(parsed).tz_localize("UTC"),
+            index=timestamps.index,
+            name=timestamps.name,
+        )
+
+
+def _strip_utc_suffix(text: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Remove UTC suffixes and find the rows in the fast-path layout.
+
+    Args:
+        text: Timestamp strings as a NumPy unicode array
+
+    Returns:
+        Tuple of (strings without their UTC suffix, mask of rows that had
+        one and are otherwise plain "YYYY-MM-DDTHH:MM:SS[.f]" text)
+    """
+    cut = np.zeros(len(text), dtype=np.int64)
+    matched = np.zeros(len(text), dtype=bool)
+    for suffix in UTC_SUFFIXES:
+        ends = np.strings.endswith(text, suffix) & ~matched
+        cut[ends] = len(suffix)
+        matched |= ends
+    body = np.strings.slice(text, 0, np.strings.str_len(text) - cut)
+
+    # Anything after the seconds other than a fraction (another offset,
+    # a second designator) is left to the fallback
+    fast = matched & (np.strings.slice(body, 10, 11) == "T")
+    for marker in ("+", "-", "Z"):
+        fast &= np.strings.find(body, marker, 19) < 0
+    return body, fast
+
+
+def _parse_mixed(timestamps: pd.Series, coerce: bool = False) -> pd.Series:
+    """Parse timestamps of any layout pandas understands, element by element."""
+    # Clean up malformed timestamps that have both +00:00 and Z
+    cleaned = timestamps.str.replace(r"\+00:00Z$", "Z", regex=True)
+    return pd.to_datetime(
+        cleaned, format="mixed", utc=True, errors="coerce" if coerce else "raise"
+    )
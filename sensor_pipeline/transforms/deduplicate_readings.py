@@ -1,11 +1,40 @@
 """Remove duplicate sensor readings."""
 
+from collections import deque
 import pandas as pd
 
 
+# Columns identifying a reading
+KEY_COLUMNS = ["mesh_id", "device_id", "timestamp"]
+
+
 class DeduplicateReadings:
     """Remove duplicate sensor readings based on mesh_id, device_id,
-    and timestamp."""
+    and timestamp.
+
+    With remember=True, readings already passed in earlier calls are dropped
+    as well, for micro-batches of a live source. Earlier readings are kept
+    as a set of 64-bit key hashes, so each call costs time in proportion
+    to its own rows. With a window, the hashes of a call are forgotten once
+    its newest reading is more than `window` older than the newest reading
+    seen, bounding memory on long-running streams.
+    """
+
+    def __init__(self, remember: bool = False, window: pd.Timedelta | None = None):
+        """Initialize deduplication.
+
+        Args:
+            remember: Also drop readings seen in earlier calls
+            window: How far back, in reading time, earlier readings are
+                remembered (for ever if None)
+        """
+        self.remember = remember
+        self.window = window
+        # Hashes of the keys of earlier readings (remember only)
+        self.seen: set[int] = set()
+        # Newest timestamp and key hashes of each call, oldest first
+        self._calls: deque[tuple[pd.Timestamp, list[int]]] = deque()
+        self._latest: pd.Timestamp | None = None
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove exact duplicates from sensor readings.
@@ -17,6 +46,22 @@ class DeduplicateReadings:
             DataFrame with duplicates removed, keeping first occurrence
         """
         # Remove exact duplicates and ensure we have our own copy
-        return df.drop_duplicates(
-            subset=["mesh_id", "device_id", "timestamp"], keep="first"
-        )
+        df = df.drop_duplicates(subset=KEY_COLUMNS, keep="first")
+        if not self.remember or len(df) == 0:
+            return df
+
+        keys = pd.util.hash_pandas_object(df[KEY_COLUMNS], index=False).tolist()
+        new = [key not in self.seen for key in keys]
+        df = df[new]
+        added = [key for key, is_new in zip(keys, new) if is_new]
+        self.seen.update(added)
+
+        if self.window is not None and len(df):
+            newest = df["timestamp"].max()
+            self._calls.append((newest, added))
+            if self._latest is None or newest > self._latest:
+                self._latest = newest
+            cutoff = self._latest - self.window
+            while self._calls and self._calls[0][0] < cutoff:
+                self.seen.difference_update(self._calls.popleft()[1])
+        return df
@@ -0,0 +1,128 @@
+"""Compute Fahrenheit temperature and anomaly alerts in one fused pass."""
+
+import numpy as np
+import pandas as pd
+
+from ..models import PipelineConfig
+from ..thresholds import resolve_thresholds
+
+
+class DeriveReadings:
+    """Fused equivalent of ConvertTemperature followed by DetectAnomalies.
+
+    Adds temperature_f, temperature_alert, humidity_alert, status_alert and
+    is_healthy with the same values as the two separate transforms, but
+    walks the measurements once in cache-sized chunks, writing every
+    intermediate into preallocated buffers (NumPy `out=`) instead of
+    allocating a temporary Series per operator.
+    """
+
+    def __init__(self, config: PipelineConfig, chunk_rows: int = 16_384):
+        """Initialize with threshold configuration.
+
+        Args:
+            config: Pipeline configuration with thresholds
+            chunk_rows: Rows per chunk; small enough for the working set
+                of a chunk to stay in CPU cache
+
+        Raises:
+            ValueError: If chunk_rows is not positive
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+        self.config = config
+        self.chunk_rows = chunk_rows
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Add Fahrenheit temperature and alert columns.
+
+        Args:
+            df: DataFrame with 'temperature_c', 'humidity' and 'status'
+
+        Returns:
+            DataFrame with 'temperature_f', the three alert columns and
+            'is_healthy' added
+        """
+        temperature_c = df["temperature_c"].to_numpy(dtype=np.float64, na_value=np.nan)
+        humidity = df["humidity"].to_numpy(dtype=np.float64, na_value=np.nan)
+        status_alert = _status_alert(df["status"])
+        limits = resolve_thresholds(df, self.config)
+
+        n = len(df)
+        temperature_f = np.empty(n, dtype=np.float64)
+        temperature_alert = np.empty(n, dtype=bool)
+        humidity_alert = np.empty(n, dtype=bool)
+        is_healthy = np.empty(n, dtype=bool)
+        scratch = np.empty(min(n, self.chunk_rows), dtype=bool)
+
+        for start in range(0, n, self.chunk_rows):
+            chunk = slice(start, min(start + self.chunk_rows, n))
+            above = scratch[: chunk.stop - start]
+
+            # Same operation order as (c * 9 / 5) + 32, for identical results
+            f = temperature_f[chunk]
+            np.multiply(temperature_c[chunk], 9, out=f)
+            np.divide(f, 5, out=f)
+            np.add(f, 32, out=f)
+
+            _outside(
+                temperature_c[chunk],
+                _at(limits["temp_low"], chunk),
+                _at(limits["temp_high"], chunk),
+                temperature_alert[chunk],
+                above,
+            )
+            _outside(
+                humidity[chunk],
+                _at(limits["hum_low"], chunk),
+                _at(limits["hum_high"], chunk),
+                humidity_alert[chunk],
+                above,
+            )
+
+            # Healthy if NO alerts
+            healthy = is_healthy[chunk]
+            np.logical_or(temperature_alert[chunk], humidity_alert[chunk], out=healthy)
+            np.logical_or(healthy, status_alert[chunk], out=healthy)
+            np.logical_not(healthy, out=healthy)
+
+        df["temperature_f"] = temperature_f
+        df["temperature_alert"] = temperature_alert
+        df["humidity_alert"] = humidity_alert
+        df["status_alert"] = status_alert
+        df["is_healthy"] = is_healthy
+        return df
+
+
+def _at(limit: float | np.ndarray, chunk: slice) -> float | np.ndarray:
+    """A global limit, or the chunk's slice of per-row limits."""
+    return limit[chunk] if isinstance(limit, np.ndarray) else limit
+
+
+def _outside(
+    values: np.ndarray,
+    low: float | np.ndarray,
+    high: float | np.ndarray,
+    out: np.ndarray,
+    scratch: np.ndarray,
+) -> None:
+    """Write (values < low) | (values > high) into out; NaN is never outside."""
+    np.less(values, low, out=out)
+    np.greater(values, high, out=scratch)
+    np.logical_or(out, scratch, out=out)
+
+
+def _status_alert(status: pd.Series) -> np.ndarray:
+    """Mask of statuses other than "ok" (missing statuses included)."""
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        # Compare each category once, then gather by code; -1 (missing) alerts
+        alert_by_code = np.append(status.cat.categories != "ok", True)
+        return alert_by_code[status.cat.codes.to_numpy()]
+    values = status.to_numpy()
+    if values.dtype == object:
+        try:
+            # NumPy's object loop is ~3x faster than the pandas operator
+            return np.asarray(np.not_equal(values, "ok"), dtype=bool)
+        except TypeError:
+            pass  # pd.NA compares to NA, not a bool
+    return (status != "ok").to_numpy(dtype=bool, na_value=True)
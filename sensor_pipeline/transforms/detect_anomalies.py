@@ -3,6 +3,7 @@
 import pandas as pd
 
 from ..models import PipelineConfig
+from ..thresholds import resolve_thresholds
 
 
 class DetectAnomalies:
@@ -12,7 +13,8 @@ class DetectAnomalies:
         """Initialize with threshold configuration.
 
         Args:
-            config: Pipeline configuration with thresholds
+            config: Pipeline configuration with thresholds (global, and
+                optionally per mesh and device)
         """
         self.config = config
 
@@ -25,15 +27,17 @@ class DetectAnomalies:
         Returns:
             DataFrame with anomaly alert columns added
         """
+        # Scalars, or per-row arrays when overrides are configured
+        limits = resolve_thresholds(df, self.config)
 
         # Temperature anomalies
-        df["temperature_alert"] = (df["temperature_c"] < self.config.temp_low) | (
-            df["temperature_c"] > self.config.temp_high
+        df["temperature_alert"] = (df["temperature_c"] < limits["temp_low"]) | (
+            df["temperature_c"] > limits["temp_high"]
         )
 
         # Humidity anomalies
-        df["humidity_alert"] = (df["humidity"] < self.config.hum_low) | (
-            df["humidity"] > self.config.hum_high
+        df["humidity_alert"] = (df["humidity"] < limits["hum_low"]) | (
+            df["humidity"] > limits["hum_high"]
         )
 
         # Status anomalies
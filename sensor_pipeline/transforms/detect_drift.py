@@ -0,0 +1,241 @@
+"""Flag readings that drift from each device's own running statistics."""
+
+import os
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+# Measurements tracked per device, in state column order
+MEASUREMENTS = ("temperature_c", "humidity")
+
+
+class DetectDrift:
+    """Flag readings more than `sigma` standard deviations from their device.
+
+    Keeps a running count, mean and sum of squared deviations (Welford's
+    statistics) of every measurement for each (mesh_id, device_id), in
+    arrays indexed by device. Readings are scored against the statistics
+    of all earlier readings of the same device, then folded in, so the
+    statistics follow each device across calls: batches, streaming
+    micro-batches and, with a state file, separate runs.
+
+    A batch is processed in row order, in chunks. Within a chunk, readings
+    are stably sorted by device and each is scored against the stored
+    statistics combined with the device's earlier readings in the chunk
+    (per-device cumulative sums); the chunk is then merged into the state
+    in one vectorized step (Chan's parallel update). Alerts do not depend
+    on the chunk size, which only bounds working memory.
+    """
+
+    def __init__(
+        self,
+        sigma: float = 3.0,
+        min_readings: int = 30,
+        state_path: str | Path | None = None,
+        chunk_rows: int = 65_536,
+    ) -> None:
+        """Initialize detector and load persisted statistics.
+
+        Args:
+            sigma: Deviations from the device mean, in standard
+                deviations, above which a reading is flagged
+            min_readings: Earlier readings a device needs before any of
+                its readings are flagged
+            state_path: .npz file the statistics are loaded from (if it
+                exists) and saved to after every transform
+            chunk_rows: Readings scored and merged at a time
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if sigma <= 0:
+            raise ValueError("sigma must be positive")
+        if min_readings < 2:
+            raise ValueError("min_readings must be at least 2")
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+        self.sigma = sigma
+        self.min_readings = min_readings
+        self.state_path = Path(state_path) if state_path is not None else None
+        self.chunk_rows = chunk_rows
+
+        self.devices = pd.MultiIndex.from_arrays(
+            [pd.Index([], dtype=object), pd.Index([], dtype=object)],
+            names=["mesh_id", "device_id"],
+        )
+        shape = (0, len(MEASUREMENTS))
+        self.count = np.zeros(shape, dtype=np.int64)
+        self.mean = np.zeros(shape, dtype=np.float64)
+        self.m2 = np.zeros(shape, dtype=np.float64)
+        if self.state_path is not None and self.state_path.exists():
+            self.load_state()
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Add a drift_alert column and update the per-device statistics.
+
+        Args:
+            df: DataFrame with 'mesh_id', 'device_id', 'temperature_c'
+                and 'humidity'
+
+        Returns:
+            DataFrame with 'drift_alert' added (True if any measurement
+            drifted; missing measurements never do)
+        """
+        rows = self._device_rows(df)
+        values = np.column_stack(
+            [
+                df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+                for name in MEASUREMENTS
+            ]
+        )
+
+        drift = np.zeros(len(df), dtype=bool)
+        for start in range(0, len(df), self.chunk_rows):
+            chunk = slice(start, start + self.chunk_rows)
+            drift[chunk] = self._score(rows[chunk], values[chunk])
+            self._update(rows[chunk], values[chunk])
+
+        df["drift_alert"] = drift
+        self.save_state()
+        return df
+
+    def _device_rows(self, df: pd.DataFrame) -> np.ndarray:
+        """State row of every reading, adding rows for new devices."""
+        mesh_codes, meshes = pd.factorize(df["mesh_id"])
+        device_codes, devices = pd.factorize(df["device_id"])
+        # Factorize the (mesh, device) pairs through one int64 code each
+        width = max(len(devices), 1)
+        pair_codes, pairs = pd.factorize(
+            mesh_codes.astype(np.int64) * width + device_codes
+        )
+        keys = pd.MultiIndex.from_arrays(
+            [
+                np.asarray(meshes, dtype=object)[pairs // width],
+                np.asarray(devices, dtype=object)[pairs % width],
+            ],
+            names=self.devices.names,
+        )
+
+        positions = self.devices.get_indexer(keys)
+        new = positions < 0
+        if new.any():
+            positions[new] = len(self.devices) + np.arange(int(new.sum()))
+            self.devices = self.devices.append(keys[new])
+            grow = ((0, int(new.sum())), (0, 0))
+            self.count = np.pad(self.count, grow)
+            self.mean = np.pad(self.mean, grow)
+            self.m2 = np.pad(self.m2, grow)
+        return positions[pair_codes]
+
+    def _score(self, rows: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Mask of readings beyond sigma of their device's earlier readings."""
+        # Group the chunk by device, keeping row order within each device
+        order = np.argsort(rows, kind="stable")
+        device = rows[order]
+        position = np.arange(len(device))
+        starts = np.ones(len(device), dtype=bool)
+        starts[1:] = device[1:] != device[:-1]
+        first = np.maximum.accumulate(np.where(starts, position, 0))
+
+        outside = np.zeros(len(device), dtype=bool)
+        for j in range(len(MEASUREMENTS)):
+            x = values[order, j]
+            valid = ~np.isnan(x)
+            n_a = self.count[device, j]
+
+            # Center on the stored mean, or for devices without history on
+            # their mean in this chunk, so the sums below stay small
+            center = self.mean[device, j]
+            new = n_a == 0
+            if new.any():
+                size = len(self.devices)
+                sums = np.bincount(device[valid], weights=x[valid], minlength=size)
+                counts = np.bincount(device[valid], minlength=size)
+                chunk_mean = sums[device] / np.maximum(counts[device], 1)
+                center = np.where(new, chunk_mean, center)
+            y = np.where(valid, x - center, 0.0)
+
+            # Statistics of all earlier readings of each reading's device
+            n = n_a + _earlier_sum(valid.astype(np.int64), first)
+            shift = _earlier_sum(y, first) / np.maximum(n, 1)
+            m2 = self.m2[device, j] + _earlier_sum(y * y, first) - n * shift * shift
+            variance = np.maximum(m2, 0.0) / np.maximum(n - 1, 1)
+
+            # Infinite limits until a device has enough readings
+            limit = np.where(
+                n >= self.min_readings, self.sigma * np.sqrt(variance), np.inf
+            )
+            outside |= valid & (np.abs(y - shift) > limit)
+
+        result = np.empty(len(device), dtype=bool)
+        result[order] = outside
+        return result
+
+    def _update(self, rows: np.ndarray, values: np.ndarray) -> None:
+        """Merge the statistics of a chunk into the per-device state."""
+        size = len(self.devices)
+        for j in range(len(MEASUREMENTS)):
+            x = values[:, j]
+            valid = ~np.isnan(x)
+            device = rows[valid]
+            x = x[valid]
+
+            n_b = np.bincount(device, minlength=size)
+            seen = np.flatnonzero(n_b)
+            chunk_mean = np.zeros(size)
+            sums = np.bincount(device, weights=x, minlength=size)
+            chunk_mean[seen] = sums[seen] / n_b[seen]
+            centered = x - chunk_mean[device]
+            m2_b = np.bincount(device, weights=centered * centered, minlength=size)
+
+            n_a = self.count[seen, j]
+            n = n_a + n_b[seen]
+            delta = chunk_mean[seen] - self.mean[seen, j]
+            self.mean[seen, j] += delta * n_b[seen] / n
+            self.m2[seen, j] += m2_b[seen] + delta * delta * n_a * n_b[seen] / n
+            self.count[seen, j] = n
+
+    def load_state(self) -> None:
+        """Load the per-device statistics from state_path."""
+        if self.state_path is None:
+            return
+        with np.load(self.state_path, allow_pickle=False) as npz:
+            self.devices = pd.MultiIndex.from_arrays(
+                [npz["mesh_id"].astype(object), npz["device_id"].astype(object)],
+                names=self.devices.names,
+            )
+            self.count = npz["count"]
+            self.mean = npz["mean"]
+            self.m2 = npz["m2"]
+
+    def save_state(self) -> None:
+        """Persist the per-device statistics to state_path."""
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                mesh_id=self.devices.get_level_values(0).to_numpy().astype(str),
+                device_id=self.devices.get_level_values(1).to_numpy().astype(str),
+                count=self.count,
+                mean=self.mean,
+                m2=self.m2,
+            )
+        os.replace(tmp_path, self.state_path)
+
+
+def _earlier_sum(values: np.ndarray, first: np.ndarray) -> np.ndarray:
+    """Sum of the values before each position within its group.
+
+    Args:
+        values: Values in group order
+        first: Position of the first member of each position's group
+
+    Returns:
+        Exclusive per-group cumulative sums
+    """
+    before = np.cumsum(values) - values
+    return np.asarray(before - before[first])
@@ -0,0 +1,124 @@
+"""Flag temperature jumps and stuck sensors from each device's time series."""
+
+import numpy as np
+import pandas as pd
+
+
+# Nanoseconds per minute, the unit of rates and stuck durations
+_MINUTE_NS = 60 * 10**9
+
+_NAT = np.iinfo(np.int64).min
+
+
+class DetectSensorFaults:
+    """Detect sensor faults that only show across consecutive readings.
+
+    Readings are put in (mesh_id, device_id, timestamp) order with one
+    stable sort; differences between neighbouring readings of the same
+    device and runs of identical temperatures are then computed on the
+    sorted arrays, and the alerts scattered back to the original rows.
+
+    - rate_alert: temperature changed faster than `max_rate` C per minute
+      since the device's previous reading
+    - stuck_alert: temperature has not changed for at least
+      `stuck_minutes` (flagged from the first reading past that duration)
+
+    Only the readings of one call are compared: for micro-batches of a
+    live source, each batch starts without the devices' previous readings,
+    so a jump or run spanning two batches is not seen.
+    """
+
+    def __init__(
+        self, max_rate: float | None = None, stuck_minutes: float | None = None
+    ) -> None:
+        """Initialize fault limits; each check only runs when its limit is set.
+
+        Args:
+            max_rate: Largest temperature change, in C per minute, between
+                consecutive readings of a device
+            stuck_minutes: Minutes a device's temperature may stay exactly
+                the same
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        if stuck_minutes is not None and stuck_minutes <= 0:
+            raise ValueError("stuck_minutes must be positive")
+        self.max_rate = max_rate
+        self.stuck_minutes = stuck_minutes
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Add rate_alert and/or stuck_alert columns.
+
+        Args:
+            df: DataFrame with 'mesh_id', 'device_id', datetime 'timestamp'
+                and 'temperature_c'
+
+        Returns:
+            DataFrame with an alert column for each enabled check
+        """
+        codes = _device_codes(df)
+        timestamps = df["timestamp"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        order = _device_time_order(codes, timestamps)
+        device = codes[order]
+        time = timestamps[order]
+        temperature = df["temperature_c"].to_numpy(dtype=np.float64, na_value=np.nan)
+        temperature = temperature[order]
+
+        # previous[i]: sorted row i-1 is the same device's previous reading
+        # (and both have a timestamp)
+        previous = np.zeros(len(df), dtype=bool)
+        previous[1:] = (device[1:] == device[:-1]) & (time[:-1] != _NAT)
+        previous &= time != _NAT
+
+        if self.max_rate is not None:
+            elapsed = np.diff(time, prepend=time[:1])
+            change = np.abs(np.diff(temperature, prepend=temperature[:1]))
+            # Readings at the same instant have no rate
+            timed = previous & (elapsed > 0)
+            rate = np.zeros(len(df))
+            np.divide(change, elapsed / _MINUTE_NS, out=rate, where=timed)
+            alert = np.zeros(len(df), dtype=bool)
+            alert[order] = timed & (rate > self.max_rate)
+            df["rate_alert"] = alert
+
+        if self.stuck_minutes is not None:
+            # A run continues while the device and the exact value repeat
+            repeat = previous.copy()
+            repeat[1:] &= temperature[1:] == temperature[:-1]
+            run_start = np.maximum.accumulate(np.where(repeat, 0, np.arange(len(df))))
+            stuck_for = time - time[run_start]
+            alert = np.zeros(len(df), dtype=bool)
+            alert[order] = repeat & (stuck_for >= self.stuck_minutes * _MINUTE_NS)
+            df["stuck_alert"] = alert
+
+        return df
+
+
+def _device_codes(df: pd.DataFrame) -> np.ndarray:
+    """One integer code per (mesh_id, device_id) pair, in the narrowest dtype."""
+    mesh_codes, _ = pd.factorize(df["mesh_id"])
+    device_codes, devices = pd.factorize(df["device_id"])
+    codes = mesh_codes.astype(np.int64) * max(len(devices), 1) + device_codes
+    if len(codes) == 0:
+        return codes
+    if codes.max() > np.iinfo(np.uint16).max:
+        # Renumber the pairs that actually occur, densely
+        codes, _ = pd.factorize(codes)
+    # NumPy's stable sort is a radix sort for 16-bit and smaller integers
+    if 0 <= codes.min() and codes.max() <= np.iinfo(np.uint16).max:
+        return codes.astype(np.uint16)
+    return codes
+
+
+def _device_time_order(codes: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+    """Stable order of rows by (device code, timestamp).
+
+    Sorts by time, then stably by device (a two-key LSD sort, equal to one
+    stable sort on both keys). Input usually arrives roughly in time order,
+    where the first pass is nearly free.
+    """
+    by_time = np.argsort(timestamps, kind="stable")
+    return by_time[np.argsort(codes[by_time], kind="stable")]
@@ -0,0 +1,36 @@
+"""Bit-pack boolean alert columns into one integer column."""
+
+import pandas as pd
+
+from ..alert_flags import pack_alerts
+
+
+class PackAlerts:
+    """Replace the boolean alert columns and is_healthy with 'alert_flags'.
+
+    Every boolean column whose name ends in '_alert' gets one bit of a
+    uint8 (up to 8 alerts), uint16, uint32 or uint64 column, taking one to
+    eight bytes per row instead of one per alert. Read alerts back with
+    sensor_pipeline.alert_flags (alert(), is_healthy(), unpack_alerts());
+    AggregateMesh counts them straight from the bits.
+    """
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Pack the alert columns.
+
+        Args:
+            df: DataFrame with boolean '*_alert' columns and is_healthy
+
+        Returns:
+            DataFrame with 'alert_flags' instead of those columns
+
+        Raises:
+            ValueError: If there are more than 64 alert columns
+        """
+        columns = [
+            column
+            for column in df.columns
+            if str(column).endswith("_alert")
+            and pd.api.types.is_bool_dtype(df[column].dtype)
+        ]
+        return pack_alerts(df, columns)
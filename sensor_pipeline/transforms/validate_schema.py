@@ -1,19 +1,84 @@
 """Generic schema validation using pandera."""
 
+import numpy as np
 import pandas as pd
+from pandera.errors import SchemaErrors
 from pandera.pandas import DataFrameSchema
 
+from ..derived import derived_columns
+from ..quarantine import Quarantine
+from ..validation import FastValidator, ValidationLedger, sample_failure_rows
+
+
+class BoundedSchemaErrors(SchemaErrors):
+    """SchemaErrors reporting a sample of the failing rows, with exact counts.
+
+    Attributes:
+        failure_counts: Rows failing each row-level check, over all rows
+    """
+
+    def __init__(self, error: SchemaErrors, failure_counts: dict[str, int]):
+        """Wrap pandera's report for the sampled rows.
+
+        Args:
+            error: SchemaErrors raised for the sampled rows
+            failure_counts: Rows failing each row-level check
+        """
+        super().__init__(error.schema, error.schema_errors, error.data)
+        self.failure_counts = failure_counts
+
 
 class ValidateSchema:
     """Generic schema validation for any pandera DataFrameSchema."""
 
-    def __init__(self, schema: DataFrameSchema):
+    def __init__(
+        self,
+        schema: DataFrameSchema,
+        fast: bool = True,
+        ledger: ValidationLedger | None = None,
+        quarantine: Quarantine | None = None,
+        max_failure_cases: int | None = None,
+        failure_sampling: str = "head",
+    ):
         """Initialize with schema to validate against.
 
         Args:
             schema: Pandera DataFrameSchema to validate against
+            fast: Try the vectorized FastValidator first and only run
+                pandera to report failures (ignored for schemas it cannot
+                mirror)
+            ledger: Ledger shared with other ValidateSchema steps so columns
+                they already validated, unchanged since, are skipped
+                (fast path only)
+            quarantine: Dead-letter sink; rows breaking row-level rules are
+                moved there and the remaining rows pass on, instead of
+                raising
+            max_failure_cases: Limit the error report to this many example
+                rows per failing check; exact counts per check are still
+                attached (None reports every failure case)
+            failure_sampling: How example rows are chosen when limited,
+                "head" (first failures) or "random"
+
+        Raises:
+            ValueError: If quarantine or max_failure_cases is requested for
+                a schema the fast path cannot mirror
         """
         self.schema = schema
+        self.fast = fast
+        self.ledger = ledger
+        self.quarantine = quarantine
+        self.max_failure_cases = max_failure_cases
+        self.failure_sampling = failure_sampling
+        self.fast_validator = (
+            FastValidator(schema) if fast and FastValidator.supports(schema) else None
+        )
+        if quarantine is not None and self.fast_validator is None:
+            raise ValueError("Quarantine requires a schema supported by FastValidator")
+        if max_failure_cases is not None and self.fast_validator is None:
+            raise ValueError(
+                "max_failure_cases requires a schema supported by FastValidator"
+            )
+        self._source_validators: dict[tuple[str, ...], ValidateSchema] = {}
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Validate DataFrame against schema.
@@ -22,10 +87,106 @@ class ValidateSchema:
             df: DataFrame to validate
 
         Returns:
-            Validated DataFrame (unchanged if valid)
+            Validated DataFrame (unchanged if valid; without quarantined
+            rows in quarantine mode). Lazily derived columns (see
+            sensor_pipeline.derived) are validated through their source
+            column and stay unmaterialized
 
         Raises:
-            SchemaError: If validation fails with full row/col detail
+            SchemaError: If validation fails with full row/col detail (in
+                quarantine mode, only for failures that dropping rows
+                cannot fix); with max_failure_cases, a BoundedSchemaErrors
+                whose `failure_counts` holds the rows failing each check
         """
+        derived = tuple(
+            name
+            for name, spec in derived_columns(df).items()
+            if name in self.schema.columns and spec["source"] in self.schema.columns
+        )
+        if derived:
+            return self._validator_without(derived).transform(df)
+
+        if self.fast_validator is not None:
+            validated = self.fast_validator.validate(df, self.ledger)
+            if validated is None and self.quarantine is not None:
+                validated = self._quarantine_rows(df)
+            if validated is not None:
+                return validated
+            if self.max_failure_cases is not None:
+                self._raise_bounded(df)
+
         # Raises SchemaErrors with full row/col detail if anything fails
         return self.schema.validate(df, lazy=True)
+
+    def _validator_without(self, names: tuple[str, ...]) -> "ValidateSchema":
+        """Return (and cache) a validator for the schema minus some columns.
+
+        A derived view is valid whenever its source column is, so the
+        source's rules stand in for the derived column's.
+        """
+        if names not in self._source_validators:
+            self._source_validators[names] = ValidateSchema(
+                self.schema.remove_columns(list(names)),
+                fast=self.fast,
+                ledger=self.ledger,
+                quarantine=self.quarantine,
+                max_failure_cases=self.max_failure_cases,
+                failure_sampling=self.failure_sampling,
+            )
+        return self._source_validators[names]
+
+    def _raise_bounded(self, df: pd.DataFrame) -> None:
+        """Raise pandera's report for a sample of the failing rows.
+
+        Counts come from the vectorized checks over every row; pandera only
+        sees the sampled rows, so the report stays small however many rows
+        fail. Returns only if the sample unexpectedly validates.
+        """
+        assert self.fast_validator is not None and self.max_failure_cases is not None
+        frame_failures, failures = self.fast_validator.find_failures(df)
+        rows = sample_failure_rows(
+            failures, self.max_failure_cases, self.failure_sampling
+        )
+        if len(rows) == 0:
+            # Frame-level failures show up on any row
+            rows = np.arange(min(len(df), 1))
+
+        try:
+            self.schema.validate(df.iloc[rows], lazy=True)
+        except SchemaErrors as error:
+            counts = {rule: int(mask.sum()) for rule, mask in failures.items()}
+            bounded = BoundedSchemaErrors(error, counts)
+            bounded.add_note(
+                f"Failure cases limited to {self.max_failure_cases} example "
+                f"rows per check; rows failing each check (of {len(df)}):"
+            )
+            for rule in frame_failures:
+                bounded.add_note(f"  {rule}: whole column")
+            for rule, count in counts.items():
+                bounded.add_note(f"  {rule}: {count}")
+            raise bounded from None
+
+    def _quarantine_rows(self, df: pd.DataFrame) -> pd.DataFrame | None:
+        """Move failing rows to the quarantine and validate the rest.
+
+        Returns:
+            Validated remaining rows, or None if the failure is not
+            confined to individual rows
+        """
+        assert self.fast_validator is not None and self.quarantine is not None
+        failures = self.fast_validator.row_failures(df)
+        if not failures:
+            return None
+
+        bad = np.logical_or.reduce(list(failures.values()))
+        kept = self.fast_validator.drop_rows(df, bad)
+        validated = self.fast_validator.validate(kept, self.ledger)
+        if validated is None:
+            return None
+
+        errors: list[list[str]] = [[] for _ in range(int(bad.sum()))]
+        for rule, mask in failures.items():
+            for position in np.flatnonzero(mask[bad]):
+                errors[position].append(rule)
+        self.quarantine.add(df[bad], errors)
+        return validated
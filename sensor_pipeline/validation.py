@@ -0,0 +1,456 @@
+"""Vectorized fast path for pandera DataFrameSchema validation."""
+
+from collections.abc import Hashable
+from typing import Any
+import weakref
+import numpy as np
+import pandas as pd
+from pandera.api.pandas.components import Column
+from pandera.engines.pandas_engine import Engine, NpString
+from pandera.errors import ParserError
+from pandera.pandas import DataFrameSchema
+
+
+class FastValidator:
+    """Check a DataFrame against a pandera schema with vectorized operations.
+
+    Covers the schema features used by the pipeline's schemas: required
+    columns, strict mode, per-column dtype (with optional coercion),
+    nullability and Check.isin. validate() only answers "valid" when it is
+    certain pandera would accept the frame; on any failure or doubt it
+    returns None and the caller runs pandera for the detailed report.
+    Schemas using other features are reported by supports() so callers
+    can skip the fast path entirely.
+    """
+
+    def __init__(self, schema: DataFrameSchema):
+        """Initialize with schema to check against.
+
+        Args:
+            schema: Pandera DataFrameSchema to mirror
+
+        Raises:
+            ValueError: If the schema uses features the fast path lacks
+        """
+        if not self.supports(schema):
+            raise ValueError("Schema uses features not covered by FastValidator")
+        self.schema = schema
+
+    @staticmethod
+    def supports(schema: DataFrameSchema) -> bool:
+        """Check whether every rule in a schema has a fast equivalent.
+
+        Args:
+            schema: Pandera DataFrameSchema
+
+        Returns:
+            True if FastValidator can mirror the schema
+        """
+        if (
+            schema.checks
+            or schema.index is not None
+            or schema.unique
+            or schema.ordered
+            or schema.coerce
+            or schema.add_missing_columns
+            or schema.drop_invalid_rows
+            or schema.strict not in (True, False)
+        ):
+            return False
+        return all(
+            isinstance(column, Column)
+            and not column.regex
+            and not column.unique
+            and column.dtype is not None
+            and all(_is_isin(check) for check in column.checks)
+            for column in schema.columns.values()
+        )
+
+    def validate(
+        self, df: pd.DataFrame, ledger: "ValidationLedger | None" = None
+    ) -> pd.DataFrame | None:
+        """Validate a DataFrame without building failure reports.
+
+        Args:
+            df: DataFrame to validate
+            ledger: Record of columns already validated; columns it vouches
+                for under the same rules are not checked again, and newly
+                validated columns are added to it
+
+        Returns:
+            Shallow copy of the DataFrame with coerced columns replaced, as
+            pandera would return it, or None if any rule fails
+        """
+        if self.schema.strict and not set(df.columns) <= set(self.schema.columns):
+            return None
+
+        checked: list[str] = []
+        coerced: dict[str, pd.Series] = {}
+        for name, column in self.schema.columns.items():
+            if name not in df:
+                if column.required:
+                    return None
+                continue
+            original = df[name]
+            if ledger is not None and ledger.is_validated(name, original, column):
+                continue
+            series = self.check_column(column, original)
+            if series is None:
+                return None
+            checked.append(name)
+            if series is not original:
+                coerced[name] = series
+
+        validated = df.copy(deep=False)
+        for name, series in coerced.items():
+            validated[name] = series
+        if ledger is not None:
+            for name in checked:
+                ledger.record(name, validated[name], self.schema.columns[name])
+        return validated
+
+    def check_column(self, column: Column, series: pd.Series) -> pd.Series | None:
+        """Check one column against its schema component.
+
+        Args:
+            column: Pandera column schema
+            series: Column data
+
+        Returns:
+            The (possibly coerced) column if every rule passes, else None
+        """
+        if column.coerce and not _dtype_matches(column.dtype, series):
+            try:
+                series = column.dtype.try_coerce(series)
+            except ParserError:
+                return None
+
+        if not _dtype_matches(column.dtype, series):
+            return None
+        if not column.nullable and series.hasnans:
+            return None
+        for check in column.checks:
+            allowed = check.statistics["allowed_values"]
+            passed = series.isin(allowed)
+            if check.ignore_na:
+                passed |= series.isna()
+            if not passed.all():
+                return None
+        return series
+
+    def row_failures(self, df: pd.DataFrame) -> dict[str, np.ndarray] | None:
+        """Find the rows breaking each row-level rule.
+
+        Problems that dropping rows cannot fix (missing or unexpected
+        columns, a column whose dtype is wrong as a whole) return None.
+
+        Args:
+            df: DataFrame to check
+
+        Returns:
+            Mapping of "column: check" to a boolean mask of failing rows,
+            for each rule with at least one failure, or None
+        """
+        frame_failures, failures = self.find_failures(df)
+        return None if frame_failures else failures
+
+    def find_failures(
+        self, df: pd.DataFrame
+    ) -> tuple[list[str], dict[str, np.ndarray]]:
+        """Find every broken rule, split by whether rows can be blamed.
+
+        Args:
+            df: DataFrame to check
+
+        Returns:
+            Tuple of (frame-level failures as "column: check" strings,
+            mapping of row-level "column: check" to a boolean mask of
+            failing rows for each rule with at least one failure)
+        """
+        frame_failures: list[str] = []
+        failures: dict[str, np.ndarray] = {}
+        if self.schema.strict:
+            frame_failures.extend(
+                f"{name}: column_in_schema"
+                for name in df.columns
+                if name not in self.schema.columns
+            )
+
+        for name, column in self.schema.columns.items():
+            if name not in df:
+                if column.required:
+                    frame_failures.append(f"{name}: column_in_dataframe")
+                continue
+            series = df[name]
+            if column.coerce and not _dtype_matches(column.dtype, series):
+                rule = f"{name}: coerce_dtype('{column.dtype}')"
+                try:
+                    series = column.dtype.try_coerce(series)
+                except ParserError:
+                    mask = _coerce_failures(column.dtype, series)
+                    if mask is None:
+                        frame_failures.append(rule)
+                    else:
+                        failures[rule] = mask
+                    # Remaining rules are re-checked once these rows are gone
+                    continue
+
+            rules: list[tuple[str, np.ndarray]] = []
+            mask = _dtype_failures(column.dtype, series)
+            if mask is None:
+                frame_failures.append(f"{name}: dtype('{column.dtype}')")
+            else:
+                rules.append((f"dtype('{column.dtype}')", mask))
+            if not column.nullable:
+                rules.append(("not_nullable", series.isna().to_numpy()))
+            for check in column.checks:
+                passed = series.isin(check.statistics["allowed_values"])
+                if check.ignore_na:
+                    passed |= series.isna()
+                rules.append((str(check.error), ~passed.to_numpy()))
+            for rule, mask in rules:
+                if mask.any():
+                    failures[f"{name}: {rule}"] = mask
+        return frame_failures, failures
+
+    def drop_rows(self, df: pd.DataFrame, drop: np.ndarray) -> pd.DataFrame:
+        """Remove rows and restore the dtypes the bad rows were masking.
+
+        Measurement columns are left as objects when any value is not a
+        number; once those rows are gone they are converted to float64,
+        as the loader would have built them.
+
+        Args:
+            df: DataFrame to filter
+            drop: Boolean mask of rows to remove
+
+        Returns:
+            Remaining rows with a fresh RangeIndex
+        """
+        kept = df[~drop].reset_index(drop=True)
+        for name, column in self.schema.columns.items():
+            if (
+                name in kept
+                and str(column.dtype) == "float64"
+                and kept[name].dtype == object
+            ):
+                kept[name] = kept[name].astype("float64")
+        return kept
+
+
+def _is_isin(check: Any) -> bool:
+    """Whether a pandera check is a plain Check.isin()."""
+    return (
+        check.name == "isin"
+        and "allowed_values" in check.statistics
+        and not check.groupby
+        and check.n_failure_cases is None
+    )
+
+
+def _dtype_matches(dtype: Any, series: pd.Series) -> bool:
+    """Vectorized equivalent of pandera's column dtype check.
+
+    Pandera checks string columns element by element in Python; here the
+    same "every non-null value is a str" rule runs in C via infer_dtype.
+    Other dtypes are compared through pandera's own (data-free) check.
+    """
+    if isinstance(dtype, NpString):
+        values: Any = series
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.cat.categories
+        return pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty")
+    try:
+        result = dtype.check(Engine.dtype(series.dtype), series)
+    except TypeError:
+        return False
+    return bool(result) if isinstance(result, bool) else bool(result.all())
+
+
+def sample_failure_rows(
+    failures: dict[str, np.ndarray],
+    max_cases: int,
+    strategy: str = "head",
+    seed: int = 0,
+) -> np.ndarray:
+    """Pick example rows for a bounded failure report.
+
+    Every rule contributes up to max_cases of its failing rows, so each
+    broken check is represented however skewed the failures are.
+
+    Args:
+        failures: Mapping of rule to boolean mask of failing rows
+        max_cases: Maximum example rows per rule
+        strategy: "head" for the first failing rows, "random" for a
+            uniform sample
+        seed: Random seed for the "random" strategy
+
+    Returns:
+        Sorted positions of the selected rows
+
+    Raises:
+        ValueError: If the strategy is unknown
+    """
+    if strategy not in ("head", "random"):
+        raise ValueError(f"Unknown failure sampling strategy: {strategy}")
+    rng = np.random.default_rng(seed)
+    selected = [np.empty(0, dtype=np.intp)]
+    for mask in failures.values():
+        positions = np.flatnonzero(mask)
+        if len(positions) > max_cases:
+            if strategy == "head":
+                positions = positions[:max_cases]
+            else:
+                positions = rng.choice(positions, max_cases, replace=False)
+        selected.append(positions)
+    return np.unique(np.concatenate(selected))
+
+
+def _dtype_failures(dtype: Any, series: pd.Series) -> np.ndarray | None:
+    """Mask of values breaking a dtype, or None if the column fails as a whole."""
+    if _dtype_matches(dtype, series):
+        return np.zeros(len(series), dtype=bool)
+    if isinstance(dtype, NpString):
+        is_str = series.astype(object).map(lambda value: isinstance(value, str))
+        return ~(is_str.astype(bool) | series.isna()).to_numpy()
+    if str(dtype) == "float64" and series.dtype == object:
+        is_number = series.map(
+            lambda value: isinstance(value, (int, float, np.number))
+            and not isinstance(value, (bool, np.bool_))
+        )
+        return ~(is_number.astype(bool) | series.isna()).to_numpy()
+    return None
+
+
+def _coerce_failures(dtype: Any, series: pd.Series) -> np.ndarray | None:
+    """Mask of values that cannot be coerced, for datetime columns only."""
+    if str(dtype) != "datetime64[ns]":
+        return None
+    parsed = pd.to_datetime(series, errors="coerce")
+    return (parsed.isna() & series.notna()).to_numpy()
+
+
+class ValidationLedger:
+    """Remember which column arrays have passed which column rules.
+
+    Shared by the ValidateSchema steps of one pipeline so a column that an
+    earlier step validated, and that no transform has replaced since, is
+    not checked again by a later schema with the same rules for it.
+    Columns are identified by their underlying array (root buffer, data
+    pointer, shape, strides and dtype). Transforms replace columns by
+    assignment, which allocates a new array; writing into a validated
+    column in place (e.g. df.loc[mask, col] = ...) is not detected and
+    must be followed by clear().
+
+    Only weak references to the arrays are held, so the ledger never keeps
+    a finished batch alive.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty ledger."""
+        self._entries: dict[tuple[str, Hashable], _ArrayToken] = {}
+
+    def is_validated(self, name: str, series: pd.Series, column: Column) -> bool:
+        """Check whether this exact column data already passed these rules.
+
+        Args:
+            name: Column name
+            series: Column data
+            column: Pandera column schema holding the rules
+
+        Returns:
+            True if the column is unchanged since it passed the same rules
+        """
+        token = self._entries.get((name, _rules_key(column)))
+        return token is not None and token.matches(series)
+
+    def record(self, name: str, series: pd.Series, column: Column) -> None:
+        """Note that a column passed a column schema's rules.
+
+        Args:
+            name: Column name
+            series: Validated column data
+            column: Pandera column schema holding the rules
+        """
+        token = _ArrayToken.of(series)
+        if token is not None:
+            self._entries[(name, _rules_key(column))] = token
+
+    def clear(self) -> None:
+        """Forget every validated column."""
+        self._entries.clear()
+
+
+class _ArrayToken:
+    """Identity of the memory backing a column."""
+
+    def __init__(
+        self,
+        root: np.ndarray,
+        values: np.ndarray,
+        dtype: Any,
+        categories: pd.Index | None,
+    ):
+        self.root = weakref.ref(root)
+        self.layout = (
+            values.__array_interface__["data"][0],
+            values.shape,
+            values.strides,
+        )
+        self.dtype = dtype
+        self.categories = categories
+
+    @classmethod
+    def of(cls, series: pd.Series) -> "_ArrayToken | None":
+        """Build the token for a column, if it is backed by NumPy memory."""
+        found = _backing_array(series)
+        if found is None:
+            return None
+        values, categories = found
+        return cls(_root(values), values, series.dtype, categories)
+
+    def matches(self, series: pd.Series) -> bool:
+        """Check whether a column is backed by the same, live memory."""
+        found = _backing_array(series)
+        if found is None:
+            return False
+        values, categories = found
+        root = self.root()
+        return (
+            root is not None
+            and root is _root(values)
+            and self.layout
+            == (values.__array_interface__["data"][0], values.shape, values.strides)
+            and self.dtype == series.dtype
+            and self.categories is categories
+        )
+
+
+def _backing_array(series: pd.Series) -> tuple[np.ndarray, pd.Index | None] | None:
+    """Return a column's NumPy data (codes for categoricals) and categories."""
+    values = series.values
+    if isinstance(values, pd.Categorical):
+        return values.codes, values.categories
+    if isinstance(values, np.ndarray):
+        return values, None
+    return None
+
+
+def _root(values: np.ndarray) -> np.ndarray:
+    """Return the array that owns a view's memory."""
+    while isinstance(values.base, np.ndarray):
+        values = values.base
+    return values
+
+
+def _rules_key(column: Column) -> Hashable:
+    """Hashable summary of the rules a column schema enforces."""
+    return (
+        str(column.dtype),
+        column.nullable,
+        column.coerce,
+        tuple(
+            (check.name, repr(check.statistics), check.ignore_na)
+            for check in column.checks
+        ),
+    )
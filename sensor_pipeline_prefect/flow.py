@@ -1,30 +1,45 @@
 """Prefect 3 flow for sensor data pipeline."""
 
+import glob
 import json
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Literal
+from urllib.parse import parse_qs, urlparse
 
 import pandas as pd
 from prefect import flow, task
 from prefect.tasks import task_input_hash
 from datetime import timedelta
 
-from sensor_pipeline.models import PipelineConfig
+from sensor_pipeline.models import (
+    PipelineConfig,
+    processed_reading_schema,
+    rule_summary_schema,
+)
 from sensor_pipeline.pipeline import create_sensor_pipeline
-from sensor_pipeline.sources import FileSource, SensorSource
+from sensor_pipeline.quarantine import Quarantine
+from sensor_pipeline.rules import alert_counts
+from sensor_pipeline.thresholds import load_threshold_table
+from sensor_pipeline.sources import (
+    ApiSource,
+    FileSource,
+    MultiFileSource,
+    SensorSource,
+    SqliteSource,
+)
 from sensor_pipeline.transforms import (
     ValidateSchema,
     ConvertTimestamp,
     ConvertTemperature,
     DetectAnomalies,
+    DetectSensorFaults,
+    DetectDrift,
+    ApplyRules,
+    PackAlerts,
     DeduplicateReadings,
     AggregateMesh,
 )
-from sensor_pipeline.models import (
-    sensor_input_schema,
-    processed_reading_schema,
-    mesh_summary_schema,
-)
+from sensor_pipeline.models import sensor_input_schema
 
 
 @task(
@@ -33,11 +48,27 @@ from sensor_pipeline.models import (
     cache_key_fn=task_input_hash,
     cache_expiration=timedelta(hours=1),
 )
-def load_to_df(source_url: str) -> pd.DataFrame:
+def load_to_df(
+    source_url: str,
+    cache_dir: str | None = None,
+    mesh_ids: list[str] | None = None,
+    start: str | None = None,
+    end: str | None = None,
+) -> pd.DataFrame:
     """Load sensor data from source URL.
 
     Args:
-        source_url: Proto-URL (file: or api:) for data source
+        source_url: Proto-URL (file: or api:) for data source; file:
+            paths may be .json/.jsonl, optionally .gz/.bz2/.xz compressed,
+            or a directory/glob pattern such as file:data/2026-10-*/*.jsonl;
+            sqlite: URLs name a database and optional table, e.g.
+            sqlite:data/archive.db?table=readings; api: URLs wrap an
+            http(s) endpoint serving paginated readings, e.g.
+            api:https://gateway.example.com/v1/readings
+        cache_dir: Directory for a columnar cache of parsed input files
+        mesh_ids: Only load readings from these meshes
+        start: Only load readings at or after this ISO-8601 timestamp
+        end: Only load readings before this ISO-8601 timestamp
 
     Returns:
         DataFrame with sensor readings
@@ -45,24 +76,44 @@ def load_to_df(source_url: str) -> pd.DataFrame:
     parsed = urlparse(source_url)
 
     source: SensorSource
-    if parsed.scheme == "file":
-        source = FileSource(parsed.path)
+    if parsed.scheme == "file" and (
+        glob.has_magic(parsed.path) or Path(parsed.path).is_dir()
+    ):
+        source = MultiFileSource(parsed.path, cache_dir=cache_dir)
+    elif parsed.scheme == "file":
+        source = FileSource(parsed.path, cache_dir=cache_dir)
+    elif parsed.scheme == "sqlite":
+        options = parse_qs(parsed.query)
+        source = SqliteSource(parsed.path, table=options.get("table", ["readings"])[0])
+    elif parsed.scheme == "api":
+        source = ApiSource(source_url.removeprefix("api:"))
     else:
         raise ValueError(
-            f"Unsupported source scheme: {parsed.scheme}. Only 'file:' is supported."
+            f"Unsupported source scheme: {parsed.scheme}. "
+            "Supported schemes are 'file:', 'sqlite:' and 'api:'."
         )
 
-    df = source.load()
+    time_range = (start, end) if start is not None or end is not None else None
+    df = source.load(mesh_ids=mesh_ids, time_range=time_range)
     print(f"Loaded {len(df)} sensor readings from {source_url}")
     return df
 
 
 @task
-def validate_sensor_input(df: pd.DataFrame) -> pd.DataFrame:
+def validate_sensor_input(
+    df: pd.DataFrame,
+    quarantine_path: str | None = None,
+    max_failure_cases: int | None = None,
+    failure_sampling: str = "head",
+) -> pd.DataFrame:
     """Validate sensor input data against schema.
 
     Args:
         df: Input DataFrame with sensor readings
+        quarantine_path: Dead-letter file for invalid readings; when set,
+            they are removed instead of failing the task
+        max_failure_cases: Example rows per failing check in the error
+        failure_sampling: How example rows are chosen ("head" or "random")
 
     Returns:
         Validated DataFrame
@@ -70,25 +121,54 @@ def validate_sensor_input(df: pd.DataFrame) -> pd.DataFrame:
     Raises:
         SchemaError: If validation fails
     """
-    transform = ValidateSchema(sensor_input_schema)
+    quarantine = Quarantine(quarantine_path) if quarantine_path else None
+    transform = ValidateSchema(
+        sensor_input_schema,
+        quarantine=quarantine,
+        max_failure_cases=max_failure_cases,
+        failure_sampling=failure_sampling,
+    )
     result = transform.transform(df)
     print(f"Validated {len(df)} sensor readings")
+    if quarantine is not None and quarantine.rows:
+        print(quarantine.report())
     return result
 
 
 @task
-def convert_timestamp(df: pd.DataFrame) -> pd.DataFrame:
+def convert_timestamp(
+    df: pd.DataFrame,
+    config: PipelineConfig | None = None,
+    quarantine_path: str | None = None,
+) -> pd.DataFrame:
     """Convert UTC timestamps to Eastern Time.
 
     Args:
         df: DataFrame with timestamp column
+        config: Pipeline configuration with local time zones
+        quarantine_path: Dead-letter file for readings with unparseable
+            timestamps; when set, they are removed instead of failing the
+            task
 
     Returns:
-        DataFrame with timestamp_est column added
+        DataFrame with timestamp_est (and, if a local zone is configured,
+        timestamp_local) column added
     """
-    transform = ConvertTimestamp()
+    config = config or PipelineConfig()
+    quarantine = Quarantine(quarantine_path) if quarantine_path else None
+    transform = ConvertTimestamp(
+        timezone=config.timezone,
+        mesh_timezones=config.mesh_timezones,
+        quarantine=quarantine,
+    )
     result = transform.transform(df)
-    print(f"Converted timestamps for {len(df)} readings")
+    print(
+        f"Converted timestamps for {len(df)} readings "
+        f"({transform.fast_rows} on the fast path, "
+        f"{transform.fallback_rows} with the fallback parser)"
+    )
+    if quarantine is not None and quarantine.rows:
+        print(quarantine.report())
     return result
 
 
@@ -109,11 +189,20 @@ def convert_temperature(df: pd.DataFrame) -> pd.DataFrame:
 
 
 @task
-def validate_processed_reading(df: pd.DataFrame) -> pd.DataFrame:
+def validate_processed_reading(
+    df: pd.DataFrame,
+    quarantine_path: str | None = None,
+    max_failure_cases: int | None = None,
+    failure_sampling: str = "head",
+) -> pd.DataFrame:
     """Validate processed reading data against schema.
 
     Args:
         df: DataFrame with processed readings
+        quarantine_path: Dead-letter file for invalid readings; when set,
+            they are removed instead of failing the task
+        max_failure_cases: Example rows per failing check in the error
+        failure_sampling: How example rows are chosen ("head" or "random")
 
     Returns:
         Validated DataFrame
@@ -121,9 +210,17 @@ def validate_processed_reading(df: pd.DataFrame) -> pd.DataFrame:
     Raises:
         SchemaError: If validation fails
     """
-    transform = ValidateSchema(processed_reading_schema)
+    quarantine = Quarantine(quarantine_path) if quarantine_path else None
+    transform = ValidateSchema(
+        processed_reading_schema,
+        quarantine=quarantine,
+        max_failure_cases=max_failure_cases,
+        failure_sampling=failure_sampling,
+    )
     result = transform.transform(df)
     print(f"Validated {len(df)} processed readings")
+    if quarantine is not None and quarantine.rows:
+        print(quarantine.report())
     return result
 
 
@@ -145,27 +242,90 @@ def detect_anomalies(df: pd.DataFrame, config: PipelineConfig) -> pd.DataFrame:
 
 
 @task
-def aggregate_mesh(df: pd.DataFrame) -> pd.DataFrame:
+def detect_sensor_faults(df: pd.DataFrame, config: PipelineConfig) -> pd.DataFrame:
+    """Flag temperature jumps and stuck sensors.
+
+    Args:
+        df: DataFrame with sensor readings
+        config: Pipeline configuration with rate and stuck limits
+
+    Returns:
+        DataFrame with rate_alert and/or stuck_alert columns added
+    """
+    transform = DetectSensorFaults(
+        max_rate=config.max_temp_rate, stuck_minutes=config.stuck_minutes
+    )
+    result = transform.transform(df)
+    print(f"Checked {len(df)} readings for rate and stuck faults")
+    return result
+
+
+@task
+def apply_rules(df: pd.DataFrame, config: PipelineConfig) -> pd.DataFrame:
+    """Add alert columns from anomaly rules.
+
+    Args:
+        df: DataFrame with sensor readings and built-in alerts
+        config: Pipeline configuration with rules
+
+    Returns:
+        DataFrame with a <name>_alert column per rule
+    """
+    transform = ApplyRules(config.rules)
+    result = transform.transform(df)
+    print(f"Applied {len(config.rules)} anomaly rules to {len(df)} readings")
+    return result
+
+
+@task
+def pack_alert_flags(df: pd.DataFrame) -> pd.DataFrame:
+    """Pack the alert columns into one alert_flags bitmask column.
+
+    Args:
+        df: DataFrame with validated boolean alert columns
+
+    Returns:
+        DataFrame with alert_flags instead of the alert columns
+    """
+    transform = PackAlerts()
+    result = transform.transform(df)
+    print(f"Packed the alerts of {len(df)} readings into alert_flags")
+    return result
+
+
+@task
+def aggregate_mesh(
+    df: pd.DataFrame, rules: dict[str, str] | None = None
+) -> pd.DataFrame:
     """Aggregate readings by mesh network.
 
     Args:
         df: DataFrame with sensor readings
+        rules: Anomaly rules whose alerts are counted per mesh
 
     Returns:
         DataFrame with mesh summaries
     """
-    transform = AggregateMesh()
+    transform = AggregateMesh(alert_counts(rules or {}))
     result = transform.transform(df)
     print(f"Aggregated {len(df)} readings into {len(result)} mesh summaries")
     return result
 
 
 @task
-def validate_mesh_summary(df: pd.DataFrame) -> pd.DataFrame:
+def validate_mesh_summary(
+    df: pd.DataFrame,
+    max_failure_cases: int | None = None,
+    rules: dict[str, str] | None = None,
+    failure_sampling: str = "head",
+) -> pd.DataFrame:
     """Validate mesh summary data against schema.
 
     Args:
         df: DataFrame with mesh summaries
+        max_failure_cases: Example rows per failing check in the error
+        rules: Anomaly rules whose counts the summaries carry
+        failure_sampling: How example rows are chosen ("head" or "random")
 
     Returns:
         Validated DataFrame
@@ -173,7 +333,12 @@ def validate_mesh_summary(df: pd.DataFrame) -> pd.DataFrame:
     Raises:
         SchemaError: If validation fails
     """
-    transform = ValidateSchema(mesh_summary_schema)
+    mesh_summary_schema = rule_summary_schema(rules or {})
+    transform = ValidateSchema(
+        mesh_summary_schema,
+        max_failure_cases=max_failure_cases,
+        failure_sampling=failure_sampling,
+    )
     result = transform.transform(df)
     print(f"Validated {len(df)} mesh summaries")
     return result
@@ -212,6 +377,27 @@ def run_core_pipeline(df: pd.DataFrame, config: PipelineConfig) -> pd.DataFrame:
     return result
 
 
+@task
+def detect_drift(df: pd.DataFrame, config: PipelineConfig) -> pd.DataFrame:
+    """Flag readings that drift from their device's running statistics.
+
+    Args:
+        df: DataFrame with deduplicated sensor readings
+        config: Pipeline configuration with drift settings
+
+    Returns:
+        DataFrame with drift_alert column added
+    """
+    transform = DetectDrift(
+        sigma=config.drift_sigma or 3.0,
+        min_readings=config.drift_min_readings,
+        state_path=config.drift_state,
+    )
+    result = transform.transform(df)
+    print(f"Detected drift in {int(result['drift_alert'].sum())} of {len(df)} readings")
+    return result
+
+
 @task
 def persist(df: pd.DataFrame, output_path: str) -> None:
     """Persist DataFrame to JSON file.
@@ -239,6 +425,22 @@ def sensor_mesh_summary(
     temp_high: float = 60.0,
     hum_low: float = 10.0,
     hum_high: float = 90.0,
+    cache_dir: str | None = None,
+    mesh_ids: list[str] | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    quarantine_path: str | None = None,
+    max_failure_cases: int | None = None,
+    failure_sampling: Literal["head", "random"] = "head",
+    timezone: str | None = None,
+    mesh_timezones: dict[str, str] | None = None,
+    threshold_table: str | None = None,
+    rules: dict[str, str] | None = None,
+    max_temp_rate: float | None = None,
+    stuck_minutes: float | None = None,
+    drift_sigma: float | None = None,
+    drift_state: str | None = None,
+    pack_alerts: bool = False,
 ) -> None:
     """Sensor mesh summary flow.
 
@@ -249,6 +451,34 @@ def sensor_mesh_summary(
         temp_high: High temperature threshold (C)
         hum_low: Low humidity threshold (%)
         hum_high: High humidity threshold (%)
+        cache_dir: Directory for a columnar cache of parsed input files
+        mesh_ids: Only process readings from these meshes
+        start: Only process readings at or after this ISO-8601 timestamp
+        end: Only process readings before this ISO-8601 timestamp
+        quarantine_path: Dead-letter file (.jsonl or .parquet) receiving
+            invalid readings, which are then skipped instead of failing
+            the run
+        max_failure_cases: Example rows per failing check in validation
+            errors (exact counts are always reported); all if None
+        failure_sampling: How those example rows are chosen: the first ones
+            ("head") or a random sample ("random")
+        timezone: IANA time zone for a timestamp_local column
+        mesh_timezones: IANA time zone per mesh_id for timestamp_local
+        threshold_table: JSON or CSV file of per-mesh/per-device threshold
+            overrides
+        rules: Anomaly rules, name to boolean expression (e.g.
+            {"hot_error": "temperature_c > 60 and status != 'ok'"}), each
+            adding <name>_alert and <name>_anomaly_count
+        max_temp_rate: Temperature change (C per minute) between consecutive
+            readings of a device that raises rate_alert; off if None
+        stuck_minutes: Minutes of identical temperatures that raise
+            stuck_alert; off if None
+        drift_sigma: Standard deviations from a device's running mean that
+            raise drift_alert; drift detection is skipped if None
+        drift_state: .npz file keeping per-device drift statistics between
+            runs
+        pack_alerts: Keep alerts as bits of one alert_flags column after
+            validation
     """
     # Create configuration
     config = PipelineConfig(
@@ -256,18 +486,43 @@ def sensor_mesh_summary(
         temp_high=temp_high,
         hum_low=hum_low,
         hum_high=hum_high,
+        thresholds=load_threshold_table(threshold_table) if threshold_table else [],
+        rules=rules or {},
+        max_temp_rate=max_temp_rate,
+        stuck_minutes=stuck_minutes,
+        drift_sigma=drift_sigma,
+        drift_state=drift_state,
+        pack_alerts=pack_alerts,
+        max_failure_cases=max_failure_cases,
+        failure_sampling=failure_sampling,
+        timezone=timezone,
+        mesh_timezones=mesh_timezones or {},
     )
 
     # Execute pipeline tasks
-    df = load_to_df(input)
-    validated_df = validate_sensor_input(df)
-    timestamp_df = convert_timestamp(validated_df)
+    df = load_to_df(input, cache_dir, mesh_ids, start, end)
+    validated_df = validate_sensor_input(
+        df, quarantine_path, max_failure_cases, failure_sampling
+    )
+    timestamp_df = convert_timestamp(validated_df, config, quarantine_path)
     temperature_df = convert_temperature(timestamp_df)
     anomaly_df = detect_anomalies(temperature_df, config)
-    processed_df = validate_processed_reading(anomaly_df)
+    processed_df = validate_processed_reading(
+        anomaly_df, quarantine_path, max_failure_cases, failure_sampling
+    )
     deduplicated_df = deduplicate_readings(processed_df)
-    summary_df = aggregate_mesh(deduplicated_df)
-    validated_summary_df = validate_mesh_summary(summary_df)
+    if config.max_temp_rate is not None or config.stuck_minutes is not None:
+        deduplicated_df = detect_sensor_faults(deduplicated_df, config)
+    if config.drift_sigma is not None:
+        deduplicated_df = detect_drift(deduplicated_df, config)
+    if config.rules:
+        deduplicated_df = apply_rules(deduplicated_df, config)
+    if config.pack_alerts:
+        deduplicated_df = pack_alert_flags(deduplicated_df)
+    summary_df = aggregate_mesh(deduplicated_df, config.rules)
+    validated_summary_df = validate_mesh_summary(
+        summary_df, max_failure_cases, config.rules, failure_sampling
+    )
     persist(validated_summary_df, output_path)
 
 
@@ -0,0 +1,208 @@
+"""Tests for HTTP API data source."""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from sensor_pipeline.models import sensor_input_schema
+from sensor_pipeline.sources import ApiSource
+
+
+READINGS: list[dict[str, Any]] = [
+    {
+        "mesh_id": f"mesh-00{i % 3}",
+        "device_id": f"device-{i}",
+        "timestamp": f"2025-03-26T{10 + i % 10:02d}:00:00Z",
+        "temperature_c": 20.0 + i,
+        "humidity": 40.0,
+        "status": "ok",
+    }
+    for i in range(25)
+]
+
+
+class StandInApi(ThreadingHTTPServer):
+    """Local paginated readings API recording connections and concurrency."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), ReadingsHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests: list[dict[str, list[str]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.chunked = False
+        self.bare_list = False
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/readings"
+
+
+class ReadingsHandler(BaseHTTPRequestHandler):
+    """Serve READINGS in pages of page_size."""
+
+    protocol_version = "HTTP/1.1"
+    server: StandInApi
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        parts = urlsplit(self.path)
+        if parts.path != "/readings":
+            self.send_error(404)
+            return
+        query = parse_qs(parts.query)
+        with server.lock:
+            server.requests.append(query)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(0.02)
+
+        page = int(query["page"][0])
+        page_size = int(query["page_size"][0])
+        total_pages = -(-len(READINGS) // page_size)
+        readings = READINGS[(page - 1) * page_size : page * page_size]
+        payload: Any = readings
+        if not server.bare_list:
+            payload = {"readings": readings, "page": page, "total_pages": total_pages}
+        body = json.dumps(payload).encode()
+
+        with server.lock:
+            server.in_flight -= 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(body), 100):
+                part = body[start : start + 100]
+                self.wfile.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+
+@pytest.fixture
+def api() -> Iterator[StandInApi]:
+    """Run the stand-in API on a background thread."""
+    server = StandInApi()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestApiSource:
+    """Test fetching paginated readings over HTTP."""
+
+    def test_load_all_pages_in_order(self, api: StandInApi) -> None:
+        """Test every page is fetched and concatenated in page order."""
+        df = ApiSource(api.url, page_size=4).load()
+
+        assert df["device_id"].tolist() == [r["device_id"] for r in READINGS]
+        sensor_input_schema.validate(df)
+        assert sorted(int(q["page"][0]) for q in api.requests) == list(range(1, 8))
+
+    def test_connections_are_pooled_and_bounded(self, api: StandInApi) -> None:
+        """Test concurrency and connection count stay within the pool size."""
+        ApiSource(api.url, page_size=2, max_connections=3).load()
+
+        assert len(api.requests) == 13
+        assert api.max_in_flight <= 3
+        assert api.connections <= 3
+
+    def test_iter_chunks_rebatches_pages(self, api: StandInApi) -> None:
+        """Test chunks are sized by rows_per_chunk, not by page size."""
+        chunks = list(ApiSource(api.url, page_size=4).iter_chunks(rows_per_chunk=10))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+    def test_chunked_transfer_encoding(self, api: StandInApi) -> None:
+        """Test chunked response bodies are decoded."""
+        api.chunked = True
+
+        df = ApiSource(api.url, page_size=10).load()
+
+        assert len(df) == len(READINGS)
+
+    def test_bare_list_is_single_page(self, api: StandInApi) -> None:
+        """Test a plain JSON array response is treated as the only page."""
+        api.bare_list = True
+
+        df = ApiSource(api.url, page_size=4).load()
+
+        assert len(df) == 4
+        assert len(api.requests) == 1
+
+    def test_filters_sent_and_applied(self, api: StandInApi) -> None:
+        """Test filters are passed as parameters and enforced locally."""
+        df = ApiSource(api.url, page_size=10).load(
+            mesh_ids=["mesh-001"],
+            time_range=("2025-03-26T12:00:00Z", "2025-03-26T15:00:00Z"),
+        )
+
+        assert api.requests[0]["mesh_id"] == ["mesh-001"]
+        assert api.requests[0]["start"] == ["2025-03-26T12:00:00+00:00"]
+        expected = [
+            r["device_id"]
+            for r in READINGS
+            if r["mesh_id"] == "mesh-001" and "T12" <= r["timestamp"][10:13] < "T15"
+        ]
+        assert df["device_id"].tolist() == expected
+
+    def test_url_query_is_preserved(self, api: StandInApi) -> None:
+        """Test parameters already in the URL are kept on every request."""
+        ApiSource(api.url + "?site=north", page_size=20).load()
+
+        assert all(q["site"] == ["north"] for q in api.requests)
+
+    def test_http_error(self, api: StandInApi) -> None:
+        """Test non-200 responses raise ConnectionError."""
+        source = ApiSource(api.url.replace("/readings", "/missing"))
+
+        with pytest.raises(ConnectionError, match="returned HTTP 404"):
+            source.load()
+
+    def test_load_inside_running_loop(self, api: StandInApi) -> None:
+        """Test synchronous reads inside an event loop fail with a clear error."""
+        source = ApiSource(api.url, page_size=10)
+
+        async def read() -> None:
+            source.load()
+
+        with pytest.raises(RuntimeError, match="use aiter_chunks"):
+            asyncio.run(read())
+
+    def test_aiter_chunks_inside_running_loop(self, api: StandInApi) -> None:
+        """Test pages can be streamed from async code."""
+        source = ApiSource(api.url, page_size=10)
+
+        async def read() -> int:
+            return sum([len(chunk) async for chunk in source.aiter_chunks()])
+
+        assert asyncio.run(read()) == len(READINGS)
+
+    def test_unsupported_scheme(self) -> None:
+        """Test non-HTTP URLs are rejected."""
+        with pytest.raises(ValueError, match="Unsupported API URL scheme: ftp"):
+            ApiSource("ftp://example.com/readings")
@@ -0,0 +1,169 @@
+"""Tests for columnar parsed-input cache."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from sensor_pipeline.sources import FileSource
+from sensor_pipeline.sources.cache import ParsedInputCache
+
+
+def _write_jsonl(path: Path, records: list[dict[str, object]]) -> None:
+    with open(path, "w") as f:
+        for record in records:
+            json.dump(record, f)
+            f.write("\n")
+
+
+class TestParsedInputCache:
+    """Test cache keys and round-tripping."""
+
+    def test_round_trip(self) -> None:
+        """Test a stored frame loads back identically."""
+        df = pd.DataFrame(
+            {
+                "mesh_id": ["mesh-001", "mesh-002"],
+                "temperature_c": [22.4, -3.0],
+                "count": [1, 2],
+                "flag": [True, False],
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ParsedInputCache(tmp)
+            assert cache.put("abc", df)
+            loaded = cache.get("abc")
+            assert loaded is not None
+            pd.testing.assert_frame_equal(loaded, df)
+
+    def test_round_trip_categorical(self) -> None:
+        """Test categorical columns are stored as codes and restored."""
+        df = pd.DataFrame(
+            {"mesh_id": pd.Categorical(["mesh-002", "mesh-001", "mesh-002"])}
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ParsedInputCache(tmp)
+            assert cache.put("abc", df)
+            loaded = cache.get("abc")
+            assert loaded is not None
+            pd.testing.assert_frame_equal(loaded, df)
+
+    def test_miss(self) -> None:
+        """Test a missing entry returns None."""
+        with tempfile.TemporaryDirectory() as tmp:
+            assert ParsedInputCache(tmp).get("missing") is None
+
+    def test_skips_unpicklable_free_columns(self) -> None:
+        """Test object columns with non-string values are not cached."""
+        df = pd.DataFrame({"mesh_id": ["mesh-001", None]})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ParsedInputCache(tmp)
+            assert not cache.put("abc", df)
+            assert cache.get("abc") is None
+
+    def test_key_changes_with_metadata(self) -> None:
+        """Test the default key follows size and mtime without reading the file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.jsonl"
+            _write_jsonl(path, [{"mesh_id": "mesh-001"}])
+            cache = ParsedInputCache(Path(tmp) / "cache")
+
+            key = cache.key(path)
+            stat = path.stat()
+            # Same size and mtime: the contents are not consulted
+            _write_jsonl(path, [{"mesh_id": "mesh-002"}])
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert cache.key(path) == key
+
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert cache.key(path) != key
+
+    def test_key_changes_with_content(self) -> None:
+        """Test that verify_content catches edits keeping size and mtime."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.jsonl"
+            _write_jsonl(path, [{"mesh_id": "mesh-001"}])
+            cache = ParsedInputCache(Path(tmp) / "cache", verify_content=True)
+
+            key = cache.key(path)
+            assert cache.key(path) == key
+
+            stat = path.stat()
+            _write_jsonl(path, [{"mesh_id": "mesh-002"}])
+            # Same size and mtime: only the content hash can tell them apart
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert cache.key(path) != key
+
+    def test_key_changes_with_options(self) -> None:
+        """Test parse options are part of the key."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.jsonl"
+            _write_jsonl(path, [{"mesh_id": "mesh-001"}])
+            cache = ParsedInputCache(Path(tmp) / "cache")
+
+            assert cache.key(path, {"categorical": True}) != cache.key(
+                path, {"categorical": False}
+            )
+
+    def test_put_evicts_old_versions(self) -> None:
+        """Test writing an entry removes those for earlier file versions."""
+        df = pd.DataFrame({"mesh_id": ["mesh-001"]})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.jsonl"
+            _write_jsonl(path, [{"mesh_id": "mesh-001"}])
+            cache = ParsedInputCache(Path(tmp) / "cache")
+            old = cache.key(path)
+            other = cache.key(path, {"categorical": True})
+            assert cache.put(old, df)
+            assert cache.put(other, df)
+
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            new = cache.key(path)
+            assert cache.put(new, df)
+
+            assert cache.get(old) is None
+            assert cache.get(new) is not None
+            # Entries for other parse options are kept
+            assert cache.get(other) is not None
+
+
+class TestFileSourceCache:
+    """Test FileSource integration with the cache."""
+
+    def test_load_uses_cache(self) -> None:
+        """Test second load is served from the cache entry."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.jsonl"
+            _write_jsonl(path, [{"mesh_id": "mesh-001", "temperature_c": 22.4}])
+            cache_dir = Path(tmp) / "cache"
+
+            first = FileSource(path, cache_dir=cache_dir).load()
+            entries = list(cache_dir.glob("*.npz"))
+            assert len(entries) == 1
+
+            # Corrupt the cached value to prove the second load reads it
+            cache = ParsedInputCache(cache_dir)
+            cache.put(entries[0].stem, first.assign(temperature_c=99.0))
+
+            second = FileSource(path, cache_dir=cache_dir).load()
+            assert second["temperature_c"].tolist() == [99.0]
+
+    def test_categorical_not_served_from_plain_entry(self) -> None:
+        """Test entries are separate for each categorical setting."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.jsonl"
+            _write_jsonl(path, [{"mesh_id": "mesh-001", "temperature_c": 22.4}])
+            cache_dir = Path(tmp) / "cache"
+
+            plain = FileSource(path, cache_dir=cache_dir).load()
+            encoded = FileSource(path, cache_dir=cache_dir, categorical=True).load()
+
+            assert plain["mesh_id"].dtype == object
+            assert isinstance(encoded["mesh_id"].dtype, pd.CategoricalDtype)
+            assert len(list(cache_dir.glob("*.npz"))) == 2
@@ -0,0 +1,95 @@
+"""Tests for column-wise frame construction."""
+
+import numpy as np
+import pandas as pd
+
+from sensor_pipeline.models import sensor_input_schema
+from sensor_pipeline.sources.columns import records_to_frame
+from sensor_pipeline.sources.source_base import concat_chunks
+
+
+RECORDS = [
+    {
+        "mesh_id": "mesh-001",
+        "device_id": "device-A",
+        "timestamp": "2025-03-26T13:45:00Z",
+        "temperature_c": 22,
+        "humidity": 41.2,
+        "status": "ok",
+    },
+    {
+        "mesh_id": "mesh-001",
+        "device_id": "device-B",
+        "timestamp": "2025-03-26T13:46:00Z",
+        "temperature_c": -3.5,
+        "humidity": 40,
+        "status": "warning",
+    },
+]
+
+
+class TestRecordsToFrame:
+    """Test typed column construction from parsed records."""
+
+    def test_interns_identifiers_and_coerces_floats(self) -> None:
+        """Test repeated strings are shared and mixed integers become float64."""
+        # Build equal but distinct string objects, as json.loads would
+        records = [
+            dict(record, mesh_id="".join(["mesh-", "001"])) for record in RECORDS
+        ]
+
+        df = records_to_frame(records)
+
+        assert df["mesh_id"].iloc[0] is df["mesh_id"].iloc[1]
+        assert df["temperature_c"].dtype == np.float64
+        assert df["humidity"].dtype == np.float64
+        sensor_input_schema.validate(df)
+
+    def test_categorical_identifiers_validate(self) -> None:
+        """Test categorical identifier columns pass the input schema."""
+        df = records_to_frame(RECORDS, categorical=True)
+
+        for name in ("mesh_id", "device_id", "status"):
+            assert isinstance(df[name].dtype, pd.CategoricalDtype)
+        sensor_input_schema.validate(df)
+
+    def test_missing_keys_and_bad_values_are_kept(self) -> None:
+        """Test unconvertible values are left for schema validation."""
+        df = records_to_frame([{"humidity": "wet"}, {"mesh_id": "mesh-001"}])
+
+        assert list(df.columns) == ["humidity", "mesh_id"]
+        assert df["humidity"].tolist()[0] == "wet"
+        assert df["mesh_id"].isna().tolist() == [True, False]
+
+    def test_whole_number_measurements_pass_input_schema(self) -> None:
+        """Test whole-number measurements become float64 and validate."""
+        records = [
+            {**record, "temperature_c": 22, "humidity": 40} for record in RECORDS
+        ]
+
+        df = records_to_frame(records)
+
+        assert df["temperature_c"].dtype == np.float64
+        assert df["humidity"].dtype == np.float64
+        sensor_input_schema.validate(df)
+
+    def test_null_measurement_becomes_nan(self) -> None:
+        """Test null measurements are NaN so nullable checks catch them."""
+        df = records_to_frame([{"humidity": None}, {"humidity": 1}])
+        assert df["humidity"].dtype == np.float64
+        assert df["humidity"].isna().tolist() == [True, False]
+
+
+class TestConcatChunks:
+    """Test chunk concatenation."""
+
+    def test_categoricals_are_unioned(self) -> None:
+        """Test chunks with different categories stay categorical."""
+        first = records_to_frame(RECORDS[:1], categorical=True)
+        second = records_to_frame(RECORDS[1:], categorical=True)
+
+        df = concat_chunks([first, second])
+
+        assert isinstance(df["device_id"].dtype, pd.CategoricalDtype)
+        assert df["device_id"].tolist() == ["device-A", "device-B"]
+        assert df["status"].cat.categories.tolist() == ["ok", "warning"]
@@ -0,0 +1,98 @@
+"""Tests for compressed input support."""
+
+import gzip
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from sensor_pipeline.sources import FileSource
+from sensor_pipeline.sources.compression import (
+    COMPRESSION_OPENERS,
+    open_text,
+    split_suffixes,
+)
+
+
+RECORDS = [
+    {"mesh_id": f"mesh-{i % 4:03d}", "device_id": f"device-{i}", "humidity": i / 2}
+    for i in range(500)
+]
+
+
+class TestSplitSuffixes:
+    """Test format/compression suffix detection."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("data.jsonl", (".jsonl", None)),
+            ("data.JSONL.GZ", (".jsonl", ".gz")),
+            ("data.2026-10-01.json.bz2", (".json", ".bz2")),
+            ("data.xz", ("", ".xz")),
+            ("data", ("", None)),
+        ],
+    )
+    def test_split(self, name: str, expected: tuple[str, str | None]) -> None:
+        """Test suffix splitting for plain and compressed names."""
+        assert split_suffixes(Path(name)) == expected
+
+
+class TestCompressedFileSource:
+    """Test FileSource with compressed inputs."""
+
+    @pytest.mark.parametrize("compression", sorted(COMPRESSION_OPENERS))
+    def test_load_compressed_jsonl(self, compression: str) -> None:
+        """Test loading JSONL compressed with each stdlib codec."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / f"data.jsonl{compression}"
+            with COMPRESSION_OPENERS[compression](path, "wt") as f:
+                for record in RECORDS:
+                    f.write(json.dumps(record) + "\n")
+
+            df = FileSource(path).load()
+
+            assert len(df) == len(RECORDS)
+            assert df["device_id"].tolist() == [r["device_id"] for r in RECORDS]
+
+    def test_load_compressed_json_chunks(self) -> None:
+        """Test streaming a gzip-compressed JSON array in chunks."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.json.gz"
+            with gzip.open(path, "wt") as f:
+                json.dump(RECORDS, f)
+
+            chunks = list(FileSource(path).iter_chunks(rows_per_chunk=200))
+
+            assert [len(chunk) for chunk in chunks] == [200, 200, 100]
+
+    def test_multi_member_gzip(self) -> None:
+        """Test concatenated gzip members are read as one stream."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.jsonl.gz"
+            with open(path, "wb") as f:
+                for record in RECORDS[:3]:
+                    f.write(gzip.compress((json.dumps(record) + "\n").encode()))
+
+            df = FileSource(path, workers=2).load()
+
+            assert df["device_id"].tolist() == ["device-0", "device-1", "device-2"]
+
+    def test_unsupported_compressed_format(self) -> None:
+        """Test compressed files with an unknown inner format are rejected."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.csv.gz"
+            path.write_bytes(gzip.compress(b"a,b\n"))
+
+            with pytest.raises(ValueError, match=r"Unsupported file format: \.csv\.gz"):
+                FileSource(path).load()
+
+    def test_corrupt_stream_raises(self) -> None:
+        """Test decompression errors surface to the reader."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.jsonl.gz"
+            path.write_bytes(b"not gzip data")
+
+            with pytest.raises(OSError), open_text(path, ".gz") as f:
+                f.read()
@@ -4,6 +4,7 @@ import json
 import tempfile
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from sensor_pipeline.sources import FileSource
@@ -76,3 +77,86 @@ class TestFileSource:
                 source.load()
         finally:
             Path(temp_path).unlink()
+
+    def test_iter_chunks_jsonl(self) -> None:
+        """Test streaming a JSONL file in bounded-size chunks."""
+        data = [
+            {"mesh_id": f"mesh-{i:03d}", "device_id": "device-A", "temperature_c": i}
+            for i in range(5)
+        ]
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            for item in data:
+                json.dump(item, f)
+                f.write("\n")
+            temp_path = f.name
+
+        try:
+            source = FileSource(temp_path)
+            chunks = list(source.iter_chunks(rows_per_chunk=2))
+
+            assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+            assert chunks[2]["mesh_id"].tolist() == ["mesh-004"]
+            assert source.load()["temperature_c"].tolist() == [0, 1, 2, 3, 4]
+        finally:
+            Path(temp_path).unlink()
+
+    def test_iter_chunks_json(self) -> None:
+        """Test streaming a JSON array file in bounded-size chunks."""
+        data = [{"mesh_id": f"mesh-{i:03d}"} for i in range(3)]
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(data, f)
+            temp_path = f.name
+
+        try:
+            chunks = list(FileSource(temp_path).iter_chunks(rows_per_chunk=2))
+            assert [len(chunk) for chunk in chunks] == [2, 1]
+        finally:
+            Path(temp_path).unlink()
+
+    def test_iter_chunks_invalid_size(self) -> None:
+        """Test that non-positive chunk sizes are rejected."""
+        with pytest.raises(ValueError, match="rows_per_chunk must be positive"):
+            FileSource("nonexistent.jsonl").iter_chunks(rows_per_chunk=0)
+
+    def test_iter_chunks_file_not_found(self) -> None:
+        """Test that a missing file is reported before iteration starts."""
+        with pytest.raises(FileNotFoundError):
+            FileSource("nonexistent.jsonl").iter_chunks()
+
+    def test_load_empty_jsonl_file(self) -> None:
+        """Test loading an empty JSONL file."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            temp_path = f.name
+
+        try:
+            df = FileSource(temp_path).load()
+            assert len(df) == 0
+        finally:
+            Path(temp_path).unlink()
+
+    def test_load_jsonl_parallel_matches_serial(self) -> None:
+        """Test that parallel JSONL ingest returns the same frame as serial."""
+        data = [
+            {"mesh_id": f"mesh-{i % 3:03d}", "device_id": f"d-{i}", "humidity": i}
+            for i in range(100)
+        ]
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            for item in data:
+                json.dump(item, f)
+                f.write("\n")
+            temp_path = f.name
+
+        try:
+            serial = FileSource(temp_path).load()
+            parallel = FileSource(temp_path, workers=2).load()
+            pd.testing.assert_frame_equal(parallel, serial)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_invalid_workers(self) -> None:
+        """Test that non-positive worker counts are rejected."""
+        with pytest.raises(ValueError, match="workers must be positive"):
+            FileSource("data.jsonl", workers=0)
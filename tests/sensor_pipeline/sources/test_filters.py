@@ -0,0 +1,118 @@
+"""Tests for source projection and predicate pushdown."""
+
+import json
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sensor_pipeline.sources import FileSource
+from sensor_pipeline.sources.filters import ReadFilter, parse_timestamp
+
+
+RECORDS = [
+    {"mesh_id": "mesh-001", "timestamp": "2025-03-26T13:45:00Z", "humidity": 1.0},
+    {"mesh_id": "mesh-002", "timestamp": "2025-03-26T14:45:00+00:00Z", "humidity": 2.0},
+    {"mesh_id": "mesh-001", "timestamp": "2025-03-26T15:45:00", "humidity": 3.0},
+    {"mesh_id": "mesh-001", "timestamp": "not-a-time", "humidity": 4.0},
+]
+
+
+class TestParseTimestamp:
+    """Test timestamp parsing for time predicates."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2025-03-26T13:45:00Z",
+            "2025-03-26T13:45:00+00:00Z",
+            "2025-03-26T13:45:00",
+            "2025-03-26T08:45:00-05:00",
+        ],
+    )
+    def test_layouts(self, value: str) -> None:
+        """Test supported layouts all resolve to the same UTC instant."""
+        assert parse_timestamp(value) == datetime(
+            2025, 3, 26, 13, 45, tzinfo=timezone.utc
+        )
+
+    def test_invalid(self) -> None:
+        """Test unparseable strings return None."""
+        assert parse_timestamp("yesterday") is None
+
+
+class TestReadFilter:
+    """Test record- and frame-level filtering."""
+
+    def test_record_and_frame_filters_agree(self) -> None:
+        """Test filtering records and filtering a frame give the same rows."""
+        read_filter = ReadFilter(
+            columns=["humidity"],
+            mesh_ids=["mesh-001"],
+            time_range=("2025-03-26T14:00:00Z", None),
+        )
+
+        from_records = pd.DataFrame(list(read_filter.filter_records(RECORDS)))
+        from_frame = read_filter.filter_frame(pd.DataFrame(RECORDS))
+
+        # Unparseable timestamps are kept for validation to report
+        assert from_records["humidity"].tolist() == [3.0, 4.0]
+        pd.testing.assert_frame_equal(from_frame, from_records)
+
+    def test_end_is_exclusive(self) -> None:
+        """Test the end bound excludes readings at exactly that time."""
+        read_filter = ReadFilter(time_range=(None, "2025-03-26T14:45:00Z"))
+        kept = list(read_filter.filter_records(RECORDS[:2]))
+        assert [record["humidity"] for record in kept] == [1.0]
+
+    def test_noop(self) -> None:
+        """Test an empty filter passes records through untouched."""
+        assert ReadFilter().is_noop
+        assert list(ReadFilter().filter_records(RECORDS)) == RECORDS
+
+    def test_invalid_bound(self) -> None:
+        """Test an unparseable time bound is rejected."""
+        with pytest.raises(ValueError, match="Invalid time_range bound"):
+            ReadFilter(time_range=("soon", None))
+
+
+class TestFileSourcePushdown:
+    """Test FileSource honors filters while reading."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_load_with_filters(self, workers: int) -> None:
+        """Test mesh, time and column filters on serial and parallel reads."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            for record in RECORDS:
+                f.write(json.dumps(record) + "\n")
+            temp_path = f.name
+
+        try:
+            df = FileSource(temp_path, workers=workers).load(
+                columns=["mesh_id", "humidity"],
+                mesh_ids=["mesh-001", "mesh-002"],
+                time_range=("2025-03-26T14:00:00Z", "2025-03-26T15:00:00Z"),
+            )
+
+            assert list(df.columns) == ["mesh_id", "humidity"]
+            assert df["humidity"].tolist() == [2.0, 4.0]
+        finally:
+            Path(temp_path).unlink()
+
+    def test_iter_chunks_with_filters(self) -> None:
+        """Test chunks only count readings that pass the filter."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(RECORDS, f)
+            temp_path = f.name
+
+        try:
+            chunks = list(
+                FileSource(temp_path).iter_chunks(
+                    rows_per_chunk=2, mesh_ids=["mesh-001"]
+                )
+            )
+            assert [len(chunk) for chunk in chunks] == [2, 1]
+        finally:
+            Path(temp_path).unlink()
@@ -0,0 +1,56 @@
+"""Tests for incremental JSON array parser."""
+
+import io
+import json
+
+import pytest
+
+from sensor_pipeline.sources.json_stream import iter_json_array
+
+
+class TestIterJsonArray:
+    """Test incremental parsing of top-level JSON arrays."""
+
+    def test_matches_json_load(self) -> None:
+        """Test that streamed elements match a full json.load."""
+        data = [
+            {"mesh_id": f"mesh-{i:03d}", "temperature_c": i / 3, "tags": ["a", "]"]}
+            for i in range(200)
+        ]
+        text = json.dumps(data, indent=2)
+
+        # Tiny reads force elements to straddle buffer boundaries
+        result = list(iter_json_array(io.StringIO(text), read_size=7))
+
+        assert result == data
+
+    def test_scalar_split_across_reads(self) -> None:
+        """Test that numbers split across reads are not truncated."""
+        result = list(iter_json_array(io.StringIO("[12345, 678]"), read_size=3))
+        assert result == [12345, 678]
+
+    def test_empty_array(self) -> None:
+        """Test parsing an empty array."""
+        assert list(iter_json_array(io.StringIO("  [ ]\n"))) == []
+
+    def test_yields_before_end_of_input(self) -> None:
+        """Test that the first element is available before the array closes."""
+        elements = iter_json_array(io.StringIO('[{"a": 1}, {"a": '))
+        assert next(elements) == {"a": 1}
+        with pytest.raises(ValueError):
+            next(elements)
+
+    def test_not_an_array(self) -> None:
+        """Test error for a non-array document."""
+        with pytest.raises(ValueError, match="Expected a top-level JSON array"):
+            list(iter_json_array(io.StringIO('{"a": 1}')))
+
+    def test_missing_separator(self) -> None:
+        """Test error for elements without a separating comma."""
+        with pytest.raises(ValueError, match="Expected ',' or ']'"):
+            list(iter_json_array(io.StringIO("[1 2]")))
+
+    def test_trailing_data(self) -> None:
+        """Test error for content after the closing bracket."""
+        with pytest.raises(ValueError, match="Unexpected data"):
+            list(iter_json_array(io.StringIO("[1] [2]")))
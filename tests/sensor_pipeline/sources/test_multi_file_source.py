@@ -0,0 +1,82 @@
+"""Tests for multi-file data source."""
+
+import gzip
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from sensor_pipeline.sources import MultiFileSource
+
+
+def _write_jsonl(path: Path, gateway: str, count: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        for i in range(count):
+            json.dump({"mesh_id": gateway, "device_id": f"device-{i}"}, f)
+            f.write("\n")
+
+
+class TestMultiFileSource:
+    """Test loading many files as one source."""
+
+    def test_glob_pattern(self) -> None:
+        """Test a glob across directories loads files in sorted order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_jsonl(root / "2026-10-02" / "gw-b.jsonl", "b", 2)
+            _write_jsonl(root / "2026-10-01" / "gw-a.jsonl", "a", 3)
+            _write_jsonl(root / "2026-09-30" / "gw-z.jsonl", "z", 1)
+
+            source = MultiFileSource(str(root / "2026-10-*" / "*.jsonl"))
+            df = source.load()
+
+            assert df["mesh_id"].tolist() == ["a", "a", "a", "b", "b"]
+            assert df.index.tolist() == list(range(5))
+
+    def test_directory_skips_unsupported_files(self) -> None:
+        """Test a directory input picks up JSON/JSONL files only."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_jsonl(root / "gw-a.jsonl", "a", 1)
+            with gzip.open(root / "gw-b.jsonl.gz", "wt") as f:
+                f.write(json.dumps({"mesh_id": "b", "device_id": "device-0"}) + "\n")
+            (root / "README.txt").write_text("not data")
+
+            df = MultiFileSource(root).load()
+
+            assert df["mesh_id"].tolist() == ["a", "b"]
+
+    def test_parallel_load_matches_serial(self) -> None:
+        """Test process-pool loading preserves file order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            paths = []
+            for gateway in "abcd":
+                _write_jsonl(root / f"gw-{gateway}.jsonl", gateway, 4)
+                paths.append(root / f"gw-{gateway}.jsonl")
+
+            serial = MultiFileSource(paths).load()
+            parallel = MultiFileSource(paths, workers=3).load()
+
+            assert parallel.equals(serial)
+            assert len(parallel) == 16
+
+    def test_iter_chunks(self) -> None:
+        """Test chunks are streamed file by file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_jsonl(root / "gw-a.jsonl", "a", 3)
+            _write_jsonl(root / "gw-b.jsonl", "b", 1)
+
+            chunks = list(MultiFileSource(root).iter_chunks(rows_per_chunk=2))
+
+            assert [len(chunk) for chunk in chunks] == [2, 1, 1]
+
+    def test_no_matches(self) -> None:
+        """Test error when a pattern matches nothing."""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = MultiFileSource(str(Path(tmp) / "*.jsonl"))
+            with pytest.raises(FileNotFoundError, match="No input files match"):
+                source.load()
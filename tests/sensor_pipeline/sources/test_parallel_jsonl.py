@@ -0,0 +1,66 @@
+"""Tests for parallel JSON Lines ingest."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from sensor_pipeline.sources.parallel_jsonl import load_jsonl_parallel, split_ranges
+
+
+class TestSplitRanges:
+    """Test newline-aligned byte range splitting."""
+
+    def test_ranges_cover_buffer_on_line_breaks(self) -> None:
+        """Test ranges are contiguous and each ends after a newline."""
+        data = b"".join(b"x" * (i % 7) + b"\n" for i in range(50))
+
+        ranges = split_ranges(data, 6)
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert data[end - 1 : end] == b"\n"
+
+    def test_single_long_line(self) -> None:
+        """Test a buffer with no interior line breaks stays one range."""
+        data = b"y" * 100
+        assert split_ranges(data, 4) == [(0, 100)]
+
+    def test_no_trailing_newline(self) -> None:
+        """Test the last line is kept when the file lacks a final newline."""
+        data = b"a\nb\nc"
+        ranges = split_ranges(data, 3)
+        assert b"".join(data[s:e] for s, e in ranges) == data
+
+
+class TestLoadJsonlParallel:
+    """Test parallel JSONL loading."""
+
+    def test_preserves_record_order(self) -> None:
+        """Test records are concatenated in file order."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            for i in range(37):
+                json.dump({"i": i}, f)
+                f.write("\n\n" if i % 5 == 0 else "\n")
+            temp_path = f.name
+
+        try:
+            df = load_jsonl_parallel(temp_path, workers=3)
+            assert df["i"].tolist() == list(range(37))
+        finally:
+            Path(temp_path).unlink()
+
+    def test_empty_file(self) -> None:
+        """Test loading an empty file returns an empty frame."""
+        with tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False) as f:
+            temp_path = f.name
+
+        try:
+            pd.testing.assert_frame_equal(
+                load_jsonl_parallel(temp_path, workers=2), pd.DataFrame()
+            )
+        finally:
+            Path(temp_path).unlink()
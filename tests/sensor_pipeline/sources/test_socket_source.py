@@ -0,0 +1,181 @@
+"""Tests for socket ingest source."""
+
+import json
+import socket
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from sensor_pipeline.models import PipelineConfig, sensor_input_schema
+from sensor_pipeline.pipeline import create_sensor_pipeline
+from sensor_pipeline.sources import SocketSource
+
+
+def reading(i: int, mesh_id: str = "mesh-001") -> dict[str, object]:
+    """Build one valid sensor reading."""
+    return {
+        "mesh_id": mesh_id,
+        "device_id": f"device-{i}",
+        "timestamp": "2025-03-26T13:45:00Z",
+        "temperature_c": 20.0 + i,
+        "humidity": 40.0,
+        "status": "ok",
+    }
+
+
+def ndjson(*records: dict[str, object]) -> bytes:
+    """Encode records as newline-delimited JSON."""
+    return b"".join(json.dumps(record).encode() + b"\n" for record in records)
+
+
+@pytest.fixture
+def udp_source() -> Iterator[SocketSource]:
+    """Listen for UDP readings on a free local port."""
+    source = SocketSource(protocol="udp", max_batch_rows=5, max_latency=0.2)
+    yield source
+    source.close()
+
+
+@pytest.fixture
+def tcp_source() -> Iterator[SocketSource]:
+    """Listen for TCP readings on a free local port."""
+    source = SocketSource(protocol="tcp", max_batch_rows=5, max_latency=0.2)
+    yield source
+    source.close()
+
+
+def send_udp(source: SocketSource, *payloads: bytes) -> None:
+    """Send datagrams to the source."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for payload in payloads:
+            sock.sendto(payload, source.address)
+
+
+class TestSocketSource:
+    """Test micro-batching readings received over sockets."""
+
+    def test_udp_datagrams(self, udp_source: SocketSource) -> None:
+        """Test one or more readings per datagram are received."""
+        send_udp(udp_source, ndjson(reading(0)), ndjson(reading(1), reading(2)))
+
+        df = udp_source.load()
+
+        assert df["device_id"].tolist() == ["device-0", "device-1", "device-2"]
+        sensor_input_schema.validate(df)
+
+    def test_size_bound_carries_overflow(self, udp_source: SocketSource) -> None:
+        """Test batches hold at most max_batch_rows and keep the rest."""
+        send_udp(udp_source, ndjson(*(reading(i) for i in range(7))))
+
+        first = udp_source.load()
+        second = udp_source.load()
+
+        assert len(first) == 5
+        assert second["device_id"].tolist() == ["device-5", "device-6"]
+
+    def test_latency_bound(self, udp_source: SocketSource) -> None:
+        """Test a partial batch is released after max_latency."""
+        send_udp(udp_source, ndjson(reading(0)))
+
+        start = time.monotonic()
+        df = udp_source.load()
+
+        assert len(df) == 1
+        assert time.monotonic() - start < 1.0
+
+    def test_empty_when_idle(self, udp_source: SocketSource) -> None:
+        """Test load() returns an empty frame when nothing arrives."""
+        assert len(udp_source.load()) == 0
+
+    def test_malformed_lines_skipped(self, udp_source: SocketSource) -> None:
+        """Test invalid lines are counted and dropped."""
+        send_udp(udp_source, b"not json\n[1, 2]\n" + ndjson(reading(0)))
+
+        df = udp_source.load()
+
+        assert len(df) == 1
+        assert udp_source.malformed == 2
+
+    def test_overlong_complete_line_malformed(self) -> None:
+        """Test complete lines longer than max_line_bytes are dropped."""
+        source = SocketSource(max_latency=0.2, max_line_bytes=200)
+        try:
+            long = {**reading(0), "device_id": "d" * 300}
+            send_udp(source, ndjson(long, reading(1)))
+            df = source.load()
+        finally:
+            source.close()
+
+        assert df["device_id"].tolist() == ["device-1"]
+        assert source.malformed == 1
+
+    def test_tcp_lines_split_across_sends(self, tcp_source: SocketSource) -> None:
+        """Test TCP lines split across packets are reassembled."""
+        payload = ndjson(reading(0), reading(1)) + json.dumps(reading(2)).encode()
+        with socket.create_connection(tcp_source.address) as client:
+            client.sendall(payload[:50])
+            time.sleep(0.05)
+            client.sendall(payload[50:])
+
+        df = tcp_source.load()
+
+        # The unterminated last line is complete once the client closes
+        assert df["device_id"].tolist() == ["device-0", "device-1", "device-2"]
+
+    def test_tcp_overlong_line_dropped(self) -> None:
+        """Test a line without a newline past max_line_bytes is not buffered."""
+        source = SocketSource(
+            protocol="tcp", max_batch_rows=5, max_latency=0.2, max_line_bytes=300
+        )
+        try:
+            with socket.create_connection(source.address) as client:
+                client.sendall(b"x" * 1000)
+                assert len(source.load()) == 0
+                assert source.malformed == 1
+                assert all(len(buffer) <= 300 for buffer in source._buffers.values())
+
+                # The rest of the overlong line is skipped up to its newline
+                client.sendall(b"x" * 1000 + b"\n" + ndjson(reading(0)))
+                df = source.load()
+        finally:
+            source.close()
+
+        assert df["device_id"].tolist() == ["device-0"]
+        assert source.malformed == 1
+
+    def test_filters(self, udp_source: SocketSource) -> None:
+        """Test mesh filters are applied to each batch."""
+        send_udp(udp_source, ndjson(reading(0), reading(1, mesh_id="mesh-002")))
+
+        df = udp_source.load(mesh_ids=["mesh-002"])
+
+        assert df["device_id"].tolist() == ["device-1"]
+
+    def test_iter_batches_feeds_pipeline(self, udp_source: SocketSource) -> None:
+        """Test micro-batches run through the pipeline without touching disk."""
+        send_udp(udp_source, ndjson(reading(0), reading(1, mesh_id="mesh-002")))
+        pipeline = create_sensor_pipeline(PipelineConfig())
+        stop = threading.Event()
+
+        results = [
+            pipeline.run(batch)
+            for batch in udp_source.iter_batches(stop=stop, max_batches=1)
+        ]
+
+        assert sorted(results[0]["mesh_id"]) == ["mesh-001", "mesh-002"]
+
+    def test_from_url(self) -> None:
+        """Test sources can be created from a listening URL."""
+        source = SocketSource.from_url("tcp://127.0.0.1:0")
+        try:
+            assert source.protocol == "tcp"
+            assert source.url.startswith("tcp://127.0.0.1:")
+        finally:
+            source.close()
+
+    def test_unsupported_protocol(self) -> None:
+        """Test unknown protocols are rejected."""
+        with pytest.raises(ValueError, match="Unsupported socket protocol: sctp"):
+            SocketSource(protocol="sctp")
@@ -0,0 +1,87 @@
+"""Tests for SQLite data source."""
+
+import sqlite3
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sensor_pipeline.models import sensor_input_schema
+from sensor_pipeline.sources import SqliteSource
+from sensor_pipeline.sources.filters import ReadFilter
+
+
+ROWS = [
+    ("mesh-001", "device-A", "2025-03-26T13:45:00Z", 22.4, 41.2, "ok"),
+    ("mesh-002", "device-B", "2025-03-26T14:45:00Z", 23.1, 42.8, "ok"),
+    ("mesh-001", "device-C", "2025-03-26T15:45:00+00:00Z", -15.2, 35.6, "error"),
+    # 16:30 UTC written with a -05:00 offset sorts before 14:45Z as text
+    ("mesh-001", "device-D", "2025-03-26T11:30:00-05:00", 20, 50, "warning"),
+]
+
+
+@pytest.fixture
+def db_path() -> Iterator[Path]:
+    """Create a temporary readings database."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "archive.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE readings (mesh_id TEXT, device_id TEXT, "
+                "timestamp TEXT, temperature_c REAL, humidity REAL, status TEXT)"
+            )
+            conn.executemany("INSERT INTO readings VALUES (?, ?, ?, ?, ?, ?)", ROWS)
+        yield path
+
+
+class TestSqliteSource:
+    """Test loading readings from SQLite."""
+
+    def test_load_all(self, db_path: Path) -> None:
+        """Test a full load builds a typed frame that passes validation."""
+        df = SqliteSource(db_path).load()
+
+        assert len(df) == 4
+        assert df["temperature_c"].dtype == np.float64
+        sensor_input_schema.validate(df)
+
+    def test_iter_chunks_uses_fetchmany_batches(self, db_path: Path) -> None:
+        """Test chunk sizes follow rows_per_chunk."""
+        chunks = list(SqliteSource(db_path).iter_chunks(rows_per_chunk=3))
+        assert [len(chunk) for chunk in chunks] == [3, 1]
+
+    def test_mesh_and_time_filters(self, db_path: Path) -> None:
+        """Test filters are exact even for non-UTC offsets."""
+        df = SqliteSource(db_path).load(
+            columns=["device_id"],
+            mesh_ids=["mesh-001"],
+            time_range=("2025-03-26T14:00:00Z", "2025-03-26T16:00:00Z"),
+        )
+
+        assert list(df.columns) == ["device_id"]
+        assert df["device_id"].tolist() == ["device-C"]
+
+    def test_query_uses_index(self, db_path: Path) -> None:
+        """Test mesh/time predicates are answered from the index."""
+        source = SqliteSource(db_path)
+        source.create_indexes()
+        query, params = source.build_query(
+            ReadFilter(mesh_ids=["mesh-001"], time_range=("2025-03-26", None))
+        )
+
+        with sqlite3.connect(db_path) as conn:
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+
+        assert "USING INDEX" in " ".join(str(step[-1]) for step in plan)
+
+    def test_categorical(self, db_path: Path) -> None:
+        """Test identifier columns can be loaded as categoricals."""
+        df = SqliteSource(db_path, categorical=True).load()
+        assert df["mesh_id"].dtype == "category"
+
+    def test_missing_database(self) -> None:
+        """Test error for a missing database file."""
+        with pytest.raises(FileNotFoundError):
+            SqliteSource("missing.db").load()
@@ -0,0 +1,132 @@
+"""Tests for bit-packed alert flags."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sensor_pipeline.alert_flags import (
+    FLAGS_COLUMN,
+    alert,
+    count_flags,
+    flag_bits,
+    flag_dtype,
+    is_healthy,
+    pack_alerts,
+    unpack_alerts,
+)
+
+
+def readings() -> pd.DataFrame:
+    """Readings with the built-in alerts, is_healthy and one rule alert."""
+    df = pd.DataFrame(
+        {
+            "mesh_id": ["mesh-001", "mesh-001", "mesh-002", "mesh-002"],
+            "hot_alert": [True, False, False, True],
+            "temperature_alert": [True, False, False, False],
+            "humidity_alert": [False, False, True, False],
+            "status_alert": [False, False, True, False],
+        }
+    )
+    df["is_healthy"] = ~(df["temperature_alert"] | df["humidity_alert"])
+    df["is_healthy"] &= ~df["status_alert"]
+    return df
+
+
+class TestAlertFlags:
+    """Test packing, reading and counting alert flags."""
+
+    def test_pack_layout(self) -> None:
+        """Test health alerts take the lowest bits and columns are replaced."""
+        df = readings()
+        columns = ["hot_alert", "temperature_alert", "humidity_alert", "status_alert"]
+
+        packed = pack_alerts(df, columns)
+
+        assert flag_bits(packed) == [
+            "temperature_alert",
+            "humidity_alert",
+            "status_alert",
+            "hot_alert",
+        ]
+        assert list(packed.columns) == ["mesh_id", FLAGS_COLUMN]
+        assert packed[FLAGS_COLUMN].dtype == np.uint8
+        assert packed[FLAGS_COLUMN].tolist() == [0b1001, 0, 0b0110, 0b1000]
+
+    def test_accessors_match_columns(self) -> None:
+        """Test alert() and is_healthy() read packed and plain frames alike."""
+        df = readings()
+        packed = pack_alerts(df, ["temperature_alert", "status_alert", "hot_alert"])
+
+        for column in ["temperature_alert", "status_alert", "hot_alert"]:
+            assert alert(packed, column).tolist() == df[column].tolist()
+            assert alert(df, column).tolist() == df[column].tolist()
+        # humidity_alert was left as a column, so it no longer affects health
+        assert is_healthy(packed).tolist() == [False, True, False, True]
+        assert is_healthy(df).tolist() == df["is_healthy"].tolist()
+        with pytest.raises(KeyError):
+            alert(packed, "drift_alert")
+
+    def test_layout_follows_filters(self) -> None:
+        """Test the bit layout survives row selection and copies."""
+        packed = pack_alerts(readings(), ["temperature_alert", "hot_alert"])
+
+        subset = packed[packed["mesh_id"] == "mesh-002"].copy()
+
+        assert alert(subset, "hot_alert").tolist() == [False, True]
+
+    def test_unpack_round_trip(self) -> None:
+        """Test unpacking restores every alert column and is_healthy."""
+        df = readings()
+        columns = ["hot_alert", "temperature_alert", "humidity_alert", "status_alert"]
+
+        unpacked = unpack_alerts(pack_alerts(df, columns))
+
+        pd.testing.assert_frame_equal(unpacked[df.columns], df)
+        assert flag_bits(unpacked) == []
+
+    @pytest.mark.parametrize(
+        "n_alerts, dtype",
+        [(3, np.uint8), (8, np.uint8), (9, np.uint16), (40, np.uint64)],
+    )
+    def test_flag_dtype(self, n_alerts: int, dtype: type) -> None:
+        """Test the narrowest dtype holding one bit per alert is used."""
+        assert flag_dtype(n_alerts) == dtype
+
+    def test_too_many_alerts(self) -> None:
+        """Test more than 64 alerts are rejected."""
+        with pytest.raises(ValueError, match="64 bits"):
+            flag_dtype(65)
+
+    @pytest.mark.parametrize("n_rules", [0, 12])
+    def test_count_flags_matches_sums(self, n_rules: int) -> None:
+        """Test per-group bit counts equal per-column sums, across bytes."""
+        rng = np.random.default_rng(0)
+        n = 1000
+        df = pd.DataFrame(
+            {
+                "group": rng.integers(0, 5, n),
+                "temperature_alert": rng.random(n) < 0.2,
+                "humidity_alert": rng.random(n) < 0.2,
+                "status_alert": rng.random(n) < 0.2,
+            }
+        )
+        for i in range(n_rules):
+            df[f"rule{i}_alert"] = rng.random(n) < 0.3
+        columns = [c for c in df.columns if c.endswith("_alert")]
+        df["is_healthy"] = ~df[
+            ["temperature_alert", "humidity_alert", "status_alert"]
+        ].any(axis=1)
+        packed = pack_alerts(df, columns)
+
+        counts, healthy = count_flags(
+            packed[FLAGS_COLUMN].to_numpy(),
+            flag_bits(packed),
+            df["group"].to_numpy(),
+            5,
+        )
+
+        expected = df.groupby("group")[flag_bits(packed)].sum().to_numpy()
+        np.testing.assert_array_equal(counts, expected)
+        np.testing.assert_array_equal(
+            healthy, df.groupby("group")["is_healthy"].sum().to_numpy()
+        )
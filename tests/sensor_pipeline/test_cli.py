@@ -0,0 +1,139 @@
+"""Tests for the command-line interface."""
+
+import json
+import socket
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from sensor_pipeline.cli import follow, timestamp_report
+from sensor_pipeline.pipeline import Pipeline
+from sensor_pipeline.models import PipelineConfig
+from sensor_pipeline.pipeline import create_sensor_pipeline
+from sensor_pipeline.sources import SocketSource, TailFileSource
+
+
+def reading(mesh_id: str, minute: int, temperature_c: float) -> dict[str, Any]:
+    """One valid raw reading."""
+    return {
+        "mesh_id": mesh_id,
+        "device_id": "device-A",
+        "timestamp": f"2025-03-26T13:{minute:02d}:00Z",
+        "temperature_c": temperature_c,
+        "humidity": 50.0,
+        "status": "ok",
+    }
+
+
+class BatchSource:
+    """Live source stand-in yielding fixed micro-batches."""
+
+    file_path = "stub.jsonl"
+
+    def __init__(self, batches: list[pd.DataFrame]):
+        self.batches = batches
+        self.closed = False
+
+    def iter_batches(self, **filters: Any) -> Iterator[pd.DataFrame]:
+        yield from self.batches
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestFollow:
+    """Test the --follow loop."""
+
+    def test_output_covers_all_batches(self, tmp_path: Path) -> None:
+        """Test each rewrite summarizes every batch so far, without duplicates."""
+        first = pd.DataFrame(
+            [reading("mesh-001", 0, 20.0), reading("mesh-002", 0, 30.0)]
+        )
+        # Repeats the mesh-001 reading of the first batch
+        second = pd.DataFrame(
+            [reading("mesh-001", 0, 20.0), reading("mesh-001", 1, 22.0)]
+        )
+        source = BatchSource([first, second])
+        output = tmp_path / "summary.json"
+
+        follow(
+            source,  # type: ignore[arg-type]
+            create_sensor_pipeline(PipelineConfig(), cumulative=True),
+            str(output),
+        )
+
+        summaries = {row["mesh_id"]: row for row in json.loads(output.read_text())}
+        assert summaries["mesh-001"]["total_readings"] == 2
+        assert summaries["mesh-001"]["avg_temperature_c"] == 21.0
+        assert summaries["mesh-002"]["total_readings"] == 1
+        assert source.closed
+
+    def test_socket_batches_report_malformed(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test each socket batch reports the lines it skipped."""
+        source = SocketSource(max_latency=0.2)
+        payload = b"not json\n" + json.dumps(reading("mesh-001", 0, 20.0)).encode()
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(payload, source.address)
+
+        follow(
+            source,
+            create_sensor_pipeline(PipelineConfig(), cumulative=True),
+            str(tmp_path / "summary.json"),
+            {"max_batches": 1},
+        )
+
+        assert "1 new readings; 1 mesh summaries; 1 malformed lines skipped" in (
+            capsys.readouterr().out
+        )
+
+    def test_totals_resume_after_restart(self, tmp_path: Path) -> None:
+        """Test a restarted follow run continues the saved summaries."""
+        path = tmp_path / "readings.jsonl"
+        state_path = tmp_path / "state.json"
+        output = tmp_path / "summary.json"
+
+        def append(*readings: dict[str, Any]) -> None:
+            with open(path, "a") as f:
+                for record in readings:
+                    f.write(json.dumps(record) + "\n")
+
+        def run() -> dict[str, Any]:
+            follow(
+                TailFileSource(path, state_path=state_path),
+                create_sensor_pipeline(PipelineConfig(), cumulative=True),
+                str(output),
+                {"max_batches": 1},
+            )
+            summary: dict[str, Any] = json.loads(output.read_text())[0]
+            return summary
+
+        append(reading("mesh-001", 0, 20.0))
+        assert run()["total_readings"] == 1
+
+        append(reading("mesh-001", 1, 22.0))
+        summary = run()
+        assert summary["total_readings"] == 2
+        assert summary["avg_temperature_c"] == 21.0
+
+
+class TestTimestampReport:
+    """Test reporting of timestamp parsing paths."""
+
+    def test_counts_both_paths(self) -> None:
+        """Test fast-path and fallback rows are reported after a run."""
+        df = pd.DataFrame([reading("mesh-001", 0, 20.0), reading("mesh-001", 1, 21.0)])
+        df.loc[1, "timestamp"] = "March 26 2025 13:01 UTC"
+        pipeline = create_sensor_pipeline(PipelineConfig())
+
+        pipeline.run(df)
+
+        assert timestamp_report(pipeline) == (
+            "Parsed 1 timestamps on the vectorized fast path, "
+            "1 with the fallback parser"
+        )
+        assert timestamp_report(Pipeline([])) is None
@@ -0,0 +1,93 @@
+"""Tests for lazily materialized derived columns."""
+
+import numpy as np
+import pandas as pd
+
+from sensor_pipeline.derived import (
+    add_timezone_view,
+    derived_columns,
+    materialize,
+    timezone_view,
+)
+
+
+def readings() -> pd.DataFrame:
+    """Readings with UTC timestamps."""
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                ["2025-03-26T13:45:00Z", "2025-03-26T18:00:00Z"]
+            ),
+            "value": [1, 2],
+        }
+    )
+
+
+class TestTimezoneView:
+    """Test zero-copy time zone views."""
+
+    def test_shares_buffer(self) -> None:
+        """Test an aware column's view reuses its int64 buffer."""
+        timestamps = readings()["timestamp"]
+
+        view = timezone_view(timestamps, "Etc/GMT+5")
+
+        assert str(view.dt.tz) == "Etc/GMT+5"
+        assert np.shares_memory(
+            view.array.asi8,
+            timestamps.array.asi8,
+        )
+        assert view.iloc[0] == pd.Timestamp("2025-03-26T13:45:00Z")
+
+    def test_naive_taken_as_utc(self) -> None:
+        """Test naive timestamps are treated as UTC."""
+        timestamps = pd.Series(pd.to_datetime(["2025-03-26T13:45:00"]))
+
+        view = timezone_view(timestamps, "Etc/GMT+5")
+
+        assert view.iloc[0].hour == 8
+
+
+class TestDerivedColumns:
+    """Test declaring and materializing derived columns."""
+
+    def test_declared_not_computed(self) -> None:
+        """Test a declared column is absent until materialized."""
+        df = readings()
+        add_timezone_view(df, "timestamp_est", "timestamp", "Etc/GMT+5")
+
+        assert "timestamp_est" not in df
+        assert list(derived_columns(df)) == ["timestamp_est"]
+
+        result = materialize(df)
+        assert result["timestamp_est"].dt.hour.tolist() == [8, 13]
+        assert derived_columns(result) == {}
+        assert "timestamp_est" not in df
+
+    def test_declaration_follows_filtered_rows(self) -> None:
+        """Test the view is computed for the rows that remain."""
+        df = readings()
+        add_timezone_view(df, "timestamp_est", "timestamp", "Etc/GMT+5")
+
+        result = materialize(df[df["value"] > 1].reset_index(drop=True))
+
+        assert result["timestamp_est"].dt.hour.tolist() == [13]
+
+    def test_missing_source_ignored(self) -> None:
+        """Test nothing is computed once the source column is gone."""
+        df = readings()
+        add_timezone_view(df, "timestamp_est", "timestamp", "Etc/GMT+5")
+        summary = df.drop(columns="timestamp")
+
+        assert materialize(summary) is summary
+
+    def test_select_columns(self) -> None:
+        """Test only the requested derived columns are computed."""
+        df = readings()
+        add_timezone_view(df, "timestamp_est", "timestamp", "Etc/GMT+5")
+        add_timezone_view(df, "timestamp_local", "timestamp", "Asia/Tokyo")
+
+        result = materialize(df, ["timestamp_local"])
+
+        assert "timestamp_est" not in result
+        assert result["timestamp_local"].dt.hour.tolist() == [22, 3]
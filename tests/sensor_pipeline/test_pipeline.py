@@ -1,9 +1,14 @@
 """Integration tests for complete pipeline."""
 
+from pathlib import Path
+
 import pandas as pd
+import pytest
+from pydantic import ValidationError
 
 from sensor_pipeline.models import PipelineConfig
 from sensor_pipeline.pipeline import Pipeline, create_sensor_pipeline
+from sensor_pipeline.quarantine import Quarantine
 
 
 class TestPipeline:
@@ -144,3 +149,289 @@ class TestSensorPipeline:
         result = pipeline.run(input_data)
 
         assert result["avg_temperature_f"].iloc[0] == 32.0
+
+    def test_categorical_input_matches_object_input(self) -> None:
+        """Test categorical identifier columns give the same summaries."""
+        input_data = pd.DataFrame(
+            [
+                {
+                    "mesh_id": mesh_id,
+                    "device_id": f"device-{i}",
+                    "timestamp": f"2025-03-26T13:4{i}:00Z",
+                    "temperature_c": 20.0 + i,
+                    "humidity": 50.0,
+                    "status": "ok" if i % 2 else "error",
+                }
+                for i, mesh_id in enumerate(["mesh-002", "mesh-001", "mesh-002"])
+            ]
+        )
+        categorical_data = input_data.astype(
+            {"mesh_id": "category", "device_id": "category", "status": "category"}
+        )
+        # An unobserved category must not produce an empty mesh summary
+        categorical_data["mesh_id"] = categorical_data["mesh_id"].cat.add_categories(
+            ["mesh-999"]
+        )
+
+        expected = create_sensor_pipeline(PipelineConfig()).run(input_data)
+        result = create_sensor_pipeline(PipelineConfig()).run(categorical_data)
+
+        assert result["mesh_id"].tolist() == expected["mesh_id"].tolist()
+        pd.testing.assert_frame_equal(
+            result.drop(columns=["mesh_id"]), expected.drop(columns=["mesh_id"])
+        )
+
+    def test_lazy_derived_columns_match_eager(self) -> None:
+        """Test lazy timestamp_est gives the same summaries."""
+        input_data = pd.DataFrame(
+            [
+                {
+                    "mesh_id": f"mesh-00{i % 2}",
+                    "device_id": f"device-{i}",
+                    "timestamp": f"2025-03-26T13:4{i}:00Z",
+                    "temperature_c": 20.0 + 20 * i,
+                    "humidity": 50.0,
+                    "status": "ok",
+                }
+                for i in range(4)
+            ]
+        )
+
+        expected = create_sensor_pipeline(PipelineConfig()).run(input_data.copy())
+        pipeline = create_sensor_pipeline(PipelineConfig(lazy_derived_columns=True))
+        result = pipeline.run(input_data)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_lazy_derived_columns_with_rules(self) -> None:
+        """Test rules referencing lazy timestamp_est match eager mode."""
+        input_data = pd.DataFrame(
+            [
+                {
+                    "mesh_id": "mesh-001",
+                    "device_id": f"device-{i}",
+                    "timestamp": f"2025-03-26T13:4{i}:00Z",
+                    "temperature_c": 20.0 + 20 * i,
+                    "humidity": 50.0,
+                    "status": "ok",
+                }
+                for i in range(4)
+            ]
+        )
+        # Every reading has an EST timestamp (NaT never equals itself)
+        rules = {"hot": "timestamp_est == timestamp_est and temperature_c > 50"}
+
+        expected = create_sensor_pipeline(PipelineConfig(rules=rules)).run(
+            input_data.copy()
+        )
+        pipeline = create_sensor_pipeline(
+            PipelineConfig(rules=rules, lazy_derived_columns=True)
+        )
+        result = pipeline.run(input_data)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert result["hot_anomaly_count"].tolist() == [2]
+
+    def test_local_time_in_processed_readings(self) -> None:
+        """Test timestamp_local passes processed validation."""
+        input_data = pd.DataFrame(
+            [
+                {
+                    "mesh_id": "mesh-001",
+                    "device_id": "device-A",
+                    "timestamp": "2025-03-26T13:45:00Z",
+                    "temperature_c": 20.0,
+                    "humidity": 50.0,
+                    "status": "ok",
+                }
+            ]
+        )
+        config = PipelineConfig(mesh_timezones={"mesh-001": "Europe/Berlin"})
+        pipeline = create_sensor_pipeline(config)
+
+        processed = Pipeline(pipeline.steps[:4]).run(input_data)
+
+        assert processed["timestamp_local"].iloc[0] == pd.Timestamp("2025-03-26T14:45")
+
+    def test_drift_counts_in_summary(self) -> None:
+        """Test drift detection counts drift across micro-batches per mesh."""
+
+        def batch(temperatures: list[float], minute: int) -> pd.DataFrame:
+            return pd.DataFrame(
+                [
+                    {
+                        "mesh_id": "mesh-001",
+                        "device_id": "device-A",
+                        "timestamp": f"2025-03-26T13:{minute + i:02d}:00Z",
+                        "temperature_c": temperature,
+                        "humidity": 50.0,
+                        "status": "ok",
+                    }
+                    for i, temperature in enumerate(temperatures)
+                ]
+            )
+
+        config = PipelineConfig(drift_sigma=3.0, drift_min_readings=10)
+        pipeline = create_sensor_pipeline(config)
+
+        history = pipeline.run(batch([20.0, 21.0] * 20, 0))
+        result = pipeline.run(batch([35.0, 20.5], 40))
+
+        assert history["drift_anomaly_count"].tolist() == [0]
+        assert result["drift_anomaly_count"].tolist() == [1]
+        assert "drift_anomaly_count" not in (
+            create_sensor_pipeline(PipelineConfig()).run(batch([20.0], 0)).columns
+        )
+
+    def test_sensor_fault_counts_in_summary(self) -> None:
+        """Test rate and stuck alerts pass validation and are counted per mesh."""
+        input_data = pd.DataFrame(
+            [
+                {
+                    "mesh_id": "mesh-001",
+                    "device_id": "device-A",
+                    "timestamp": f"2025-03-26T{hour:02d}:00:00Z",
+                    "temperature_c": temperature,
+                    "humidity": 50.0,
+                    "status": "ok",
+                }
+                for hour, temperature in enumerate([20.0, 20.0, 20.0, 45.0])
+            ]
+        )
+        config = PipelineConfig(max_temp_rate=0.1, stuck_minutes=120)
+
+        result = create_sensor_pipeline(config).run(input_data)
+
+        assert result["rate_anomaly_count"].tolist() == [1]
+        assert result["stuck_anomaly_count"].tolist() == [1]
+
+    @pytest.mark.parametrize("pack_alerts", [False, True])
+    def test_rules_combine_fault_alerts(self, pack_alerts: bool) -> None:
+        """Test rules can use rate and stuck alerts, packed or not."""
+        input_data = pd.DataFrame(
+            [
+                {
+                    "mesh_id": "mesh-001",
+                    "device_id": "device-A",
+                    "timestamp": f"2025-03-26T{hour:02d}:00:00Z",
+                    "temperature_c": temperature,
+                    "humidity": 50.0,
+                    "status": "ok",
+                }
+                for hour, temperature in enumerate([20.0, 20.0, 20.0, 45.0])
+            ]
+        )
+        config = PipelineConfig(
+            max_temp_rate=0.1,
+            stuck_minutes=60,
+            rules={"s": "stuck_alert and status == 'ok'", "r": "not rate_alert"},
+            pack_alerts=pack_alerts,
+        )
+
+        result = create_sensor_pipeline(config).run(input_data)
+
+        assert result["s_anomaly_count"].tolist() == [2]
+        assert result["r_anomaly_count"].tolist() == [3]
+
+    def test_rule_using_disabled_alert_rejected(self) -> None:
+        """Test configuration rejects rules on fault alerts that are off."""
+        with pytest.raises(ValidationError, match="stuck_alert need stuck_minutes"):
+            PipelineConfig(rules={"s": "stuck_alert and status == 'ok'"})
+
+    def test_quarantined_readings_skip_fault_checks(self, tmp_path: Path) -> None:
+        """Test invalid and repeated readings do not raise rate or stuck alerts."""
+        input_data = pd.DataFrame(
+            [
+                {
+                    "mesh_id": "mesh-001",
+                    "device_id": "device-A",
+                    "timestamp": f"2025-03-26T{hour:02d}:00:00Z",
+                    "temperature_c": temperature,
+                    "humidity": 50.0,
+                    "status": status,
+                }
+                for hour, temperature, status in [
+                    (0, 20.0, "ok"),
+                    # Quarantined: its jump must not count against neighbours
+                    (1, 45.0, "rebooting"),
+                    (2, 20.5, "ok"),
+                    # Duplicate of the last reading
+                    (2, 20.5, "ok"),
+                ]
+            ]
+        )
+        config = PipelineConfig(max_temp_rate=0.1, stuck_minutes=120)
+        quarantine = Quarantine(tmp_path / "dead.jsonl")
+
+        result = create_sensor_pipeline(config, quarantine).run(input_data)
+
+        assert quarantine.rows == 1
+        assert result["total_readings"].tolist() == [2]
+        assert result["rate_anomaly_count"].tolist() == [0]
+        assert result["stuck_anomaly_count"].tolist() == [0]
+
+    def test_rule_alerts_in_summary(self) -> None:
+        """Test rules add alert columns and validated per-mesh counts."""
+        input_data = pd.DataFrame(
+            [
+                {
+                    "mesh_id": f"mesh-00{i % 2}",
+                    "device_id": f"device-{i}",
+                    "timestamp": f"2025-03-26T13:4{i}:00Z",
+                    "temperature_c": temperature,
+                    "humidity": 50.0,
+                    "status": status,
+                }
+                for i, (temperature, status) in enumerate(
+                    [(65.0, "error"), (65.0, "ok"), (20.0, "error"), (70.0, "warning")]
+                )
+            ]
+        )
+        config = PipelineConfig(
+            rules={
+                "hot_error": "temperature_c > 60 and status != 'ok'",
+                "hot_and_flagged": "temperature_alert and status_alert",
+            }
+        )
+
+        result = create_sensor_pipeline(config).run(input_data)
+
+        assert result["mesh_id"].tolist() == ["mesh-000", "mesh-001"]
+        assert result["hot_error_anomaly_count"].tolist() == [1, 1]
+        assert result["hot_and_flagged_anomaly_count"].tolist() == [1, 1]
+
+    def test_packed_alerts_match_default(self) -> None:
+        """Test pack_alerts gives the same summaries as alert columns."""
+        input_data = pd.DataFrame(
+            [
+                {
+                    "mesh_id": f"mesh-00{i % 2}",
+                    "device_id": f"device-{i}",
+                    "timestamp": f"2025-03-26T13:4{i}:00Z",
+                    "temperature_c": temperature,
+                    "humidity": humidity,
+                    "status": status,
+                }
+                for i, (temperature, humidity, status) in enumerate(
+                    [
+                        (65.0, 50.0, "error"),
+                        (20.0, 5.0, "ok"),
+                        (20.0, 50.0, "ok"),
+                        (70.0, 95.0, "warning"),
+                    ]
+                )
+            ]
+        )
+        rules = {"hot_error": "temperature_c > 60 and status != 'ok'"}
+
+        expected = create_sensor_pipeline(PipelineConfig(rules=rules)).run(input_data)
+        result = create_sensor_pipeline(
+            PipelineConfig(rules=rules, pack_alerts=True)
+        ).run(input_data)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_unknown_timezone_rejected(self) -> None:
+        """Test configuration rejects unknown zone names."""
+        with pytest.raises(ValidationError, match="Unknown time zone"):
+            PipelineConfig(mesh_timezones={"mesh-001": "Mars/Olympus_Mons"})
@@ -0,0 +1,96 @@
+"""Tests for dead-letter quarantine storage."""
+
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sensor_pipeline.derived import add_timezone_view
+from sensor_pipeline.quarantine import Quarantine
+
+
+class TestQuarantine:
+    """Test writing and reporting quarantined rows."""
+
+    def test_jsonl_appends(self, tmp_path: Path) -> None:
+        """Test rows from several batches are appended with their errors."""
+        quarantine = Quarantine(tmp_path / "out" / "dead.jsonl")
+
+        quarantine.add(pd.DataFrame({"status": ["bad"]}), [["status: isin"]])
+        quarantine.add(
+            pd.DataFrame({"status": [None, "worse"]}),
+            [["status: not_nullable"], ["status: isin"]],
+        )
+
+        dead = pd.read_json(tmp_path / "out" / "dead.jsonl", lines=True)
+        assert dead["status"].tolist() == ["bad", None, "worse"]
+        assert quarantine.rows == 3
+        assert quarantine.counts == {"status: isin": 2, "status: not_nullable": 1}
+
+    def test_timestamps_and_mixed_values(self, tmp_path: Path) -> None:
+        """Test rows with datetimes and mixed-type objects serialize."""
+        quarantine = Quarantine(tmp_path / "dead.jsonl")
+        rows = pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(["2025-03-26T13:45:00"]),
+                "temperature_c": pd.Series(["hot"], dtype=object),
+            }
+        )
+
+        quarantine.add(rows, [["temperature_c: dtype('float64')"]])
+
+        line = (tmp_path / "dead.jsonl").read_text()
+        assert '"timestamp":"2025-03-26T13:45:00.000"' in line
+        assert '"temperature_c":"hot"' in line
+
+    def test_empty_add_writes_nothing(self, tmp_path: Path) -> None:
+        """Test adding no rows leaves no file behind."""
+        quarantine = Quarantine(tmp_path / "dead.jsonl")
+
+        quarantine.add(pd.DataFrame({"status": []}), [])
+
+        assert not (tmp_path / "dead.jsonl").exists()
+
+    def test_report(self, tmp_path: Path) -> None:
+        """Test the report lists totals and per-rule counts."""
+        quarantine = Quarantine(tmp_path / "dead.jsonl")
+        quarantine.add(pd.DataFrame({"status": ["bad"]}), [["status: isin"]])
+
+        assert quarantine.report() == (
+            f"Quarantined 1 invalid rows to {tmp_path / 'dead.jsonl'}\n"
+            "  status: isin: 1"
+        )
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("pyarrow") is not None, reason="pyarrow installed"
+    )
+    def test_parquet_requires_pyarrow(self, tmp_path: Path) -> None:
+        """Test a Parquet dead-letter file needs pyarrow."""
+        with pytest.raises(ImportError, match="requires pyarrow"):
+            Quarantine(tmp_path / "dead.parquet")
+
+    def test_parquet_appends(self, tmp_path: Path) -> None:
+        """Test Parquet dead-letter files accumulate rows."""
+        pytest.importorskip("pyarrow")
+        quarantine = Quarantine(tmp_path / "dead.parquet")
+
+        quarantine.add(pd.DataFrame({"t": pd.Series([1.5], dtype=object)}), [["a"]])
+        quarantine.add(pd.DataFrame({"t": pd.Series(["x"], dtype=object)}), [["b"]])
+
+        dead = pd.read_parquet(tmp_path / "dead.parquet")
+        assert dead["t"].tolist() == ["1.5", "x"]
+        assert [list(errors) for errors in dead["_errors"]] == [["a"], ["b"]]
+
+    def test_derived_columns_materialized(self, tmp_path: Path) -> None:
+        """Test lazily derived columns are written out."""
+        quarantine = Quarantine(tmp_path / "dead.jsonl")
+        rows = pd.DataFrame(
+            {"timestamp": pd.to_datetime(["2025-03-26T13:45:00Z"]), "status": ["bad"]}
+        )
+        add_timezone_view(rows, "timestamp_est", "timestamp", "Etc/GMT+5")
+
+        quarantine.add(rows, [["status: isin"]])
+
+        dead = pd.read_json(tmp_path / "dead.jsonl", lines=True)
+        assert dead["timestamp_est"].tolist() == [pd.Timestamp("2025-03-26T13:45:00Z")]
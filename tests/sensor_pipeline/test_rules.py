@@ -0,0 +1,195 @@
+"""Tests for declarative anomaly rules."""
+
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from sensor_pipeline.models import PipelineConfig
+from sensor_pipeline.rules import RuleSet, alert_counts, load_rules
+
+
+def readings() -> pd.DataFrame:
+    """Readings covering both sides of each comparison, with gaps."""
+    return pd.DataFrame(
+        {
+            "temperature_c": [65.0, 65.0, 20.0, np.nan, -15.0],
+            "humidity": [50.0, 5.0, 15.0, 95.0, np.nan],
+            "status": ["error", "ok", "warning", None, "ok"],
+            "temperature_alert": [True, True, False, False, True],
+        }
+    )
+
+
+class TestRuleSet:
+    """Test rule compilation and evaluation."""
+
+    def test_matches_pandas(self) -> None:
+        """Test rules give the same masks as the equivalent pandas code."""
+        df = readings()
+        rules = RuleSet(
+            {
+                "hot_error": "temperature_c > 60 and status != 'ok'",
+                "band": "10 < humidity <= 20",
+                "bad_status": "status in ['warning', 'error']",
+                "swing": "abs(temperature_c - 20) * 2 >= 70 or not temperature_alert",
+            }
+        )
+
+        masks = rules.evaluate(df)
+
+        t, h, s = df["temperature_c"], df["humidity"], df["status"]
+        expected = {
+            "hot_error": (t > 60) & (s != "ok"),
+            "band": (h > 10) & (h <= 20),
+            "bad_status": s.isin(["warning", "error"]),
+            "swing": ((t - 20).abs() * 2 >= 70) | ~df["temperature_alert"],
+        }
+        for name, mask in expected.items():
+            assert masks[name].tolist() == mask.tolist(), name
+
+    def test_missing_values_only_satisfy_not_equal(self) -> None:
+        """Test NaN and None compare False, except with != and not in."""
+        rules = RuleSet(
+            {
+                "eq": "status == 'ok'",
+                "ne": "status != 'ok'",
+                "notin": "status not in ['ok']",
+                "cold": "temperature_c < 0",
+            }
+        )
+
+        masks = rules.evaluate(readings())
+
+        assert not masks["eq"][3] and masks["ne"][3] and masks["notin"][3]
+        assert not masks["cold"][3]
+
+    def test_shared_subexpressions_compiled_once(self) -> None:
+        """Test repeated subexpressions become one instruction."""
+        shared = RuleSet(
+            {
+                "a": "temperature_c > 60 and status != 'ok'",
+                "b": "status != 'ok' and temperature_c > 60",
+                "c": "(temperature_c > 60) or humidity < 10",
+            }
+        )
+        single = RuleSet({"a": "temperature_c > 60 and status != 'ok'"})
+
+        # c only adds humidity, 10, the comparison and the `or`
+        assert shared.instructions == single.instructions + 4
+        masks = shared.evaluate(readings())
+        assert masks["a"].tolist() == masks["b"].tolist()
+
+    def test_categorical_matches_object(self) -> None:
+        """Test categorical columns give the same masks as object columns."""
+        df = readings()
+        categorical = df.astype({"status": "category"})
+        rules = RuleSet(
+            {
+                "ne": "status != 'ok'",
+                "eq": "'warning' == status",
+                "isin": "status in ['error', 'warning']",
+                "notin": "status not in ['error']",
+            }
+        )
+
+        expected = rules.evaluate(df)
+        result = rules.evaluate(categorical)
+
+        for name in rules.rules:
+            assert result[name].tolist() == expected[name].tolist(), name
+
+    def test_constant_rule_broadcasts(self) -> None:
+        """Test a constant rule gives a full-length mask."""
+        masks = RuleSet({"never": "False"}).evaluate(readings())
+
+        assert masks["never"].tolist() == [False] * 5
+
+    @pytest.mark.parametrize(
+        "rules, message",
+        [
+            ({"Bad-Name": "humidity > 1"}, "Invalid rule name"),
+            ({"status": "humidity > 1"}, "built-in alert"),
+            ({"x": "humidity >"}, "Invalid rule 'x'"),
+            ({"x": "__import__('os')"}, "only abs"),
+            ({"x": "humidity ** 2 > 1"}, "unsupported operator"),
+            ({"x": "status in other"}, "list of constants"),
+            ({"x": "humidity.real > 1"}, "unsupported expression"),
+        ],
+    )
+    def test_invalid_rules(self, rules: dict[str, str], message: str) -> None:
+        """Test unsupported names and expressions are rejected when compiled."""
+        with pytest.raises(ValueError, match=message):
+            RuleSet(rules)
+
+    def test_non_boolean_rule(self) -> None:
+        """Test rules must evaluate to masks."""
+        with pytest.raises(ValueError, match="boolean mask"):
+            RuleSet({"x": "humidity + 1"}).evaluate(readings())
+
+    def test_type_mismatch_names_rule(self) -> None:
+        """Test comparing incompatible types reports the rule."""
+        rules = RuleSet({"hot": "temperature_c > 60", "bad": "status > 5"})
+        with pytest.raises(ValueError, match="Rule 'bad'"):
+            rules.evaluate(readings())
+
+    def test_chained_comparison_shares_and(self) -> None:
+        """Test a < b < c compiles to the same instructions as a < b and b < c."""
+        chained = RuleSet({"x": "0 < humidity < 50"})
+        both = RuleSet(
+            {"x": "0 < humidity < 50", "y": "0 < humidity and humidity < 50"}
+        )
+
+        assert both.instructions == chained.instructions
+        masks = both.evaluate(readings())
+        assert masks["x"].tolist() == masks["y"].tolist()
+
+    def test_missing_column(self) -> None:
+        """Test evaluation names columns the frame lacks."""
+        with pytest.raises(ValueError, match="pressure"):
+            RuleSet({"x": "pressure > 1"}).evaluate(readings())
+
+
+class TestRuleConfig:
+    """Test rule loading and configuration."""
+
+    def test_config_rejects_invalid_rule(self) -> None:
+        """Test PipelineConfig compiles rules on validation."""
+        with pytest.raises(ValidationError, match="Invalid rule"):
+            PipelineConfig(rules={"x": "humidity >"})
+
+    def test_alert_counts(self) -> None:
+        """Test each rule maps to an alert and a count column."""
+        assert alert_counts({"hot": "temperature_c > 60"}) == {
+            "hot_alert": "hot_anomaly_count"
+        }
+
+    def test_load_json(self, tmp_path: Path) -> None:
+        """Test rules load from a JSON object in order."""
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps({"b": "humidity > 1", "a": "humidity < 0"}))
+
+        assert list(load_rules(path).items()) == [
+            ("b", "humidity > 1"),
+            ("a", "humidity < 0"),
+        ]
+
+    def test_load_yaml(self, tmp_path: Path) -> None:
+        """Test rules load from YAML."""
+        pytest.importorskip("yaml")
+        path = tmp_path / "rules.yaml"
+        path.write_text("hot_error: temperature_c > 60 and status != 'ok'\n")
+
+        assert load_rules(path) == {
+            "hot_error": "temperature_c > 60 and status != 'ok'"
+        }
+
+    def test_load_rejects_list(self, tmp_path: Path) -> None:
+        """Test files must hold a mapping of names to expressions."""
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps(["humidity > 1"]))
+
+        with pytest.raises(ValueError, match="must map rule names"):
+            load_rules(path)
@@ -0,0 +1,133 @@
+"""Tests for per-mesh and per-device anomaly thresholds."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from sensor_pipeline.models import PipelineConfig, ThresholdOverride
+from sensor_pipeline.thresholds import load_threshold_table, resolve_thresholds
+
+
+def readings() -> pd.DataFrame:
+    """Readings from a freezer mesh and a greenhouse mesh."""
+    return pd.DataFrame(
+        {
+            "mesh_id": ["freezer", "freezer", "greenhouse", "office", None],
+            "device_id": ["door", "coil", "door", "desk", "coil"],
+        }
+    )
+
+
+def row_limits(limits: dict[str, float | np.ndarray], name: str) -> list[float]:
+    """Per-row values of a limit resolved with overrides."""
+    values = limits[name]
+    assert isinstance(values, np.ndarray)
+    return [float(value) for value in values]
+
+
+CONFIG = PipelineConfig(
+    temp_low=-10.0,
+    temp_high=60.0,
+    thresholds=[
+        ThresholdOverride(mesh_id="freezer", temp_low=-30.0, temp_high=-10.0),
+        ThresholdOverride(mesh_id="greenhouse", hum_low=40.0),
+        ThresholdOverride(device_id="coil", temp_low=-40.0),
+        ThresholdOverride(mesh_id="freezer", device_id="door", temp_high=5.0),
+    ],
+)
+
+
+class TestResolveThresholds:
+    """Test per-row threshold resolution."""
+
+    def test_global_without_overrides(self) -> None:
+        """Test plain config values are returned as scalars."""
+        limits = resolve_thresholds(readings(), PipelineConfig())
+
+        assert limits == {
+            "temp_low": -10.0,
+            "temp_high": 60.0,
+            "hum_low": 10.0,
+            "hum_high": 90.0,
+        }
+
+    def test_precedence(self) -> None:
+        """Test pair beats device beats mesh beats global, per limit."""
+        limits = resolve_thresholds(readings(), CONFIG)
+
+        assert row_limits(limits, "temp_low") == [-30.0, -40.0, -10.0, -10.0, -40.0]
+        assert row_limits(limits, "temp_high") == [5.0, -10.0, 60.0, 60.0, 60.0]
+        assert row_limits(limits, "hum_low") == [10.0, 10.0, 40.0, 10.0, 10.0]
+        assert row_limits(limits, "hum_high") == [90.0] * 5
+
+    def test_categorical_keys(self) -> None:
+        """Test categorical keys, including unobserved ones, match too."""
+        df = readings().astype({"mesh_id": "category", "device_id": "category"})
+        df["mesh_id"] = df["mesh_id"].cat.add_categories(["unused"])
+
+        categorical = resolve_thresholds(df, CONFIG)
+
+        expected = resolve_thresholds(readings(), CONFIG)
+        for name, values in expected.items():
+            np.testing.assert_array_equal(categorical[name], values)
+
+    def test_unknown_keys_ignored(self) -> None:
+        """Test overrides for absent meshes or devices change nothing."""
+        config = PipelineConfig(
+            thresholds=[
+                ThresholdOverride(mesh_id="lab", temp_low=0.0),
+                ThresholdOverride(mesh_id="lab", device_id="door", temp_low=0.0),
+            ]
+        )
+
+        limits = resolve_thresholds(readings(), config)
+
+        assert row_limits(limits, "temp_low") == [-10.0] * 5
+
+    def test_pair_entries_merge_per_limit(self) -> None:
+        """Test entries for the same pair each keep the limits they set."""
+        config = PipelineConfig(
+            thresholds=[
+                ThresholdOverride(mesh_id="freezer", device_id="door", temp_high=10.0),
+                ThresholdOverride(mesh_id="freezer", device_id="door", temp_low=-5.0),
+                ThresholdOverride(mesh_id="freezer", device_id="door", temp_low=-6.0),
+            ]
+        )
+
+        limits = resolve_thresholds(readings(), config)
+
+        assert row_limits(limits, "temp_high") == [10.0, 60.0, 60.0, 60.0, 60.0]
+        assert row_limits(limits, "temp_low") == [-6.0, -10.0, -10.0, -10.0, -10.0]
+
+    def test_override_needs_key(self) -> None:
+        """Test an override without mesh_id or device_id is rejected."""
+        with pytest.raises(ValidationError, match="mesh_id or device_id"):
+            ThresholdOverride(temp_low=0.0)
+
+
+class TestLoadThresholdTable:
+    """Test reading threshold tables from files."""
+
+    def test_json(self, tmp_path: Path) -> None:
+        """Test a JSON list of overrides."""
+        path = tmp_path / "thresholds.json"
+        path.write_text('[{"mesh_id": "freezer", "temp_high": -10}]')
+
+        assert load_threshold_table(path) == [
+            ThresholdOverride(mesh_id="freezer", temp_high=-10.0)
+        ]
+
+    def test_csv_blank_cells_inherit(self, tmp_path: Path) -> None:
+        """Test blank CSV cells are left unset."""
+        path = tmp_path / "thresholds.csv"
+        path.write_text(
+            "mesh_id,device_id,temp_low,temp_high\nfreezer,,-30,-10\n,007,,5\n"
+        )
+
+        assert load_threshold_table(path) == [
+            ThresholdOverride(mesh_id="freezer", temp_low=-30.0, temp_high=-10.0),
+            ThresholdOverride(device_id="007", temp_high=5.0),
+        ]
@@ -0,0 +1,87 @@
+"""Tests for vectorized local time conversion."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sensor_pipeline.timezones import local_time, transition_table, utc_offsets
+
+
+def utc_range(start: str, end: str, freq: str) -> pd.Series:
+    """UTC timestamps from start to end."""
+    return pd.Series(pd.date_range(start, end, freq=freq, tz="UTC"))
+
+
+class TestTransitionTable:
+    """Test offset transition tables."""
+
+    def test_dst_transitions(self) -> None:
+        """Test New York's 2025 DST start and end instants."""
+        instants, offsets = transition_table("America/New_York", 2025, 2025)
+
+        assert instants[1:].view("datetime64[ns]").tolist() == [
+            pd.Timestamp("2025-03-09T07:00:00").value,
+            pd.Timestamp("2025-11-02T06:00:00").value,
+        ]
+        hours = (offsets // 3_600_000_000_000).tolist()
+        assert hours == [-5, -4, -5]
+
+    def test_fixed_offset(self) -> None:
+        """Test a fixed-offset zone has a single entry."""
+        _, offsets = transition_table("Etc/GMT+5", 2024, 2026)
+
+        assert len(offsets) == 1
+
+    def test_cached(self) -> None:
+        """Test tables are built once per zone and span."""
+        first = transition_table("Europe/Berlin", 2025, 2025)
+
+        assert transition_table("Europe/Berlin", 2025, 2025) is first
+
+
+class TestLocalTime:
+    """Test conversion to local wall-clock time."""
+
+    @pytest.mark.parametrize(
+        "tz",
+        ["America/New_York", "Europe/London", "Australia/Lord_Howe", "Etc/GMT+5"],
+    )
+    def test_matches_tz_convert(self, tz: str) -> None:
+        """Test results agree with pandas across DST changes."""
+        timestamps = utc_range("2024-01-01", "2026-01-01", "7min")
+
+        result = local_time(timestamps, tz)
+
+        expected = timestamps.dt.tz_convert(tz).dt.tz_localize(None)
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_per_row_zones(self) -> None:
+        """Test each row uses its own zone."""
+        timestamps = pd.Series(
+            pd.to_datetime(["2025-07-01T12:00:00Z"] * 3), index=[5, 6, 7]
+        )
+        zones = pd.Series(
+            ["America/New_York", "Asia/Tokyo", "America/New_York"],
+            index=[5, 6, 7],
+            dtype="category",
+        )
+
+        result = local_time(timestamps, zones)
+
+        assert result.dt.hour.tolist() == [8, 21, 8]
+        assert list(result.index) == [5, 6, 7]
+
+    def test_nat_preserved(self) -> None:
+        """Test missing timestamps stay missing."""
+        timestamps = pd.to_datetime(pd.Series(["2025-07-01T12:00:00Z", None]))
+
+        result = local_time(timestamps, "Europe/Berlin")
+
+        assert result.isna().tolist() == [False, True]
+        assert result.iloc[0].hour == 14
+
+    def test_all_nat_offsets(self) -> None:
+        """Test offsets of only NaT values are zero."""
+        utc = np.array([np.iinfo(np.int64).min], dtype=np.int64)
+
+        assert utc_offsets(utc, "Asia/Tokyo").tolist() == [0]
@@ -0,0 +1,421 @@
+"""Tests for the vectorized validation fast path."""
+
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import pandera.pandas as pa
+import pytest
+from pandera.errors import SchemaErrors
+
+from sensor_pipeline.models import (
+    mesh_summary_schema,
+    processed_reading_schema,
+    sensor_input_schema,
+)
+from sensor_pipeline.transforms import ValidateSchema
+from sensor_pipeline.validation import (
+    FastValidator,
+    ValidationLedger,
+    sample_failure_rows,
+)
+
+
+def input_frame() -> pd.DataFrame:
+    """Valid sensor input."""
+    return pd.DataFrame(
+        {
+            "mesh_id": ["mesh-001", "mesh-002", "mesh-001"],
+            "device_id": ["device-A", "device-B", "device-C"],
+            "timestamp": [
+                "2025-03-26T13:45:00Z",
+                "2025-03-26T13:46:00+00:00Z",
+                "2025-03-26T13:47:00Z",
+            ],
+            "temperature_c": [22.4, 23.1, -15.2],
+            "humidity": [41.2, 42.8, 35.6],
+            "status": ["ok", "warning", "error"],
+        }
+    )
+
+
+def processed_frame() -> pd.DataFrame:
+    """Valid processed readings."""
+    df = input_frame().drop(columns="timestamp")
+    df["timestamp"] = pd.to_datetime(["2025-03-26T13:45:00"] * 3)
+    df["timestamp_est"] = df["timestamp"] - pd.Timedelta(hours=5)
+    df["temperature_f"] = df["temperature_c"] * 9 / 5 + 32
+    df["temperature_alert"] = [False, False, True]
+    df["humidity_alert"] = [False, False, False]
+    df["status_alert"] = [False, True, True]
+    df["is_healthy"] = [True, False, False]
+    return df
+
+
+def summary_frame() -> pd.DataFrame:
+    """Valid mesh summaries."""
+    return pd.DataFrame(
+        {
+            "mesh_id": ["mesh-001", "mesh-002"],
+            "avg_temperature_c": [3.6, 23.1],
+            "avg_temperature_f": [38.5, 73.6],
+            "avg_humidity": [38.4, 42.8],
+            "total_readings": [2, 1],
+            "temperature_anomaly_count": [1, 0],
+            "humidity_anomaly_count": [0, 0],
+            "status_anomaly_count": [1, 1],
+            "healthy_reading_percentage": [0.0, 0.0],
+        }
+    )
+
+
+Mutation = Callable[[pd.DataFrame], pd.DataFrame]
+
+
+def set_value(column: str, value: object) -> Mutation:
+    """Mutation replacing the middle row's value in one column."""
+
+    def mutate(df: pd.DataFrame) -> pd.DataFrame:
+        values = df[column].astype(object)
+        values.iloc[1] = value
+        return df.assign(**{column: values})
+
+    return mutate
+
+
+COMMON_MUTATIONS: dict[str, Mutation] = {
+    "valid": lambda df: df,
+    "missing_column": lambda df: df.drop(columns="mesh_id"),
+    "extra_column": lambda df: df.assign(extra=1),
+    "reordered": lambda df: df[df.columns[::-1]],
+    "empty_rows": lambda df: df.iloc[0:0],
+    "null_string": set_value("mesh_id", None),
+    "nan_string": set_value("mesh_id", np.nan),
+    "non_str_value": set_value("mesh_id", 7),
+    "bytes_value": set_value("mesh_id", b"mesh-001"),
+    "categorical": lambda df: df.assign(mesh_id=df["mesh_id"].astype("category")),
+    "string_dtype": lambda df: df.assign(mesh_id=df["mesh_id"].astype("string")),
+    "categorical_with_nan": lambda df: df.assign(
+        mesh_id=pd.Categorical(["mesh-001", None] + list(df["mesh_id"][2:]))
+    ),
+}
+
+CASES: list[tuple[pa.DataFrameSchema, Callable[[], pd.DataFrame], str, Mutation]] = []
+for name, mutation in {
+    **COMMON_MUTATIONS,
+    "float32": lambda df: df.assign(humidity=df["humidity"].astype("float32")),
+    "int_measurement": lambda df: df.assign(humidity=[1, 2, 3]),
+    "nan_measurement": set_value("temperature_c", np.nan),
+    "str_measurement": set_value("temperature_c", "hot"),
+    "bad_status": set_value("status", "unknown"),
+    "null_status": set_value("status", None),
+    "categorical_status": lambda df: df.assign(status=df["status"].astype("category")),
+}.items():
+    CASES.append((sensor_input_schema, input_frame, name, mutation))
+for name, mutation in {
+    **COMMON_MUTATIONS,
+    "timestamp_strings": lambda df: df.assign(timestamp=["2025-03-26T13:45:00"] * 3),
+    "timestamp_unparseable": lambda df: df.assign(
+        timestamp=["2025-03-26T13:45:00", "not a time", "2025-03-26T13:45:00"]
+    ),
+    "timestamp_tz_aware": lambda df: df.assign(
+        timestamp=df["timestamp"].dt.tz_localize("UTC")
+    ),
+    "timestamp_nat": set_value("timestamp_est", pd.NaT),
+    "object_bool": lambda df: df.assign(is_healthy=df["is_healthy"].astype(object)),
+    "int_alert": lambda df: df.assign(status_alert=[0, 1, 1]),
+    "bad_status": set_value("status", "unknown"),
+}.items():
+    CASES.append((processed_reading_schema, processed_frame, name, mutation))
+for name, mutation in {
+    "valid": lambda df: df,
+    "missing_column": lambda df: df.drop(columns="avg_humidity"),
+    "extra_column": lambda df: df.assign(extra=1),
+    "float_count": lambda df: df.assign(total_readings=[2.0, 1.0]),
+    "int32_count": lambda df: df.assign(total_readings=np.array([2, 1], "int32")),
+    "nan_average": set_value("avg_humidity", np.nan),
+    "categorical_mesh": lambda df: df.assign(mesh_id=df["mesh_id"].astype("category")),
+}.items():
+    CASES.append((mesh_summary_schema, summary_frame, name, mutation))
+
+
+class TestFastValidator:
+    """Test FastValidator agrees with pandera."""
+
+    @pytest.mark.parametrize(
+        ("schema", "make_frame", "mutation"),
+        [(schema, make, mutation) for schema, make, _, mutation in CASES],
+        ids=[f"{make.__name__}-{name}" for _, make, name, _ in CASES],
+    )
+    def test_equivalent_to_pandera(
+        self,
+        schema: pa.DataFrameSchema,
+        make_frame: Callable[[], pd.DataFrame],
+        mutation: Mutation,
+    ) -> None:
+        """Test the fast path accepts exactly what pandera accepts."""
+        df = mutation(make_frame())
+
+        try:
+            expected = schema.validate(df, lazy=True)
+        except SchemaErrors:
+            expected = None
+        result = FastValidator(schema).validate(df)
+
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            pd.testing.assert_frame_equal(result, expected)
+
+    def test_builtin_schemas_supported(self) -> None:
+        """Test the pipeline's schemas are covered by the fast path."""
+        for schema in (
+            sensor_input_schema,
+            processed_reading_schema,
+            mesh_summary_schema,
+        ):
+            assert FastValidator.supports(schema)
+
+    def test_unsupported_schema(self) -> None:
+        """Test schemas with other checks are rejected."""
+        schema = pa.DataFrameSchema({"x": pa.Column(pa.Float, pa.Check.ge(0))})
+
+        assert not FastValidator.supports(schema)
+        with pytest.raises(ValueError, match="not covered by FastValidator"):
+            FastValidator(schema)
+
+
+class TestValidateSchemaFastPath:
+    """Test ValidateSchema uses the fast path and falls back to pandera."""
+
+    def test_valid_skips_pandera(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test valid frames never reach pandera."""
+        transform = ValidateSchema(sensor_input_schema)
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("pandera should not run")
+
+        monkeypatch.setattr(sensor_input_schema, "validate", fail)
+        df = input_frame()
+
+        pd.testing.assert_frame_equal(transform.transform(df), df)
+
+    def test_invalid_reports_pandera_errors(self) -> None:
+        """Test failures raise pandera's detailed SchemaErrors."""
+        df = set_value("status", "unknown")(input_frame())
+
+        with pytest.raises(SchemaErrors) as fast_error:
+            ValidateSchema(sensor_input_schema).transform(df)
+        with pytest.raises(SchemaErrors) as slow_error:
+            ValidateSchema(sensor_input_schema, fast=False).transform(df)
+
+        pd.testing.assert_frame_equal(
+            fast_error.value.failure_cases, slow_error.value.failure_cases
+        )
+
+    def test_input_not_mutated_by_later_steps(self) -> None:
+        """Test the returned frame is independent of the input's columns."""
+        df = input_frame()
+
+        result = ValidateSchema(sensor_input_schema).transform(df)
+        result["temperature_c"] = 0.0
+        result["new"] = 1
+
+        pd.testing.assert_frame_equal(df, input_frame())
+
+
+class TestValidationLedger:
+    """Test columns validated earlier are not checked again."""
+
+    @pytest.fixture
+    def checked(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Record the names of columns FastValidator actually checks."""
+        names: list[str] = []
+        check_column = FastValidator.check_column
+
+        def spy(
+            self: FastValidator, column: pa.Column, series: pd.Series
+        ) -> pd.Series | None:
+            names.append(str(series.name))
+            return check_column(self, column, series)
+
+        monkeypatch.setattr(FastValidator, "check_column", spy)
+        return names
+
+    def test_unchanged_columns_skipped(self, checked: list[str]) -> None:
+        """Test a later schema only checks new or replaced columns."""
+        ledger = ValidationLedger()
+        df = ValidateSchema(sensor_input_schema, ledger=ledger).transform(input_frame())
+        # Transforms add and replace columns on the validated frame
+        processed = processed_frame()
+        for name in processed.columns.difference(df.columns).union(["timestamp"]):
+            df[name] = processed[name]
+        checked.clear()
+
+        ValidateSchema(processed_reading_schema, ledger=ledger).transform(df)
+
+        assert sorted(checked) == sorted(
+            [
+                "timestamp",
+                "timestamp_est",
+                "temperature_f",
+                "temperature_alert",
+                "humidity_alert",
+                "status_alert",
+                "is_healthy",
+            ]
+        )
+
+    def test_replaced_column_revalidated(self, checked: list[str]) -> None:
+        """Test a column replaced by assignment is checked again."""
+        ledger = ValidationLedger()
+        transform = ValidateSchema(sensor_input_schema, ledger=ledger)
+        df = transform.transform(input_frame())
+
+        df["status"] = df["status"].str.replace("warning", "unknown")
+        checked.clear()
+
+        with pytest.raises(SchemaErrors):
+            transform.transform(df)
+        assert checked == ["status"]
+
+    def test_same_data_different_rules(self, checked: list[str]) -> None:
+        """Test a column is only vouched for under the rules it passed."""
+        ledger = ValidationLedger()
+        df = ValidateSchema(sensor_input_schema, ledger=ledger).transform(input_frame())
+        stricter = pa.DataFrameSchema(
+            {"status": pa.Column(pa.String, pa.Check.isin(["ok"]))}
+        )
+        checked.clear()
+
+        with pytest.raises(SchemaErrors):
+            ValidateSchema(stricter, ledger=ledger).transform(df[["status"]])
+        assert checked == ["status"]
+
+    def test_categorical_columns_tracked(self, checked: list[str]) -> None:
+        """Test categorical columns are recognized when unchanged."""
+        ledger = ValidationLedger()
+        transform = ValidateSchema(sensor_input_schema, ledger=ledger)
+        df = input_frame().astype({"mesh_id": "category", "status": "category"})
+        df = transform.transform(df)
+        checked.clear()
+
+        transform.transform(df)
+
+        assert checked == []
+
+    def test_clear(self, checked: list[str]) -> None:
+        """Test clear() forgets validated columns."""
+        ledger = ValidationLedger()
+        transform = ValidateSchema(sensor_input_schema, ledger=ledger)
+        df = transform.transform(input_frame())
+        ledger.clear()
+        checked.clear()
+
+        transform.transform(df)
+
+        assert len(checked) == len(sensor_input_schema.columns)
+
+    def test_pipeline_results_unchanged(self) -> None:
+        """Test the shared ledger does not change pipeline output."""
+        from sensor_pipeline.models import PipelineConfig
+        from sensor_pipeline.pipeline import create_sensor_pipeline
+
+        pipeline = create_sensor_pipeline(PipelineConfig())
+        without_ledger = [
+            ValidateSchema(step.schema) if isinstance(step, ValidateSchema) else step
+            for step in pipeline.steps
+        ]
+
+        result = pipeline.run(input_frame())
+        expected = type(pipeline)(without_ledger).run(input_frame())
+
+        pd.testing.assert_frame_equal(result, expected)
+
+
+class TestRowFailures:
+    """Test per-rule masks of failing rows."""
+
+    def test_masks_per_rule(self) -> None:
+        """Test each failing rule reports the rows that break it."""
+        df = set_value("status", None)(set_value("mesh_id", 7)(input_frame()))
+        df.loc[2, "status"] = "unknown"
+
+        failures = FastValidator(sensor_input_schema).row_failures(df)
+
+        assert failures is not None
+        assert {rule: mask.tolist() for rule, mask in failures.items()} == {
+            "mesh_id: dtype('str')": [False, True, False],
+            "status: not_nullable": [False, True, False],
+            "status: isin(['ok', 'warning', 'error'])": [False, False, True],
+        }
+
+    def test_unparseable_timestamps(self) -> None:
+        """Test rows whose timestamp cannot be coerced are singled out."""
+        df = processed_frame().assign(
+            timestamp=["2025-03-26T13:45:00", "not a time", "2025-03-26T13:47:00"]
+        )
+
+        failures = FastValidator(processed_reading_schema).row_failures(df)
+
+        assert failures is not None
+        assert failures["timestamp: coerce_dtype('datetime64[ns]')"].tolist() == [
+            False,
+            True,
+            False,
+        ]
+
+    @pytest.mark.parametrize(
+        "mutation",
+        [
+            lambda df: df.drop(columns="mesh_id"),
+            lambda df: df.assign(extra=1),
+            lambda df: df.assign(humidity=df["humidity"].astype("float32")),
+        ],
+        ids=["missing_column", "extra_column", "float32"],
+    )
+    def test_frame_level_failures(self, mutation: Mutation) -> None:
+        """Test failures that dropping rows cannot fix return None."""
+        assert (
+            FastValidator(sensor_input_schema).row_failures(mutation(input_frame()))
+            is None
+        )
+
+    def test_drop_rows_restores_float(self) -> None:
+        """Test measurement columns become float64 once bad rows are gone."""
+        df = set_value("temperature_c", "hot")(input_frame())
+        validator = FastValidator(sensor_input_schema)
+
+        kept = validator.drop_rows(df, np.array([False, True, False]))
+
+        assert kept["temperature_c"].dtype == "float64"
+        assert kept.index.tolist() == [0, 1]
+        assert validator.validate(kept) is not None
+
+
+class TestSampleFailureRows:
+    """Test example row selection for bounded failure reports."""
+
+    failures = {
+        "a": np.arange(10) < 6,
+        "b": np.arange(10) == 9,
+    }
+
+    def test_head(self) -> None:
+        """Test the first failing rows of each rule are kept."""
+        rows = sample_failure_rows(self.failures, 2)
+        assert rows.tolist() == [0, 1, 9]
+
+    def test_random_deterministic(self) -> None:
+        """Test random samples come from failing rows and repeat per seed."""
+        rows = sample_failure_rows(self.failures, 2, "random", seed=1)
+        assert len(rows) == 3
+        assert set(rows) <= {0, 1, 2, 3, 4, 5, 9}
+        again = sample_failure_rows(self.failures, 2, "random", seed=1)
+        assert rows.tolist() == again.tolist()
+
+    def test_unknown_strategy(self) -> None:
+        """Test an unknown strategy is rejected."""
+        with pytest.raises(ValueError, match="Unknown failure sampling"):
+            sample_failure_rows(self.failures, 2, "tail")
@@ -1,8 +1,13 @@
 """Tests for aggregate mesh transform."""
 
 import pandas as pd
+import pytest
 
-from sensor_pipeline.transforms.aggregate_mesh import AggregateMesh
+from sensor_pipeline.transforms.aggregate_mesh import (
+    OPTIONAL_ALERT_COUNTS,
+    AggregateMesh,
+)
+from sensor_pipeline.transforms.pack_alerts import PackAlerts
 
 
 class TestAggregateMesh:
@@ -274,3 +279,102 @@ class TestAggregateMesh:
         mesh_001 = result[result["mesh_id"] == "mesh-001"].iloc[0]
         assert mesh_001["total_readings"] == 4
         assert mesh_001["healthy_reading_percentage"] == 75.0  # 3/4 healthy
+
+    @pytest.mark.parametrize("alert, count", OPTIONAL_ALERT_COUNTS.items())
+    def test_optional_anomaly_counts(self, alert: str, count: str) -> None:
+        """Test optional alert columns are counted when present."""
+        input_data = pd.DataFrame(
+            {
+                "mesh_id": ["mesh-001", "mesh-001", "mesh-002"],
+                "temperature_c": [20.0, 21.0, 22.0],
+                "temperature_f": [68.0, 69.8, 71.6],
+                "humidity": [40.0, 41.0, 42.0],
+                "temperature_alert": [False, False, False],
+                "humidity_alert": [False, False, False],
+                "status_alert": [False, False, False],
+                "is_healthy": [True, True, True],
+                alert: [True, True, False],
+            }
+        )
+
+        result = AggregateMesh().transform(input_data)
+
+        assert result[count].tolist() == [2, 0]
+        assert list(result.columns)[-2:] == [count, "healthy_reading_percentage"]
+
+    def test_extra_alert_counts(self) -> None:
+        """Test alert columns passed in are counted per mesh."""
+        input_data = pd.DataFrame(
+            {
+                "mesh_id": ["mesh-001", "mesh-001"],
+                "temperature_c": [20.0, 21.0],
+                "temperature_f": [68.0, 69.8],
+                "humidity": [40.0, 41.0],
+                "temperature_alert": [False, False],
+                "humidity_alert": [False, False],
+                "status_alert": [False, False],
+                "is_healthy": [True, True],
+                "hot_alert": [True, False],
+            }
+        )
+
+        result = AggregateMesh({"hot_alert": "hot_anomaly_count"}).transform(input_data)
+
+        assert result["hot_anomaly_count"].tolist() == [1]
+
+    @pytest.mark.parametrize("categorical", [False, True])
+    def test_packed_alerts_match_columns(self, categorical: bool) -> None:
+        """Test packed alert flags give the same summary as alert columns."""
+        input_data = pd.DataFrame(
+            {
+                "mesh_id": ["mesh-002", "mesh-001", "mesh-002", "mesh-003"],
+                "temperature_c": [20.0, 21.0, 22.0, 23.0],
+                "temperature_f": [68.0, 69.8, 71.6, 73.4],
+                "humidity": [40.0, 41.0, 42.0, 43.0],
+                "temperature_alert": [True, False, False, False],
+                "humidity_alert": [True, False, True, False],
+                "status_alert": [False, False, False, True],
+                "is_healthy": [False, True, False, False],
+                "hot_alert": [True, True, False, False],
+                "rate_alert": [False, True, False, True],
+            }
+        )
+        if categorical:
+            input_data["mesh_id"] = pd.Categorical(
+                input_data["mesh_id"],
+                categories=["mesh-000", "mesh-001", "mesh-002", "mesh-003"],
+            )
+        transform = AggregateMesh({"hot_alert": "hot_anomaly_count"})
+        expected = transform.transform(input_data)
+
+        packed = PackAlerts().transform(input_data.drop(columns=["rate_alert"]))
+        packed["rate_alert"] = input_data["rate_alert"]
+        result = transform.transform(packed)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_cumulative_matches_single_call(self) -> None:
+        """Test cumulative summaries over batches equal one summary of all rows."""
+        input_data = pd.DataFrame(
+            {
+                "mesh_id": ["mesh-002", "mesh-001", "mesh-002", "mesh-003"],
+                "temperature_c": [20.0, 21.0, float("nan"), 23.0],
+                "temperature_f": [68.0, 69.8, float("nan"), 73.4],
+                "humidity": [40.0, 41.0, 42.0, 43.0],
+                "temperature_alert": [True, False, False, False],
+                "humidity_alert": [True, False, True, False],
+                "status_alert": [False, False, False, True],
+                "is_healthy": [False, True, False, False],
+            }
+        )
+        expected = AggregateMesh().transform(input_data)
+
+        transform = AggregateMesh(cumulative=True)
+        first = transform.transform(input_data.iloc[:2])
+        result = transform.transform(input_data.iloc[2:])
+
+        assert first["total_readings"].tolist() == [1, 1]
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+        # An empty batch repeats the totals
+        empty = transform.transform(input_data.iloc[:0])
+        pd.testing.assert_frame_equal(empty, result)
@@ -0,0 +1,44 @@
+"""Tests for the anomaly rule transform."""
+
+import pandas as pd
+
+from sensor_pipeline.derived import add_timezone_view
+from sensor_pipeline.transforms import ApplyRules
+
+
+class TestApplyRules:
+    """Test ApplyRules alert columns."""
+
+    def test_adds_alert_column_per_rule(self) -> None:
+        """Test each rule becomes a boolean <name>_alert column."""
+        df = pd.DataFrame({"temperature_c": [65.0, 20.0], "status": ["error", "error"]})
+        transform = ApplyRules(
+            {
+                "hot_error": "temperature_c > 60 and status != 'ok'",
+                "any_error": "status == 'error'",
+            }
+        )
+
+        result = transform.transform(df)
+
+        assert result["hot_error_alert"].tolist() == [True, False]
+        assert result["any_error_alert"].tolist() == [True, True]
+        assert result["hot_error_alert"].dtype == bool
+
+    def test_materializes_lazy_columns(self) -> None:
+        """Test rules can reference declared derived columns."""
+        df = pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(["2025-03-26T13:45:00Z"] * 2),
+                "temperature_c": [65.0, 20.0],
+            }
+        )
+        add_timezone_view(df, "timestamp_est", "timestamp", "Etc/GMT+5")
+        transform = ApplyRules(
+            {"hot": "timestamp_est == timestamp and temperature_c > 60"}
+        )
+
+        result = transform.transform(df)
+
+        assert result["hot_alert"].tolist() == [True, False]
+        assert str(result["timestamp_est"].dt.tz) == "Etc/GMT+5"
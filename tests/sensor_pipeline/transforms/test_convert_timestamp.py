@@ -1,8 +1,13 @@
 """Tests for timestamp conversion transform."""
 
+import json
+from pathlib import Path
+
 import pandas as pd
 import pytest
 
+from sensor_pipeline.derived import materialize
+from sensor_pipeline.quarantine import Quarantine
 from sensor_pipeline.transforms import ConvertTimestamp
 
 
@@ -85,6 +90,22 @@ class TestConvertTimestamp:
         with pytest.raises(ValueError):
             transform.transform(df)
 
+    def test_invalid_timestamp_quarantined(self, tmp_path: Path) -> None:
+        """Test unparseable timestamps are quarantined as received."""
+        df = pd.DataFrame(
+            {"timestamp": ["garbage", "2025-03-26T13:45:00Z"], "value": [1, 2]}
+        )
+        quarantine = Quarantine(tmp_path / "dead.jsonl")
+
+        result = ConvertTimestamp(quarantine=quarantine).transform(df)
+
+        assert result["value"].tolist() == [2]
+        assert result["timestamp"].notna().all()
+        assert quarantine.counts == {"timestamp: unparseable": 1}
+        record = json.loads(quarantine.path.read_text())
+        assert record["timestamp"] == "garbage"
+        assert record["_errors"] == ["timestamp: unparseable"]
+
     def test_missing_timestamp_column(self) -> None:
         """Test error when timestamp column is missing."""
         df = pd.DataFrame({"value": [1, 2, 3]})
@@ -92,3 +113,154 @@ class TestConvertTimestamp:
         transform = ConvertTimestamp()
         with pytest.raises(KeyError):
             transform.transform(df)
+
+
+class TestConvertTimestampFastPath:
+    """Test vectorized parsing of the ISO layouts devices send."""
+
+    def test_known_layouts_parsed_fast(self) -> None:
+        """Test every UTC suffix and precision takes the fast path."""
+        df = pd.DataFrame(
+            {
+                "timestamp": [
+                    "2025-03-21T21:22:44.052986Z",
+                    "2025-03-21T21:22:44.052986+00:00Z",
+                    "2025-03-21T21:22:44.052986+00:00",
+                    "2025-03-26T13:45:00Z",
+                    "2025-03-26T13:45:00.5+00:00Z",
+                ]
+            }
+        )
+
+        transform = ConvertTimestamp()
+        result = transform.transform(df)
+
+        assert transform.fast_rows == 5
+        assert transform.fallback_rows == 0
+        assert str(result["timestamp"].dtype) == "datetime64[ns, UTC]"
+        assert result["timestamp"].tolist() == [
+            pd.Timestamp("2025-03-21T21:22:44.052986Z"),
+            pd.Timestamp("2025-03-21T21:22:44.052986Z"),
+            pd.Timestamp("2025-03-21T21:22:44.052986Z"),
+            pd.Timestamp("2025-03-26T13:45:00Z"),
+            pd.Timestamp("2025-03-26T13:45:00.5Z"),
+        ]
+
+    def test_other_layouts_fall_back(self) -> None:
+        """Test only rows outside the fast layouts use mixed parsing."""
+        df = pd.DataFrame(
+            {
+                "timestamp": [
+                    "2025-03-26T13:45:00Z",
+                    "2025-03-26T18:45:00+05:00",
+                    "2025-03-26 13:45:00",
+                    "2025-03-26T13:45:00+00:00Z",
+                ]
+            },
+            index=[10, 11, 12, 13],
+        )
+
+        transform = ConvertTimestamp()
+        result = transform.transform(df)
+
+        assert transform.fast_rows == 2
+        assert transform.fallback_rows == 2
+        assert list(result.index) == [10, 11, 12, 13]
+        assert (result["timestamp"] == pd.Timestamp("2025-03-26T13:45:00Z")).all()
+
+    def test_counts_accumulate(self) -> None:
+        """Test counters add up across batches."""
+        transform = ConvertTimestamp()
+        for _ in range(2):
+            transform.transform(pd.DataFrame({"timestamp": ["2025-03-26T13:45:00Z"]}))
+
+        assert transform.fast_rows == 2
+
+    def test_matches_mixed_parsing(self) -> None:
+        """Test the fast path agrees with pandas' mixed parsing."""
+        times = pd.date_range("2025-03-21", periods=200, freq="37min")
+        text = times.strftime("%Y-%m-%dT%H:%M:%S.%f")
+        suffixes = ["Z", "+00:00Z", "+00:00"] * 67
+        df = pd.DataFrame({"timestamp": [t + s for t, s in zip(text, suffixes)]})
+
+        result = ConvertTimestamp().transform(df.copy())
+
+        expected = pd.to_datetime(
+            df["timestamp"].str.replace("+00:00Z", "Z", regex=False),
+            format="mixed",
+            utc=True,
+        )
+        pd.testing.assert_series_equal(result["timestamp"], expected)
+
+    def test_missing_values_parsed_as_nat(self) -> None:
+        """Test non-string columns still parse through the fallback."""
+        df = pd.DataFrame({"timestamp": ["2025-03-26T13:45:00Z", None]})
+
+        transform = ConvertTimestamp()
+        result = transform.transform(df)
+
+        assert result["timestamp"].isna().tolist() == [False, True]
+        assert transform.fallback_rows == 2
+
+    def test_lazy_declares_view(self) -> None:
+        """Test lazy mode declares timestamp_est instead of adding it."""
+        df = pd.DataFrame({"timestamp": ["2025-03-26T13:45:00Z"]})
+
+        result = ConvertTimestamp(lazy=True).transform(df)
+
+        assert "timestamp_est" not in result
+        est = materialize(result)["timestamp_est"]
+        assert est.iloc[0] == pd.Timestamp("2025-03-26T08:45:00-05:00")
+
+
+class TestConvertTimestampLocalTime:
+    """Test timestamp_local in configured time zones."""
+
+    @staticmethod
+    def readings() -> pd.DataFrame:
+        """Summer and winter readings from two meshes."""
+        return pd.DataFrame(
+            {
+                "mesh_id": ["mesh-001", "mesh-002", "mesh-001", "mesh-003"],
+                "timestamp": [
+                    "2025-07-01T12:00:00Z",
+                    "2025-07-01T12:00:00Z",
+                    "2025-01-15T12:00:00Z",
+                    "2025-01-15T12:00:00Z",
+                ],
+            }
+        )
+
+    def test_not_added_by_default(self) -> None:
+        """Test no local column without a configured zone."""
+        result = ConvertTimestamp().transform(self.readings())
+
+        assert "timestamp_local" not in result
+
+    def test_single_zone_dst(self) -> None:
+        """Test one zone applies DST-aware offsets to every row."""
+        transform = ConvertTimestamp(timezone="America/New_York")
+
+        result = transform.transform(self.readings())
+
+        assert result["timestamp_local"].dt.hour.tolist() == [8, 8, 7, 7]
+        assert result["timestamp_local"].dt.tz is None
+
+    def test_per_mesh_zones(self) -> None:
+        """Test mesh zones override the default zone."""
+        transform = ConvertTimestamp(
+            timezone="America/New_York",
+            mesh_timezones={"mesh-002": "Asia/Tokyo", "mesh-003": "Europe/Berlin"},
+        )
+
+        result = transform.transform(self.readings())
+
+        assert result["timestamp_local"].dt.hour.tolist() == [8, 21, 7, 13]
+
+    def test_unmapped_meshes_default_to_utc(self) -> None:
+        """Test meshes without a zone use UTC when no default is set."""
+        transform = ConvertTimestamp(mesh_timezones={"mesh-002": "Asia/Tokyo"})
+
+        result = transform.transform(self.readings())
+
+        assert result["timestamp_local"].dt.hour.tolist() == [12, 21, 12, 12]
@@ -158,3 +158,53 @@ class TestDeduplicateReadings:
         # Should return empty DataFrame with same columns
         assert len(result) == 0
         assert list(result.columns) == list(df.columns)
+
+    def test_remember_drops_readings_of_earlier_calls(self) -> None:
+        """Test remember=True drops readings already seen in an earlier batch."""
+        df = pd.DataFrame(
+            {
+                "mesh_id": ["mesh-001", "mesh-001", "mesh-002"],
+                "device_id": ["device-A", "device-A", "device-A"],
+                "timestamp": pd.to_datetime(
+                    [
+                        "2025-03-26T13:45:00Z",
+                        "2025-03-26T13:46:00Z",
+                        "2025-03-26T13:45:00Z",
+                    ]
+                ),
+            }
+        )
+        transform = DeduplicateReadings(remember=True)
+
+        first = transform.transform(df.iloc[:1])
+        second = transform.transform(df)
+
+        assert len(first) == 1
+        assert second.index.tolist() == [1, 2]
+        # Without remember each call stands alone
+        assert len(DeduplicateReadings().transform(df)) == 3
+
+    def test_window_forgets_old_readings(self) -> None:
+        """Test readings older than the window are no longer remembered."""
+        df = pd.DataFrame(
+            {
+                "mesh_id": ["mesh-001"] * 3,
+                "device_id": ["device-A"] * 3,
+                "timestamp": pd.to_datetime(
+                    [
+                        "2025-03-26T13:00:00Z",
+                        "2025-03-26T13:30:00Z",
+                        "2025-03-26T15:00:00Z",
+                    ]
+                ),
+            }
+        )
+        transform = DeduplicateReadings(remember=True, window=pd.Timedelta(hours=1))
+
+        for i in range(3):
+            transform.transform(df.iloc[[i]])
+
+        # Only the 15:00 reading is within an hour of the newest one
+        assert len(transform.seen) == 1
+        assert len(transform.transform(df.iloc[[2]])) == 0
+        assert len(transform.transform(df.iloc[[0]])) == 1
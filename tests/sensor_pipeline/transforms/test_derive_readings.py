@@ -0,0 +1,113 @@
+"""Tests for the fused temperature and anomaly transform."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sensor_pipeline.models import PipelineConfig, ThresholdOverride
+from sensor_pipeline.transforms import (
+    ConvertTemperature,
+    DetectAnomalies,
+    DeriveReadings,
+)
+
+
+def readings(n: int = 1_000) -> pd.DataFrame:
+    """Random readings around the default thresholds, with gaps."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "temperature_c": rng.normal(25.0, 25.0, n),
+            "humidity": rng.uniform(0.0, 100.0, n),
+            "status": rng.choice(["ok", "warning", "error"], n).astype(object),
+        }
+    )
+    df.loc[::97, "temperature_c"] = np.nan
+    df.loc[::89, "status"] = None
+    return df
+
+
+class TestDeriveReadings:
+    """Test DeriveReadings against the separate transforms."""
+
+    @pytest.mark.parametrize("chunk_rows", [1, 7, 256, 100_000])
+    def test_matches_separate_transforms(self, chunk_rows: int) -> None:
+        """Test every chunk size gives identical columns."""
+        config = PipelineConfig(temp_low=0.0, temp_high=40.0)
+        expected = DetectAnomalies(config).transform(
+            ConvertTemperature().transform(readings())
+        )
+
+        result = DeriveReadings(config, chunk_rows).transform(readings())
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("chunk_rows", [7, 100_000])
+    def test_threshold_overrides(self, chunk_rows: int) -> None:
+        """Test per-mesh and per-device limits match DetectAnomalies."""
+        df = readings()
+        df["mesh_id"] = np.where(df.index % 3 == 0, "freezer", "greenhouse")
+        df["device_id"] = [f"device-{i % 5}" for i in df.index]
+        config = PipelineConfig(
+            thresholds=[
+                ThresholdOverride(mesh_id="freezer", temp_low=-30.0, temp_high=0.0),
+                ThresholdOverride(device_id="device-1", hum_high=50.0),
+            ]
+        )
+        expected = DetectAnomalies(config).transform(
+            ConvertTemperature().transform(df.copy())
+        )
+
+        result = DeriveReadings(config, chunk_rows).transform(df)
+
+        pd.testing.assert_frame_equal(result, expected)
+        freezer = result[result["mesh_id"] == "freezer"]
+        assert (
+            freezer["temperature_alert"].sum()
+            == (
+                (freezer["temperature_c"] < -30.0) | (freezer["temperature_c"] > 0.0)
+            ).sum()
+        )
+
+    def test_categorical_status(self) -> None:
+        """Test categorical statuses give the same alerts."""
+        config = PipelineConfig()
+        df = readings()
+        expected = DeriveReadings(config).transform(df.copy())
+
+        categorical = df.astype({"status": "category"})
+        result = DeriveReadings(config).transform(categorical)
+
+        pd.testing.assert_frame_equal(
+            result.drop(columns="status"), expected.drop(columns="status")
+        )
+
+    def test_nullable_values(self) -> None:
+        """Test pd.NA statuses alert and NA measurements do not."""
+        df = pd.DataFrame(
+            {
+                "temperature_c": pd.array([70.0, None], dtype="Float64"),
+                "humidity": [50.0, 50.0],
+                "status": pd.Series(["ok", pd.NA], dtype=object),
+            }
+        )
+
+        result = DeriveReadings(PipelineConfig()).transform(df)
+
+        assert result["temperature_alert"].tolist() == [True, False]
+        assert result["status_alert"].tolist() == [False, True]
+        assert result["is_healthy"].tolist() == [False, False]
+
+    def test_empty(self) -> None:
+        """Test an empty frame gets empty columns."""
+        df = readings().iloc[:0]
+
+        result = DeriveReadings(PipelineConfig()).transform(df)
+
+        assert len(result) == 0
+        assert result["is_healthy"].dtype == bool
+
+    def test_invalid_chunk_rows(self) -> None:
+        """Test chunk_rows must be positive."""
+        with pytest.raises(ValueError, match="chunk_rows"):
+            DeriveReadings(PipelineConfig(), chunk_rows=0)
@@ -2,7 +2,7 @@
 
 import pandas as pd
 
-from sensor_pipeline.models import PipelineConfig
+from sensor_pipeline.models import PipelineConfig, ThresholdOverride
 from sensor_pipeline.transforms import DetectAnomalies
 
 
@@ -171,3 +171,25 @@ class TestDetectAnomalies:
         assert not result["temperature_alert"].iloc[0]
         assert not result["humidity_alert"].iloc[0]
         assert not result["status_alert"].iloc[0]
+
+    def test_per_mesh_thresholds(self) -> None:
+        """Test mesh and device overrides replace the global limits."""
+        df = pd.DataFrame(
+            {
+                "mesh_id": ["freezer", "freezer", "office"],
+                "device_id": ["door", "coil", "desk"],
+                "temperature_c": [-20.0, -20.0, -20.0],
+                "humidity": [50.0, 50.0, 50.0],
+                "status": ["ok", "ok", "ok"],
+            }
+        )
+        config = PipelineConfig(
+            thresholds=[
+                ThresholdOverride(mesh_id="freezer", temp_low=-30.0, temp_high=-10.0),
+                ThresholdOverride(device_id="coil", temp_low=-15.0),
+            ]
+        )
+
+        result = DetectAnomalies(config).transform(df)
+
+        assert result["temperature_alert"].tolist() == [False, True, True]
@@ -0,0 +1,160 @@
+"""Tests for the per-device drift detector."""
+
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+
+from sensor_pipeline.transforms import DetectDrift
+
+
+def readings(n: int = 200, shift: float = 0.0, seed: int = 0) -> pd.DataFrame:
+    """Steady readings from two devices in one mesh, interleaved."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "mesh_id": "mesh-001",
+            "device_id": np.where(np.arange(n) % 2, "device-A", "device-B"),
+            "temperature_c": rng.normal(20.0, 1.0, n) + shift,
+            "humidity": rng.normal(50.0, 2.0, n),
+        }
+    )
+
+
+class TestDetectDrift:
+    """Test DetectDrift statistics and alerts."""
+
+    def test_statistics_match_pandas(self) -> None:
+        """Test chunked updates give each device's exact mean and variance."""
+        df = readings()
+        transform = DetectDrift(chunk_rows=7)
+        transform.transform(df.copy())
+
+        expected = df.groupby("device_id")["temperature_c"].agg(["mean", "var"])
+        rows = transform.devices.get_indexer(
+            pd.MultiIndex.from_arrays(
+                [["mesh-001", "mesh-001"], expected.index],
+            )
+        )
+        np.testing.assert_allclose(transform.mean[rows, 0], expected["mean"])
+        np.testing.assert_allclose(
+            transform.m2[rows, 0] / (transform.count[rows, 0] - 1), expected["var"]
+        )
+
+    def test_flags_drifting_readings(self) -> None:
+        """Test readings far from a device's history are flagged."""
+        df = readings()
+        df.loc[190:, "temperature_c"] += 15.0
+
+        result = DetectDrift(sigma=5.0).transform(df)
+
+        # The drifted readings widen the statistics, so the onset is flagged
+        assert result["drift_alert"].iloc[190:194].all()
+        assert not result["drift_alert"].iloc[:190].any()
+
+    def test_single_chunk_batch_is_scored(self) -> None:
+        """Test a batch smaller than chunk_rows is scored against its own rows."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "mesh_id": "mesh-001",
+                "device_id": "device-A",
+                "temperature_c": rng.normal(20.0, 1.0, 1000),
+                "humidity": 50.0,
+            }
+        )
+        df.loc[500, "temperature_c"] = 100.0
+
+        result = DetectDrift(sigma=5.0).transform(df)
+
+        assert result["drift_alert"].tolist() == [i == 500 for i in range(1000)]
+
+    def test_alerts_do_not_depend_on_chunk_rows(self) -> None:
+        """Test chunking only bounds memory, not which readings are flagged."""
+        df = readings()
+        df.loc[190:, "temperature_c"] += 15.0
+
+        expected = DetectDrift(chunk_rows=1).transform(df.copy())
+        for chunk_rows in (7, 64, 65_536):
+            result = DetectDrift(chunk_rows=chunk_rows).transform(df.copy())
+            assert result["drift_alert"].tolist() == expected["drift_alert"].tolist()
+
+    def test_needs_min_readings(self) -> None:
+        """Test devices without enough history never alert."""
+        df = readings(n=20)
+        df.loc[10:, "temperature_c"] += 15.0
+
+        result = DetectDrift(min_readings=30, chunk_rows=5).transform(df)
+
+        assert not result["drift_alert"].any()
+
+    def test_same_device_id_in_other_mesh_is_separate(self) -> None:
+        """Test statistics are kept per (mesh_id, device_id)."""
+        transform = DetectDrift()
+        transform.transform(readings())
+        other_mesh = readings(n=10, shift=30.0).assign(mesh_id="mesh-002")
+
+        result = transform.transform(other_mesh)
+
+        assert not result["drift_alert"].any()
+        assert len(transform.devices) == 4
+
+    def test_state_carries_across_calls(self) -> None:
+        """Test a later batch is scored against earlier batches."""
+        transform = DetectDrift()
+        transform.transform(readings())
+
+        result = transform.transform(readings(n=10, shift=15.0, seed=1))
+
+        assert result["drift_alert"].all()
+        assert transform.count[:, 0].tolist() == [105, 105]
+
+    def test_state_persists_between_runs(self, tmp_path: Path) -> None:
+        """Test statistics saved by one detector are loaded by the next."""
+        state = tmp_path / "drift.npz"
+        DetectDrift(state_path=state).transform(readings())
+
+        restored = DetectDrift(state_path=state)
+        result = restored.transform(readings(n=10, shift=15.0, seed=1))
+
+        assert result["drift_alert"].all()
+        assert restored.count[:, 0].tolist() == [105, 105]
+
+    def test_missing_measurements_skipped(self) -> None:
+        """Test NaN readings neither alert nor change the statistics."""
+        df = readings()
+        df.loc[150:, "humidity"] = np.nan
+        transform = DetectDrift()
+
+        result = transform.transform(df)
+
+        assert transform.count[:, 1].tolist() == [75, 75]
+        assert not result["drift_alert"].iloc[150:].any()
+
+    def test_categorical_identifiers(self) -> None:
+        """Test categorical keys give the same alerts as object keys."""
+        df = readings()
+        df.loc[190:, "temperature_c"] += 15.0
+        categorical = df.astype({"mesh_id": "category", "device_id": "category"})
+
+        expected = DetectDrift(sigma=5.0).transform(df)
+        result = DetectDrift(sigma=5.0).transform(categorical)
+
+        assert expected["drift_alert"].any()
+        assert result["drift_alert"].tolist() == expected["drift_alert"].tolist()
+
+    def test_empty_frame(self) -> None:
+        """Test an empty frame gets an empty alert column."""
+        result = DetectDrift().transform(readings().iloc[:0].copy())
+
+        assert result["drift_alert"].dtype == bool
+        assert len(result) == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"sigma": 0.0}, {"min_readings": 1}, {"chunk_rows": 0}],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, float]) -> None:
+        """Test out-of-range arguments are rejected."""
+        with pytest.raises(ValueError):
+            DetectDrift(**kwargs)  # type: ignore[arg-type]
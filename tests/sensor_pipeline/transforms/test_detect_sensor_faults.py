@@ -0,0 +1,145 @@
+"""Tests for rate-of-change and stuck-sensor detection."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sensor_pipeline.transforms import DetectSensorFaults
+
+
+def series(
+    temperatures: list[float], minutes: list[int], device_id: str = "device-A"
+) -> pd.DataFrame:
+    """Readings of one device at the given minutes past 13:00 UTC."""
+    return pd.DataFrame(
+        {
+            "mesh_id": "mesh-001",
+            "device_id": device_id,
+            "timestamp": pd.Timestamp("2025-03-26T13:00:00Z")
+            + pd.to_timedelta(minutes, unit="min"),
+            "temperature_c": temperatures,
+        }
+    )
+
+
+class TestDetectSensorFaults:
+    """Test DetectSensorFaults alerts."""
+
+    def test_rate_alert(self) -> None:
+        """Test a change faster than max_rate flags the later reading."""
+        df = series([20.0, 21.0, 31.0, 32.0], [0, 1, 3, 13])
+
+        result = DetectSensorFaults(max_rate=2.0).transform(df)
+
+        # 1 C/min, 5 C/min, 0.1 C/min
+        assert result["rate_alert"].tolist() == [False, False, True, False]
+        assert "stuck_alert" not in result.columns
+
+    def test_unsorted_rows_and_interleaved_devices(self) -> None:
+        """Test diffs are taken per device in time order, whatever the row order."""
+        df = pd.concat(
+            [
+                series([20.0, 30.0, 31.0], [0, 1, 2]),
+                series([50.0, 50.5, 51.0], [0, 1, 2], device_id="device-B"),
+            ],
+            ignore_index=True,
+        )
+        shuffled = df.sample(frac=1.0, random_state=1)
+
+        result = DetectSensorFaults(max_rate=2.0).transform(shuffled.copy())
+
+        assert result["rate_alert"].sort_index().tolist() == [
+            False,
+            True,
+            False,
+            False,
+            False,
+            False,
+        ]
+
+    def test_same_device_id_in_other_mesh_is_separate(self) -> None:
+        """Test readings of other meshes do not form diffs with this one."""
+        df = pd.concat(
+            [
+                series([20.0], [0]),
+                series([60.0], [1]).assign(mesh_id="mesh-002"),
+            ],
+            ignore_index=True,
+        )
+
+        result = DetectSensorFaults(max_rate=2.0).transform(df)
+
+        assert not result["rate_alert"].any()
+
+    def test_same_timestamp_has_no_rate(self) -> None:
+        """Test repeated instants are not treated as infinite rates."""
+        df = series([20.0, 40.0], [5, 5])
+
+        result = DetectSensorFaults(max_rate=2.0).transform(df)
+
+        assert not result["rate_alert"].any()
+
+    def test_stuck_alert(self) -> None:
+        """Test identical values are flagged once they last stuck_minutes."""
+        df = series([20.0, 20.0, 20.0, 20.0, 21.0, 21.0], [0, 30, 60, 90, 100, 200])
+
+        result = DetectSensorFaults(stuck_minutes=60).transform(df)
+
+        assert result["stuck_alert"].tolist() == [
+            False,
+            False,
+            True,
+            True,
+            False,
+            True,
+        ]
+        assert "rate_alert" not in result.columns
+
+    def test_missing_temperature_breaks_run(self) -> None:
+        """Test NaN neither extends a stuck run nor alerts."""
+        df = series([20.0, np.nan, 20.0, 20.0], [0, 30, 60, 90])
+
+        result = DetectSensorFaults(max_rate=0.5, stuck_minutes=60).transform(df)
+
+        assert not result["stuck_alert"].any()
+        assert not result["rate_alert"].any()
+
+    def test_categorical_identifiers(self) -> None:
+        """Test categorical keys give the same alerts as object keys."""
+        rng = np.random.default_rng(0)
+        n = 500
+        df = pd.DataFrame(
+            {
+                "mesh_id": rng.choice(["mesh-001", "mesh-002"], n),
+                "device_id": rng.choice(["device-A", "device-B", "device-C"], n),
+                "timestamp": pd.Timestamp("2025-03-26", tz="UTC")
+                + pd.to_timedelta(rng.integers(0, 600, n), unit="min"),
+                "temperature_c": rng.integers(18, 22, n).astype(float),
+            }
+        )
+        categorical = df.astype({"mesh_id": "category", "device_id": "category"})
+        transform = DetectSensorFaults(max_rate=1.0, stuck_minutes=30)
+
+        expected = transform.transform(df)
+        result = transform.transform(categorical)
+
+        assert expected["rate_alert"].any() and expected["stuck_alert"].any()
+        pd.testing.assert_frame_equal(
+            result[["rate_alert", "stuck_alert"]],
+            expected[["rate_alert", "stuck_alert"]],
+        )
+
+    def test_empty_frame(self) -> None:
+        """Test an empty frame gets empty alert columns."""
+        df = series([], [])
+
+        result = DetectSensorFaults(max_rate=1.0, stuck_minutes=30).transform(df)
+
+        assert result["rate_alert"].dtype == bool
+        assert result["stuck_alert"].dtype == bool
+
+    @pytest.mark.parametrize("kwargs", [{"max_rate": 0.0}, {"stuck_minutes": -1.0}])
+    def test_invalid_limits(self, kwargs: dict[str, float]) -> None:
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            DetectSensorFaults(**kwargs)
@@ -0,0 +1,42 @@
+"""Tests for packing alert columns."""
+
+import numpy as np
+import pandas as pd
+
+from sensor_pipeline.alert_flags import FLAGS_COLUMN, alert, flag_bits
+from sensor_pipeline.transforms import PackAlerts
+
+
+class TestPackAlerts:
+    """Test PackAlerts transform."""
+
+    def test_packs_boolean_alert_columns(self) -> None:
+        """Test every boolean *_alert column and is_healthy is packed."""
+        df = pd.DataFrame(
+            {
+                "mesh_id": ["mesh-001", "mesh-002"],
+                "temperature_alert": [True, False],
+                "humidity_alert": [False, False],
+                "status_alert": [False, True],
+                "is_healthy": [False, False],
+                "stuck_alert": [False, True],
+                # Not a boolean, so not an alert to pack
+                "note_alert": ["x", "y"],
+            }
+        )
+
+        result = PackAlerts().transform(df)
+
+        assert list(result.columns) == ["mesh_id", "note_alert", FLAGS_COLUMN]
+        assert result[FLAGS_COLUMN].dtype == np.uint8
+        assert flag_bits(result)[-1] == "stuck_alert"
+        assert alert(result, "stuck_alert").tolist() == [False, True]
+
+    def test_wide_rule_sets_use_uint16(self) -> None:
+        """Test more than eight alerts widen the flags to 16 bits."""
+        df = pd.DataFrame({f"rule{i}_alert": [i % 2 == 0] for i in range(10)})
+
+        result = PackAlerts().transform(df)
+
+        assert result[FLAGS_COLUMN].dtype == np.uint16
+        assert result[FLAGS_COLUMN].tolist() == [0b0101010101]
@@ -1,11 +1,18 @@
 """Tests for generic schema validation transform."""
 
+import json
+from pathlib import Path
+
 import pandas as pd
 import pytest
 from pandera.errors import SchemaError, SchemaErrors
 
-from sensor_pipeline.transforms import ValidateSchema
+from sensor_pipeline.derived import add_timezone_view, materialize
+from sensor_pipeline.pipeline import create_sensor_pipeline
+from sensor_pipeline.quarantine import Quarantine
+from sensor_pipeline.transforms import BoundedSchemaErrors, ValidateSchema
 from sensor_pipeline.models import (
+    PipelineConfig,
     sensor_input_schema,
     processed_reading_schema,
     mesh_summary_schema,
@@ -249,6 +256,37 @@ class TestValidateSchemaWithProcessedReading:
         assert result["mesh_id"].iloc[0] == "mesh-001"
         assert result["is_healthy"].iloc[0] is True
 
+    def test_lazy_derived_column(self) -> None:
+        """Test a declared timestamp_est is checked through its source."""
+        df = pd.DataFrame(
+            [
+                {
+                    "mesh_id": "mesh-001",
+                    "device_id": "device-A",
+                    "timestamp": pd.to_datetime("2025-03-26T13:45:00Z"),
+                    "temperature_c": 22.4,
+                    "temperature_f": 72.32,
+                    "humidity": 41.2,
+                    "status": "ok",
+                    "temperature_alert": False,
+                    "humidity_alert": False,
+                    "status_alert": False,
+                    "is_healthy": True,
+                }
+            ]
+        )
+        add_timezone_view(df, "timestamp_est", "timestamp", "Etc/GMT+5")
+
+        result = ValidateSchema(processed_reading_schema).transform(df)
+
+        assert "timestamp_est" not in result
+        assert "timestamp_est" in materialize(result)
+
+        # Without the declaration the column is still required
+        df.attrs.clear()
+        with pytest.raises(SchemaErrors):
+            ValidateSchema(processed_reading_schema).transform(df)
+
     def test_missing_alert_columns(self) -> None:
         """Test validation fails with missing alert columns."""
         df = pd.DataFrame(
@@ -369,3 +407,186 @@ class TestValidateSchemaGeneric:
         error_str = str(exc_info.value)
         assert "total_readings" in error_str
         assert "temperature_alert" in error_str
+
+
+class TestValidateSchemaQuarantine:
+    """Test quarantine mode moves invalid rows aside."""
+
+    @staticmethod
+    def readings() -> pd.DataFrame:
+        """Sensor input with one bad status and one missing device_id."""
+        return pd.DataFrame(
+            [
+                {
+                    "mesh_id": "mesh-001",
+                    "device_id": "device-A",
+                    "timestamp": "2025-03-26T13:45:00Z",
+                    "temperature_c": 22.4,
+                    "humidity": 41.2,
+                    "status": "ok",
+                },
+                {
+                    "mesh_id": "mesh-001",
+                    "device_id": "device-B",
+                    "timestamp": "2025-03-26T13:46:00Z",
+                    "temperature_c": 23.1,
+                    "humidity": 42.8,
+                    "status": "rebooting",
+                },
+                {
+                    "mesh_id": "mesh-002",
+                    "device_id": None,
+                    "timestamp": "2025-03-26T13:47:00Z",
+                    "temperature_c": 19.0,
+                    "humidity": 40.0,
+                    "status": "ok",
+                },
+            ]
+        )
+
+    def test_bad_rows_quarantined(self, tmp_path: Path) -> None:
+        """Test failing rows go to the dead-letter file with reasons."""
+        quarantine = Quarantine(tmp_path / "dead.jsonl")
+        transform = ValidateSchema(sensor_input_schema, quarantine=quarantine)
+
+        result = transform.transform(self.readings())
+
+        assert result["device_id"].tolist() == ["device-A"]
+        dead = pd.read_json(tmp_path / "dead.jsonl", lines=True)
+        assert dead["device_id"].tolist() == ["device-B", None]
+        assert dead["_errors"].tolist() == [
+            ["status: isin(['ok', 'warning', 'error'])"],
+            ["device_id: not_nullable"],
+        ]
+        assert quarantine.rows == 2
+
+    def test_non_numeric_measurement(self, tmp_path: Path) -> None:
+        """Test a non-numeric measurement is quarantined, not fatal."""
+        df = self.readings().iloc[[0, 0]].reset_index(drop=True)
+        df["temperature_c"] = pd.Series([22.4, "hot"], dtype=object)
+        transform = ValidateSchema(
+            sensor_input_schema, quarantine=Quarantine(tmp_path / "dead.jsonl")
+        )
+
+        result = transform.transform(df)
+
+        assert result["temperature_c"].dtype == "float64"
+        assert len(result) == 1
+
+    def test_frame_level_failure_still_raises(self, tmp_path: Path) -> None:
+        """Test problems dropping rows cannot fix are still raised."""
+        transform = ValidateSchema(
+            sensor_input_schema, quarantine=Quarantine(tmp_path / "dead.jsonl")
+        )
+
+        with pytest.raises(SchemaErrors):
+            transform.transform(self.readings().drop(columns="status"))
+        assert not (tmp_path / "dead.jsonl").exists()
+
+    def test_pipeline_continues_with_good_rows(self, tmp_path: Path) -> None:
+        """Test the pipeline summarizes the valid rows only."""
+        quarantine = Quarantine(tmp_path / "dead.jsonl")
+        pipeline = create_sensor_pipeline(PipelineConfig(), quarantine)
+
+        result = pipeline.run(self.readings())
+
+        assert result["mesh_id"].tolist() == ["mesh-001"]
+        assert result["total_readings"].tolist() == [1]
+        assert quarantine.counts == {
+            "status: isin(['ok', 'warning', 'error'])": 1,
+            "device_id: not_nullable": 1,
+        }
+
+    def test_unparseable_timestamp_quarantined(self, tmp_path: Path) -> None:
+        """Test a timestamp that cannot be parsed is quarantined, not fatal."""
+        quarantine = Quarantine(tmp_path / "dead.jsonl")
+        pipeline = create_sensor_pipeline(PipelineConfig(), quarantine)
+        df = self.readings().iloc[[0, 0]].reset_index(drop=True)
+        df.loc[1, "timestamp"] = "garbage"
+
+        result = pipeline.run(df)
+
+        assert result["total_readings"].tolist() == [1]
+        assert quarantine.counts == {"timestamp: unparseable": 1}
+        record = json.loads(quarantine.path.read_text())
+        assert record["timestamp"] == "garbage"
+
+    def test_requires_supported_schema(self, tmp_path: Path) -> None:
+        """Test quarantine mode needs the fast validator."""
+        with pytest.raises(ValueError, match="Quarantine requires"):
+            ValidateSchema(
+                sensor_input_schema,
+                fast=False,
+                quarantine=Quarantine(tmp_path / "dead.jsonl"),
+            )
+
+
+class TestValidateSchemaBoundedFailures:
+    """Test failure reports limited to a few example rows."""
+
+    @staticmethod
+    def readings(bad_status: int) -> pd.DataFrame:
+        """Sensor input where the first rows have an invalid status."""
+        df = pd.DataFrame(
+            {
+                "mesh_id": "mesh-001",
+                "device_id": [f"device-{i}" for i in range(10)],
+                "timestamp": "2025-03-26T13:45:00Z",
+                "temperature_c": 22.4,
+                "humidity": 41.2,
+                "status": "ok",
+            }
+        )
+        df.loc[: bad_status - 1, "status"] = "rebooting"
+        return df
+
+    def test_counts_exact_cases_limited(self) -> None:
+        """Test exact counts are reported with only N example rows."""
+        df = self.readings(bad_status=8)
+        df.loc[9, "device_id"] = None
+        transform = ValidateSchema(sensor_input_schema, max_failure_cases=2)
+
+        with pytest.raises(BoundedSchemaErrors) as excinfo:
+            transform.transform(df)
+
+        assert excinfo.value.failure_counts == {
+            "device_id: not_nullable": 1,
+            "status: isin(['ok', 'warning', 'error'])": 8,
+        }
+        cases = excinfo.value.failure_cases
+        assert cases.loc[cases["column"] == "status", "index"].tolist() == [0, 1]
+        assert cases.loc[cases["column"] == "device_id", "index"].tolist() == [9]
+        assert any(
+            "status" in note and ": 8" in note for note in excinfo.value.__notes__
+        )
+
+    def test_random_sampling(self) -> None:
+        """Test random sampling still limits the example rows."""
+        transform = ValidateSchema(
+            sensor_input_schema, max_failure_cases=3, failure_sampling="random"
+        )
+
+        with pytest.raises(SchemaErrors) as excinfo:
+            transform.transform(self.readings(bad_status=8))
+
+        indexes = excinfo.value.failure_cases["index"]
+        assert len(indexes) == 3
+        assert set(indexes) <= set(range(8))
+
+    def test_frame_level_failure(self) -> None:
+        """Test a missing column is still reported when limited."""
+        df = self.readings(bad_status=0).drop(columns="humidity")
+        transform = ValidateSchema(sensor_input_schema, max_failure_cases=1)
+
+        with pytest.raises(BoundedSchemaErrors) as excinfo:
+            transform.transform(df)
+
+        assert "humidity" in str(excinfo.value)
+        assert excinfo.value.failure_counts == {}
+
+    def test_valid_data_unaffected(self) -> None:
+        """Test valid data passes unchanged when limited."""
+        df = self.readings(bad_status=0)
+        transform = ValidateSchema(sensor_input_schema, max_failure_cases=1)
+
+        pd.testing.assert_frame_equal(transform.transform(df), df)
@@ -45,13 +45,63 @@ class TestPrefectFlowTasks:
         result = load_to_df.fn("file:data/sensor_data.json")
 
         # Verify the source was created and called
-        mock_file_source.assert_called_once_with("data/sensor_data.json")
+        mock_file_source.assert_called_once_with(
+            "data/sensor_data.json", cache_dir=None
+        )
         mock_source_instance.load.assert_called_once()
 
         # Verify the result
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 1
 
+    @patch("sensor_pipeline_prefect.flow.MultiFileSource")
+    def test_load_to_df_glob(self, mock_multi_file_source: Mock) -> None:
+        """Test that glob patterns load through MultiFileSource."""
+        mock_multi_file_source.return_value.load.return_value = pd.DataFrame()
+
+        load_to_df.fn("file:data/2026-10-*/*.jsonl")
+
+        mock_multi_file_source.assert_called_once_with(
+            "data/2026-10-*/*.jsonl", cache_dir=None
+        )
+
+    @patch("sensor_pipeline_prefect.flow.FileSource")
+    def test_load_to_df_filters(self, mock_file_source: Mock) -> None:
+        """Test mesh and time filters are pushed down to the source."""
+        mock_file_source.return_value.load.return_value = pd.DataFrame()
+
+        load_to_df.fn(
+            "file:data/sensor_data.json",
+            mesh_ids=["mesh-001"],
+            start="2025-03-26T00:00:00Z",
+        )
+
+        mock_file_source.return_value.load.assert_called_once_with(
+            mesh_ids=["mesh-001"], time_range=("2025-03-26T00:00:00Z", None)
+        )
+
+    @patch("sensor_pipeline_prefect.flow.SqliteSource")
+    def test_load_to_df_sqlite(self, mock_sqlite_source: Mock) -> None:
+        """Test sqlite: URLs select the database and table."""
+        mock_sqlite_source.return_value.load.return_value = pd.DataFrame()
+
+        load_to_df.fn("sqlite:data/archive.db?table=gateway_readings")
+
+        mock_sqlite_source.assert_called_once_with(
+            "data/archive.db", table="gateway_readings"
+        )
+
+    @patch("sensor_pipeline_prefect.flow.ApiSource")
+    def test_load_to_df_api(self, mock_api_source: Mock) -> None:
+        """Test api: URLs wrap the http(s) endpoint including its query."""
+        mock_api_source.return_value.load.return_value = pd.DataFrame()
+
+        load_to_df.fn("api:https://gateway.example.com/v1/readings?site=north")
+
+        mock_api_source.assert_called_once_with(
+            "https://gateway.example.com/v1/readings?site=north"
+        )
+
     def test_load_to_df_unsupported_scheme(self) -> None:
         """Test loading data from unsupported source scheme."""
         with pytest.raises(ValueError, match="Unsupported source scheme: https"):
@@ -128,6 +178,21 @@ class TestPrefectFlowTasks:
         # Should return the same DataFrame if valid
         pd.testing.assert_frame_equal(result, input_data)
 
+    @patch("sensor_pipeline_prefect.flow.ValidateSchema")
+    def test_validate_sensor_input_failure_sampling(
+        self, mock_validate_schema: Mock
+    ) -> None:
+        """Test failure sampling options reach the validator."""
+        input_data = pd.DataFrame({"mesh_id": ["mesh-001"]})
+
+        validate_sensor_input.fn(
+            input_data, max_failure_cases=5, failure_sampling="random"
+        )
+
+        kwargs = mock_validate_schema.call_args.kwargs
+        assert kwargs["max_failure_cases"] == 5
+        assert kwargs["failure_sampling"] == "random"
+
     def test_convert_timestamp_task(self) -> None:
         """Test timestamp conversion task."""
         input_data = pd.DataFrame(
@@ -149,6 +214,19 @@ class TestPrefectFlowTasks:
         assert "timestamp_est" in result.columns
         assert len(result) == 1
 
+    def test_convert_timestamp_task_local_time(self) -> None:
+        """Test timestamp conversion task adds configured local time."""
+        from sensor_pipeline.models import PipelineConfig
+
+        input_data = pd.DataFrame(
+            {"mesh_id": ["mesh-001"], "timestamp": ["2025-03-26T13:45:00Z"]}
+        )
+        config = PipelineConfig(timezone="America/New_York")
+
+        result = convert_timestamp.fn(input_data, config)
+
+        assert result["timestamp_local"].iloc[0] == pd.Timestamp("2025-03-26T09:45")
+
     def test_convert_temperature_task(self) -> None:
         """Test temperature conversion task."""
         input_data = pd.DataFrame(